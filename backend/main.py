@@ -3,10 +3,12 @@ Local First Chatbot Backend API
 FastAPI application with multi-modal support, RAG, and local AI processing
 """
 
+import asyncio
 import logging
 import os
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -72,6 +74,12 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Application starting up...")
+    # Size the default executor that blocking provider calls (asyncio.to_thread) run on
+    thread_pool_size = os.getenv("THREAD_POOL_SIZE")
+    if thread_pool_size:
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=int(thread_pool_size))
+        )
     # Optional warm-load of reranker model to reduce first-request latency
     try:
         if os.getenv("WEB_RERANK_WARMLOAD", "false").lower() == "true":
@@ -87,6 +95,25 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         logger.info("Application shutting down...")
+        try:
+            from src.services.web_fetch_lc_loader import close_session
+
+            await close_session()
+        except Exception as e:
+            logger.debug(f"Web loader session close skipped: {e}")
+        try:
+            from src.services.web_search_lc_providers import close_http
+
+            await close_http()
+        except Exception as e:
+            logger.debug(f"Web search client close skipped: {e}")
+        try:
+            from src.services import web_fetch_service
+
+            if web_fetch_service._web_fetch_service_instance is not None:
+                await web_fetch_service._web_fetch_service_instance.aclose()
+        except Exception as e:
+            logger.debug(f"Web fetch client close skipped: {e}")
 
 
 # Initialize FastAPI app with enhanced OpenAPI documentation
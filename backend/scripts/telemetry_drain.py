@@ -0,0 +1,57 @@
+"""
+Drain telemetry rings written by worker processes and append them as JSON lines.
+Usage: python -m backend.scripts.telemetry_drain tcyber_telemetry_1234 [more names] --out logs/telemetry.log
+
+Workers write to the ring when TELEMETRY_SHM_NAME is set (use "{pid}" in the
+name to give each worker its own ring); this process does the JSON encoding
+and disk I/O off the request path.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from multiprocessing import resource_tracker
+from typing import Dict
+
+from backend.src.services.telemetry import SharedRingBuffer, decode_record
+
+
+def _attach(name: str) -> SharedRingBuffer:
+    ring = SharedRingBuffer(name, create=False)
+    # Attaching registers the segment with our resource tracker, which would
+    # unlink it on exit; the writer owns its lifetime.
+    try:
+        resource_tracker.unregister(ring._shm._name, "shared_memory")  # type: ignore[attr-defined]
+    except Exception:
+        pass
+    return ring
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("names", nargs="+", help="Shared memory segment names to drain")
+    ap.add_argument("--out", type=str, default="logs/telemetry.log")
+    ap.add_argument("--interval", type=float, default=0.1)
+    args = ap.parse_args()
+
+    rings = [_attach(n) for n in args.names]
+    # Start at the current head: earlier records may already be partly overwritten
+    tails: Dict[str, int] = {r.name: r.head for r in rings}
+    with open(args.out, "a", encoding="utf-8") as f:
+        try:
+            while True:
+                for ring in rings:
+                    records, tails[ring.name], dropped = ring.read_from(tails[ring.name])
+                    for rec in records:
+                        f.write(json.dumps(decode_record(*rec), ensure_ascii=False, default=str) + "\n")
+                    if dropped:
+                        f.write(json.dumps({"kind": "telemetry_dropped", "ring": ring.name, "bytes": dropped}) + "\n")
+                f.flush()
+                time.sleep(args.interval)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
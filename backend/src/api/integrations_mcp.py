@@ -21,14 +21,14 @@ router = APIRouter(prefix="/integrations/mcp", tags=["integrations-mcp"])
 async def list_servers():
     client = get_multi_mcp_client()
     # Try to enrich with cached capabilities from Redis
-    from ..services.redis_client import get_redis
+    from ..services.redis_client import aget_redis
     import json
     servers = client.list_servers()
-    r = get_redis()
+    r = await aget_redis()
     if r is not None:
         for s in servers:
             try:
-                raw = r.get(f"mcp:server:capabilities:{s.get('id')}")
+                raw = await r.get(f"mcp:server:capabilities:{s.get('id')}")
                 if raw:
                     caps = json.loads(raw)
                     s["cached_capabilities"] = caps
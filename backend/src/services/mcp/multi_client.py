@@ -8,7 +8,7 @@ import json
 import os
 from typing import Any, Dict, List, Optional, Tuple
 
-from ..redis_client import get_redis
+from ..redis_client import aget_redis
 from .types import McpMultiConfig, McpServerConfig, McpServerState, McpTool
 from .clients.ws_client import WsMcpConnection
 from .clients.stdio_client import StdioMcpConnection
@@ -118,7 +118,7 @@ class MultiMcpClient:
                 st.healthy = True
                 st.last_error = None
                 # Cache capabilities in Redis
-                r = get_redis()
+                r = await aget_redis()
                 if r is not None:
                     try:
                         import json
@@ -128,7 +128,7 @@ class MultiMcpClient:
                             "tags": st.config.tags,
                             "tools": [{"name": t.name, "description": t.description} for t in st.tools],
                         }
-                        r.setex(f"mcp:server:capabilities:{st.config.id}", 3600, json.dumps(caps))
+                        await r.setex(f"mcp:server:capabilities:{st.config.id}", 3600, json.dumps(caps))
                     except Exception:
                         pass
             except Exception as e:
@@ -234,11 +234,11 @@ class MultiMcpClient:
                 if not self._cb_allowed(key):
                     continue
                 # Cache check
-                r = get_redis()
+                r = await aget_redis()
                 cache_key = f"mcpdoc:{s.config.id}:{url}"
                 if r is not None:
                     try:
-                        cached = r.get(cache_key)
+                        cached = await r.get(cache_key)
                         if cached:
                             self._cb_ok(key)
                             return {"serverId": s.config.id, "tool": tool_name, "url": url, "content": cached}
@@ -255,7 +255,7 @@ class MultiMcpClient:
                         text = resp.text
                     if r is not None:
                         try:
-                            r.setex(cache_key, int(os.getenv("MCP_DOC_TTL", "86400")), text)
+                            await r.setex(cache_key, int(os.getenv("MCP_DOC_TTL", "86400")), text)
                         except Exception:
                             pass
                     self._cb_ok(key)
@@ -7,6 +7,7 @@ to keep runtime stable for tests.
 
 import importlib
 import warnings
+from collections import deque
 from typing import Any
 
 
@@ -31,9 +32,14 @@ LANGCHAIN_PRESENT = _detect_langchain()
 
 
 class AdapterMemory:
-    def __init__(self, k: int = 5):
+    def __init__(self, k: int = 5, max_tokens: int | None = None):
+        self.max_tokens = max_tokens
+        if max_tokens is not None:
+            # Token-bounded rolling buffer instead of a fixed message window
+            self.memory = None
+            self.chat_memory = TokenWindowMemory(max_tokens=max_tokens)
         # If LangChain present, wrap its ConversationBufferWindowMemory to expose chat_memory
-        if LANGCHAIN_PRESENT:
+        elif LANGCHAIN_PRESENT:
             try:
                 # Import lazily to avoid import-time warnings
                 with warnings.catch_warnings():
@@ -80,6 +86,11 @@ class AdapterMemory:
         except Exception:
             pass
 
+    @property
+    def token_count(self) -> int | None:
+        """Estimated tokens currently buffered (token-bounded memory only)."""
+        return getattr(self.chat_memory, "token_count", None)
+
     def get_context(self) -> list[dict]:
         msgs = getattr(self.chat_memory, "messages", [])
         out = []
@@ -180,8 +191,62 @@ class _ChatMemoryStub:
         self.messages = []
 
 
-def create_memory(k: int = 5) -> AdapterMemory:
-    return AdapterMemory(k=k)
+class TokenWindowMemory:
+    """Rolling chat buffer bounded by an estimated token budget.
+
+    Tokens are estimated as ``len(content) // 4`` (at least 1 per message);
+    the oldest messages are dropped once the budget is exceeded, so many
+    short turns or a few long ones fit in the same window. Exposes the same
+    interface as ``_ChatMemoryStub``.
+    """
+
+    def __init__(self, max_tokens: int = 2000):
+        self.max_tokens = max_tokens
+        self._messages: deque[dict] = deque()
+        self._tokens: deque[int] = deque()
+        self.token_count = 0
+
+    @staticmethod
+    def estimate_tokens(content: str) -> int:
+        return max(1, len(content or "") // 4)
+
+    def add(self, message: dict):
+        tokens = self.estimate_tokens(message.get("content", ""))
+        self._messages.append(message)
+        self._tokens.append(tokens)
+        self.token_count += tokens
+        # Always keep the newest message, even if it alone exceeds the budget
+        while self.token_count > self.max_tokens and len(self._messages) > 1:
+            self._messages.popleft()
+            self.token_count -= self._tokens.popleft()
+
+    @property
+    def messages(self) -> list[dict]:
+        return list(self._messages)
+
+    def add_message(self, message):
+        if isinstance(message, dict):
+            self.add(message)
+            return
+        content = getattr(message, "content", str(message))
+        mtype = getattr(message, "type", None) or type(message).__name__
+        self.add({"type": mtype, "content": content})
+
+    def add_user_message(self, content: str):
+        self.add({"type": "human", "content": content})
+
+    def add_ai_message(self, content: str):
+        self.add({"type": "ai", "content": content})
+
+    def clear(self):
+        self._messages.clear()
+        self._tokens.clear()
+        self.token_count = 0
+
+
+def create_memory(k: int = 5, max_tokens: int | None = None) -> AdapterMemory:
+    """Create chat memory: a ``k``-message window, or token-bounded if ``max_tokens`` is set."""
+    return AdapterMemory(k=k, max_tokens=max_tokens)
 
 
 def create_splitter(
@@ -4,7 +4,10 @@ RAGService for retrieval-augmented generation using comprehensive LangChain feat
 
 import asyncio
 import logging
+import os
+import threading
 from collections.abc import AsyncGenerator
+from functools import cached_property
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -29,6 +32,17 @@ from .rag_adapter import (
 
 LANGCHAIN_AVAILABLE = LANGCHAIN_PRESENT
 
+# Attributes assigned together by each RAGService setup method; built on first access
+_LAZY_GROUPS = {
+    "_setup_advanced_retrievers": ("ensemble_retriever", "compression_retriever"),
+    "_setup_chains": ("rag_chain", "conversational_chain"),
+}
+
+
+def _create_conversation_memory():
+    """Token-bounded conversation memory sized by MEMORY_MAX_TOKENS."""
+    return create_memory(max_tokens=int(os.getenv("MEMORY_MAX_TOKENS", "2000")))
+
 
 # Minimal stub used when LangChain pieces are not present.
 class _Stub:
@@ -193,11 +207,8 @@ class RAGService:
 
     def __init__(self, persist_directory: str = "./chroma_db"):
         self.persist_directory = persist_directory
-        self.vectorstore = None
-        self.embeddings = None
-        self.text_splitter = None
-        self.conversation_memory = None
-        self.callback_handler = None
+        # Heavy components (embeddings, vectorstore, splitters, memory, retrievers,
+        # chains) are built on first attribute access; see the cached properties below.
         # Lazy import of AI service to avoid optional dependency errors at module import
         # Note: get_ai_service() is async, so we'll lazy-load it in async methods
         self._ai_service_getter = None
@@ -224,32 +235,10 @@ class RAGService:
 
             self._ai_service_instance = _AIStub()
 
-        # Advanced retrievers and chains
-        self.ensemble_retriever = None
-        self.conversational_chain = None
-        self.rag_chain = None
-        self.compression_retriever = None
-
-        if LANGCHAIN_AVAILABLE:
-            self._initialize_langchain_components()
-        else:
-            # Use adapter fallbacks when LangChain is not available
-            from .rag_adapter import create_memory, create_splitter
-
-            self.conversation_memory = create_memory(k=5)
-            self.text_splitter = create_splitter(chunk_size=1000, chunk_overlap=200)
-            self.markdown_splitter = (
-                None  # Markdown splitter not available without LangChain
-            )
-            # Ensure we have a usable vectorstore (fallback) even without LangChain
-            try:
-                from .rag_adapter import create_vectorstore
-
-                self.vectorstore = create_vectorstore(
-                    client=None, collection_name="documents", embedding=None
-                )
-            except Exception:
-                self.vectorstore = None
+    def _memory_buffer_size(self) -> int | None:
+        """Current token count for token-bounded memory, else the window size."""
+        tokens = getattr(self.conversation_memory, "token_count", None)
+        return tokens if tokens is not None else self._memory_k
 
     async def _get_ai_service(self, model_name: str | None = None):
         """Lazy-load AI service (async) - always get fresh instance for the specified model"""
@@ -274,43 +263,84 @@ class RAGService:
 
         return _AIStub()
 
-    def _initialize_langchain_components(self):
-        """Initialize comprehensive LangChain components for RAG"""
+    @cached_property
+    def embeddings(self):
+        if not LANGCHAIN_AVAILABLE:
+            return None
         try:
-            # Initialize embeddings, vectorstore, splitter and memory through the adapter
-            # Adapter will try to use LangChain components when available, otherwise
-            # return safe None/stubs so tests and CI remain stable.
-            # Initialize embeddings with preferred package
             if LCEmbeddings is None:
                 raise RuntimeError("Embeddings package not available")
-            self.embeddings = LCEmbeddings(model_name="all-MiniLM-L6-v2")
+            return LCEmbeddings(model_name="all-MiniLM-L6-v2")
+        except Exception as e:
+            logger.warning("Failed to initialize embeddings: %s", e)
+            return None
 
-            # Use shared ChromaDB client via adapter (adapter will lazily resolve chroma client).
-            self.vectorstore = create_vectorstore(
+    @cached_property
+    def vectorstore(self):
+        # Shared ChromaDB client via adapter (adapter lazily resolves the chroma client)
+        try:
+            return create_vectorstore(
                 client=None, collection_name="documents", embedding=self.embeddings
             )
+        except Exception as e:
+            logger.warning("Failed to initialize vectorstore: %s", e)
+            return None
 
-            # Initialize text splitter for document chunking
-            self.text_splitter = create_splitter(chunk_size=1000, chunk_overlap=200)
-
-            # Initialize markdown-aware text splitter for markdown files
-            self.markdown_splitter = self._create_markdown_splitter()
-
-            # Initialize conversation memory
-            self.conversation_memory = create_memory(k=5)
+    @cached_property
+    def text_splitter(self):
+        return create_splitter(chunk_size=1000, chunk_overlap=200)
 
-            # Initialize callback handler for observability
-            self.callback_handler = RAGCallbackHandler()
+    @cached_property
+    def markdown_splitter(self):
+        # Markdown splitter not available without LangChain
+        if not LANGCHAIN_AVAILABLE:
+            return None
+        return self._create_markdown_splitter()
+
+    @cached_property
+    def conversation_memory(self):
+        return _create_conversation_memory()
+
+    @cached_property
+    def callback_handler(self):
+        return RAGCallbackHandler() if LANGCHAIN_AVAILABLE else None
+
+    @cached_property
+    def _memory_k(self):
+        """Memory window size, resolved once for status/config reporting."""
+        k = getattr(self.conversation_memory, "k", None)
+        if k is None:
+            k = getattr(getattr(self.conversation_memory, "memory", None), "k", None)
+        return k
+
+    def _lazy_component(self, name: str, group: str) -> Any:
+        """Run the ``group`` setup method once and return ``name`` from what it assigned."""
+        getattr(self, group)()
+        for attr in _LAZY_GROUPS[group]:
+            self.__dict__.setdefault(attr, None)
+        return self.__dict__[name]
+
+    def _built(self, name: str) -> Any:
+        """Return a lazy component if it has been built, else None (never builds it)."""
+        return self.__dict__.get(name)
+
+    @cached_property
+    def ensemble_retriever(self):
+        return self._lazy_component("ensemble_retriever", "_setup_advanced_retrievers")
+
+    @cached_property
+    def compression_retriever(self):
+        return self._lazy_component(
+            "compression_retriever", "_setup_advanced_retrievers"
+        )
 
-            # Create advanced retrievers and chains if LangChain pieces are available
-            self._setup_advanced_retrievers()
-            self._setup_chains()
+    @cached_property
+    def rag_chain(self):
+        return self._lazy_component("rag_chain", "_setup_chains")
 
-        except Exception as e:
-            print(f"Failed to initialize LangChain components: {e}")
-            self.vectorstore = None
-            self.embeddings = None
-            self.markdown_splitter = None
+    @cached_property
+    def conversational_chain(self):
+        return self._lazy_component("conversational_chain", "_setup_chains")
 
     def _create_markdown_splitter(self):
         """Create a markdown-aware text splitter that respects markdown structure"""
@@ -2659,13 +2689,7 @@ Answer:"""
                 ),
                 "chain_type": "conversational_rag",
                 "conversation_turns": len(formatted_history),
-                "memory_buffer_size": (
-                    getattr(self.conversation_memory, "k", None)
-                    if getattr(self.conversation_memory, "k", None) is not None
-                    else getattr(
-                        getattr(self.conversation_memory, "memory", None), "k", None
-                    )
-                ),
+                "memory_buffer_size": self._memory_buffer_size(),
             }
 
         except Exception as e:
@@ -2977,49 +3001,51 @@ Answer:"""
 
     def get_langchain_config(self) -> dict[str, Any]:
         """Get current LangChain configuration and capabilities"""
+        # Report only components already built; reading a cached_property would build it
+        vectorstore = self._built("vectorstore")
+        text_splitter = self._built("text_splitter")
+        memory = self._built("conversation_memory")
+        callback_handler = self._built("callback_handler")
         return {
             "vectorstore": {
                 "type": "ChromaDB",
-                "collection_name": self.vectorstore._collection.name
-                if self.vectorstore
+                "collection_name": vectorstore._collection.name
+                if vectorstore
                 else None,
                 "embedding_model": "all-MiniLM-L6-v2",
                 "persist_directory": self.persist_directory,
             },
             "text_splitter": {
                 "type": "RecursiveCharacterTextSplitter",
-                "chunk_size": self.text_splitter.chunk_size
-                if self.text_splitter
+                "chunk_size": text_splitter.chunk_size
+                if text_splitter
                 else None,
-                "chunk_overlap": self.text_splitter.chunk_overlap
-                if self.text_splitter
+                "chunk_overlap": text_splitter.chunk_overlap
+                if text_splitter
                 else None,
             },
             "retrievers": {
-                "ensemble_available": self.ensemble_retriever is not None,
-                "compression_available": self.compression_retriever is not None,
-                "conversational_available": self.conversational_chain is not None,
+                "ensemble_available": self._built("ensemble_retriever") is not None,
+                "compression_available": self._built("compression_retriever") is not None,
+                "conversational_available": self._built("conversational_chain") is not None,
             },
             "memory": {
-                "type": "ConversationBufferWindowMemory",
-                "buffer_size": (
-                    getattr(self.conversation_memory, "k", None)
-                    if getattr(self.conversation_memory, "k", None) is not None
-                    else getattr(
-                        getattr(self.conversation_memory, "memory", None), "k", None
-                    )
-                )
-                if self.conversation_memory
+                "type": "TokenWindowMemory"
+                if getattr(memory, "max_tokens", None)
+                else "ConversationBufferWindowMemory",
+                "buffer_size": self._memory_buffer_size()
+                if memory
                 else None,
+                "max_tokens": getattr(memory, "max_tokens", None),
             },
             "chains": {
-                "rag_chain": self.rag_chain is not None,
-                "conversational_chain": self.conversational_chain is not None,
+                "rag_chain": self._built("rag_chain") is not None,
+                "conversational_chain": self._built("conversational_chain") is not None,
             },
             "observability": {
-                "callback_handler": self.callback_handler is not None,
-                "operations_tracked": len(self.callback_handler.operations)
-                if self.callback_handler
+                "callback_handler": callback_handler is not None,
+                "operations_tracked": len(callback_handler.operations)
+                if callback_handler
                 else 0,
             },
         }
@@ -3027,23 +3053,22 @@ Answer:"""
 
 # Global instance for dependency injection
 _rag_service_instance = None
+# Guards first construction so concurrent callers don't build two services
+_rag_service_lock = threading.Lock()
+
+# Fallback streaming: coalesce upstream chunks below this size / age
+_STREAM_FLUSH_CHARS = 64
+_STREAM_FLUSH_SECONDS = 0.02
 
 if not LANGCHAIN_AVAILABLE:
     # Minimal fallback RAGService when LangChain isn't installed. Uses AI service only.
     class RAGService:
         def __init__(self, persist_directory: str = "./chroma_db"):
             self.persist_directory = persist_directory
-            from .rag_adapter import create_memory, create_splitter, create_vectorstore
-
-            self.vectorstore = create_vectorstore(
-                client=None, collection_name="documents"
-            )
             self.embeddings = None
-            self.text_splitter = create_splitter(chunk_size=1000, chunk_overlap=200)
             self.markdown_splitter = (
                 None  # Markdown splitter not available in fallback mode
             )
-            self.conversation_memory = create_memory(k=5)
             self.callback_handler = None
             # Lazy import AI service - note: get_ai_service() is async
             self._ai_service_getter = None
@@ -3069,6 +3094,18 @@ if not LANGCHAIN_AVAILABLE:
 
                 self._ai_service_instance = _AIStub()
 
+        @cached_property
+        def vectorstore(self):
+            return create_vectorstore(client=None, collection_name="documents")
+
+        @cached_property
+        def text_splitter(self):
+            return create_splitter(chunk_size=1000, chunk_overlap=200)
+
+        @cached_property
+        def conversation_memory(self):
+            return _create_conversation_memory()
+
         async def _get_ai_service(self, model_name: str | None = None):
             """Lazy-load AI service (async)"""
             if self._ai_service_instance is not None:
@@ -3103,11 +3140,31 @@ if not LANGCHAIN_AVAILABLE:
             chat_history: list[dict[str, str]] | None = None,
             model_name: str | None = None,
         ) -> AsyncGenerator[dict[str, Any], None]:
-            # Fallback: stream AI service outputs as simple content chunks
+            # Fallback: stream AI service outputs as simple content chunks.
+            # Tiny token-sized chunks are coalesced until they reach a few bytes
+            # or a short deadline passes, to cut per-yield scheduling overhead.
             try:
                 ai_service = await self._get_ai_service(model_name)
+                loop = asyncio.get_running_loop()
+                buf: list[str] = []
+                buf_len = 0
+                last_flush = loop.time()
                 async for chunk in ai_service.generate_streaming_response(prompt=query):
-                    yield {"content": chunk}
+                    if not chunk:
+                        continue
+                    buf.append(chunk)
+                    buf_len += len(chunk)
+                    now = loop.time()
+                    if (
+                        buf_len >= _STREAM_FLUSH_CHARS
+                        or now - last_flush > _STREAM_FLUSH_SECONDS
+                    ):
+                        yield {"content": "".join(buf)}
+                        buf.clear()
+                        buf_len = 0
+                        last_flush = now
+                if buf:
+                    yield {"content": "".join(buf)}
                 # final payload
                 yield {"content": "", "done": True, "citations": []}
             except Exception as e:
@@ -3165,8 +3222,11 @@ if not LANGCHAIN_AVAILABLE:
     def get_rag_service() -> RAGService:
         """Get singleton RAGService instance (fallback)"""
         global _rag_service_instance
-        if _rag_service_instance is None:
-            _rag_service_instance = RAGService()
+        if _rag_service_instance is not None:
+            return _rag_service_instance
+        with _rag_service_lock:
+            if _rag_service_instance is None:
+                _rag_service_instance = RAGService()
         return _rag_service_instance
 
 else:
@@ -3174,6 +3234,9 @@ else:
     def get_rag_service() -> "RAGService":
         """Get singleton RAGService instance"""
         global _rag_service_instance
-        if _rag_service_instance is None:
-            _rag_service_instance = RAGService()
+        if _rag_service_instance is not None:
+            return _rag_service_instance
+        with _rag_service_lock:
+            if _rag_service_instance is None:
+                _rag_service_instance = RAGService()
         return _rag_service_instance
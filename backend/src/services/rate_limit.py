@@ -1,13 +1,33 @@
 """
 Simple in-memory rate limiter with per-key sliding window.
-Not suitable for multi-process without external store.
+Not suitable for multi-process without external store; when Redis is
+configured, RedisRateLimiter shares windows across worker processes.
 """
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
 from collections import deque
-from typing import Deque, Dict
+from typing import Any, Deque, Dict
+
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Sliding-window counter: the previous window's count is weighted by how much
+# of it still overlaps the sliding window. KEYS = (current, previous) window
+# counters; ARGV = (previous weight, limit, ttl). Returns 1 if allowed.
+_SLIDING_WINDOW_LUA = """
+local curr = tonumber(redis.call('GET', KEYS[1]) or '0')
+local prev = tonumber(redis.call('GET', KEYS[2]) or '0')
+if prev * tonumber(ARGV[1]) + curr >= tonumber(ARGV[2]) then
+  return 0
+end
+redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
 
 
 class RateLimiter:
@@ -33,12 +53,50 @@ class RateLimiter:
             return True
 
 
+class RedisRateLimiter:
+    """Sliding-window-counter limiter backed by Redis, shared by all workers.
+
+    Falls back to a per-process RateLimiter while Redis is unreachable.
+    """
+
+    def __init__(self, client: Any) -> None:
+        # redis-py Script objects run via EVALSHA and reload on NOSCRIPT
+        self._script = client.register_script(_SLIDING_WINDOW_LUA)
+        self._fallback = RateLimiter()
+        # True while checks are served by the local fallback; warn only on entry
+        self._degraded = False
+
+    async def allow(self, key: str, limit: int, window_seconds: int) -> bool:
+        now = time.time()
+        window_idx = int(now // window_seconds)
+        prev_weight = 1.0 - (now % window_seconds) / window_seconds
+        try:
+            allowed = await self._script(
+                keys=[f"rl:{key}:{window_idx}", f"rl:{key}:{window_idx - 1}"],
+                args=[prev_weight, limit, window_seconds * 2],
+            )
+        except Exception as e:
+            if not self._degraded:
+                self._degraded = True
+                logger.warning("Redis rate limit check failed, using local limiter: %s", e)
+            else:
+                logger.debug("Redis rate limit check failed: %s", e)
+            return await self._fallback.allow(key, limit, window_seconds)
+        if self._degraded:
+            self._degraded = False
+            logger.info("Redis rate limiting restored")
+        return bool(int(allowed))
+
+
 # Global singleton
-_rate_limiter: RateLimiter | None = None
+_rate_limiter: RateLimiter | RedisRateLimiter | None = None
 
 
-def get_rate_limiter() -> RateLimiter:
+def get_rate_limiter() -> RateLimiter | RedisRateLimiter:
     global _rate_limiter
     if _rate_limiter is None:
-        _rate_limiter = RateLimiter()
+        client = get_redis()
+        _rate_limiter = (
+            RedisRateLimiter(client) if client is not None else RateLimiter()
+        )
     return _rate_limiter
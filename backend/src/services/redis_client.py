@@ -1,27 +1,65 @@
 """
-Optional Redis client helper. Returns a redis client if REDIS_URL is set and redis is installed.
+Optional Redis client helper. Returns an asyncio redis client if REDIS_URL is set and redis is installed.
 """
 from __future__ import annotations
 
 import os
+import threading
 from typing import Any, Optional
 
+# Sentinel memoizing "no Redis" (unset URL, missing package or failed ping)
+_UNAVAILABLE = object()
+
 _redis_client: Any | None = None
+_init_lock = threading.Lock()
+# Set once the first PING succeeds
+_redis_validated = False
 
 
-def get_redis() -> Optional[Any]:
-    global _redis_client
-    if _redis_client is not None:
-        return _redis_client
+def _build_client() -> Any:
     url = os.getenv("REDIS_URL")
     if not url:
-        return None
+        return _UNAVAILABLE
     try:
-        import redis  # type: ignore
+        import redis.asyncio as redis  # type: ignore
+
+        return redis.Redis.from_url(
+            url,
+            decode_responses=True,
+            max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "32")),
+        )
+    except Exception:
+        return _UNAVAILABLE
+
 
-        _redis_client = redis.Redis.from_url(url, decode_responses=True)
-        # quick ping
-        _redis_client.ping()
-        return _redis_client
+def get_redis() -> Optional[Any]:
+    """Return the shared ``redis.asyncio`` client (construction only, no I/O).
+
+    Callers must ``await`` client methods. Prefer ``aget_redis`` when the
+    connection has not been validated yet.
+    """
+    global _redis_client
+    client = _redis_client
+    if client is None:
+        with _init_lock:
+            if _redis_client is None:
+                _redis_client = _build_client()
+            client = _redis_client
+    return None if client is _UNAVAILABLE else client
+
+
+async def aget_redis() -> Optional[Any]:
+    """Return the shared client after a one-time ``PING`` validation."""
+    global _redis_client, _redis_validated
+    client = get_redis()
+    if client is None or _redis_validated:
+        return client
+    try:
+        await client.ping()
+        _redis_validated = True
+        return client
     except Exception:
+        with _init_lock:
+            if _redis_client is client:
+                _redis_client = _UNAVAILABLE
         return None
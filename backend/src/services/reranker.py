@@ -4,21 +4,313 @@ Loads model lazily and provides a simple score API.
 """
 from __future__ import annotations
 
+import hashlib
 import os
+import weakref
+from collections import OrderedDict
 from typing import List, Optional
 
 _RERANKER = None
 
+# LRU of (query, passage) digest -> score; avoids re-scoring repeated pairs
+_SCORE_CACHE: "OrderedDict[bytes, float]" = OrderedDict()
+_SCORE_CACHE_MAX = int(os.getenv("WEB_RERANK_CACHE_SIZE", "8192"))
+
+# LRU of passage digest -> token ids (no special tokens); passages recur across
+# follow-up queries, so only the query needs tokenizing on warm calls
+_TOKEN_CACHE: "OrderedDict[bytes, List[int]]" = OrderedDict()
+_TOKEN_CACHE_MAX = int(os.getenv("WEB_RERANK_TOKEN_CACHE_SIZE", "4096"))
+# tokenizer -> special-token layout for pairs, or None if it can't be derived
+# (see _pair_template); weak keys so a replaced tokenizer is not kept alive
+_PAIR_TEMPLATES: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class _OnnxCrossEncoder:
+    """Minimal CrossEncoder-compatible wrapper around an int8 ONNX Runtime session."""
+
+    def __init__(self, session, tokenizer, max_length: int = 512):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.max_length = max_length
+        self._input_names = {i.name for i in session.get_inputs()}
+
+    def score_features(self, features):
+        import numpy as np  # type: ignore
+
+        feeds = {
+            k: np.asarray(v, dtype=np.int64)
+            for k, v in features.items()
+            if k in self._input_names
+        }
+        logits = self.session.run(None, feeds)[0]
+        if logits.ndim == 2 and logits.shape[1] == 1:
+            # Match CrossEncoder's default sigmoid activation for single-label heads
+            logits = 1.0 / (1.0 + np.exp(-logits[:, 0]))
+        return logits
+
+    def predict(self, pairs, batch_size: int = 32, **kwargs):
+        import numpy as np  # type: ignore
+
+        out = []
+        for i in range(0, len(pairs), batch_size):
+            batch = pairs[i : i + batch_size]
+            enc = self.tokenizer(
+                [q for q, _ in batch],
+                [p for _, p in batch],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np",
+            )
+            out.append(self.score_features(enc))
+        return np.concatenate(out) if out else np.zeros(0)
+
+
+def _load_onnx_int8(model_name: str):
+    """Export the cross-encoder to ONNX once, quantize to int8 and load it with ORT."""
+    try:
+        import onnxruntime as ort  # type: ignore
+        from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore
+        from transformers import AutoTokenizer  # type: ignore
+    except Exception:
+        return None
+    try:
+        cache_root = os.getenv(
+            "WEB_RERANK_ONNX_CACHE", os.path.expanduser("~/.cache/rerank")
+        )
+        cache_dir = os.path.join(cache_root, model_name.replace("/", "__"))
+        quantized = os.path.join(cache_dir, "model_int8.onnx")
+        if not os.path.exists(quantized):
+            from optimum.onnxruntime import (  # type: ignore
+                ORTModelForSequenceClassification,
+            )
+
+            exported = ORTModelForSequenceClassification.from_pretrained(
+                model_name, export=True
+            )
+            exported.save_pretrained(cache_dir)
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(cache_dir)
+            quantize_dynamic(
+                os.path.join(cache_dir, "model.onnx"),
+                quantized,
+                weight_type=QuantType.QInt8,
+            )
+        session = ort.InferenceSession(quantized, providers=["CPUExecutionProvider"])
+        tokenizer = AutoTokenizer.from_pretrained(cache_dir)
+        return _OnnxCrossEncoder(session, tokenizer)
+    except Exception:
+        return None
+
+
+def _cuda_available() -> bool:
+    try:
+        import torch  # type: ignore
+
+        return bool(torch.cuda.is_available())
+    except Exception:
+        return False
+
 
 def _load_model(model_name: str):
+    device = "cuda" if _cuda_available() else None
+    if device is None and os.getenv("WEB_RERANK_ONNX", "false").lower() == "true":
+        onnx_model = _load_onnx_int8(model_name)
+        if onnx_model is not None:
+            return onnx_model
     try:
         from sentence_transformers import CrossEncoder  # type: ignore
     except Exception as e:  # pragma: no cover
         return None
     try:
-        return CrossEncoder(model_name)
+        model = CrossEncoder(model_name, device=device)
+        if device == "cuda":
+            # FP16 roughly doubles GPU throughput with negligible score drift
+            try:
+                model.model.half()
+            except Exception:
+                pass
+        return model
+    except Exception:
+        return None
+
+
+def _max_length(model, tok) -> int:
+    value = getattr(model, "max_seq_length", None) or vars(model).get("max_length")
+    if isinstance(value, int) and value > 0:
+        return value
+    value = getattr(tok, "model_max_length", None)
+    return min(value, 512) if isinstance(value, int) and value > 0 else 512
+
+
+def _passage_ids(tok, passage: str, key: bytes) -> List[int]:
+    ids = _TOKEN_CACHE.get(key)
+    if ids is not None:
+        _TOKEN_CACHE.move_to_end(key)
+        return ids
+    ids = tok(passage, add_special_tokens=False)["input_ids"]
+    _TOKEN_CACHE[key] = ids
+    while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX:
+        _TOKEN_CACHE.popitem(last=False)
+    return ids
+
+
+def _probe_pair_template(tok):
+    a = tok("a", add_special_tokens=False)["input_ids"]
+    b = tok("b", add_special_tokens=False)["input_ids"]
+    probe = tok("a", "b")
+    ids = list(probe["input_ids"])
+    i = next(k for k in range(len(ids)) if ids[k : k + len(a)] == a)
+    j = next(
+        k for k in range(i + len(a), len(ids)) if ids[k : k + len(b)] == b
+    )
+    types = probe.get("token_type_ids")
+    type_ids = None
+    if types is not None:
+        types = list(types)
+        type_ids = (
+            types[:i],
+            types[i],
+            types[i + len(a) : j],
+            types[j],
+            types[j + len(b) :],
+        )
+    return (ids[:i], ids[i + len(a) : j], ids[j + len(b) :], type_ids)
+
+
+def _pair_template(tok):
+    """Special-token layout of a (query, passage) pair, read off a probe encoding.
+
+    Returns (prefix, middle, suffix, type_ids) where type_ids is None for
+    tokenizers without token_type_ids, else (prefix, query, middle, passage,
+    suffix) segment ids. Returns None when the probe pieces can't be located
+    (e.g. the tokenizer merges them with special tokens).
+    """
+    try:
+        return _PAIR_TEMPLATES[tok]
+    except (KeyError, TypeError):
+        pass
+    try:
+        tpl = _probe_pair_template(tok)
     except Exception:
+        tpl = None
+    try:
+        _PAIR_TEMPLATES[tok] = tpl
+    except TypeError:
+        # Tokenizer can't be weakly referenced; probe again next time
+        pass
+    return tpl
+
+
+def _longest_first(n1: int, n2: int, budget: int) -> tuple[int, int]:
+    """Kept lengths under the fast tokenizers' ``longest_first`` pair truncation."""
+    if n1 + n2 <= budget:
+        return n1, n2
+    swap = n1 > n2
+    if swap:
+        n1, n2 = n2, n1
+    n2 = n1 if n1 > budget else max(n1, budget - n1)
+    if n1 + n2 > budget:
+        n1 = budget // 2
+        n2 = n1 + budget % 2
+    return (n2, n1) if swap else (n1, n2)
+
+
+def _pair_budget(template, max_length: int) -> int:
+    """Tokens left for query and passage once the template's special tokens are placed."""
+    prefix, middle, suffix, _ = template
+    return max_length - len(prefix) - len(middle) - len(suffix)
+
+
+def _encode_pairs(
+    tok, template, q_ids: List[int], passage_ids: List[List[int]], budget: int
+):
+    """Assemble padded input_ids/attention_mask/token_type_ids arrays for the pairs."""
+    import numpy as np  # type: ignore
+
+    prefix, middle, suffix, type_ids = template
+    rows = []
+    for p_ids in passage_ids:
+        lq, lp = _longest_first(len(q_ids), len(p_ids), budget)
+        rows.append((lq, lp, prefix + q_ids[:lq] + middle + p_ids[:lp] + suffix))
+    width = max(len(r) for _, _, r in rows)
+    pad_id = tok.pad_token_id or 0
+    input_ids = np.full((len(rows), width), pad_id, dtype=np.int64)
+    attention_mask = np.zeros((len(rows), width), dtype=np.int64)
+    features = {"input_ids": input_ids, "attention_mask": attention_mask}
+    if type_ids is not None:
+        token_type_ids = np.zeros((len(rows), width), dtype=np.int64)
+        features["token_type_ids"] = token_type_ids
+    left = getattr(tok, "padding_side", "right") == "left"
+    for n, (lq, lp, row) in enumerate(rows):
+        span = slice(width - len(row), width) if left else slice(0, len(row))
+        input_ids[n, span] = row
+        attention_mask[n, span] = 1
+        if type_ids is not None:
+            t_pre, t_q, t_mid, t_p, t_suf = type_ids
+            token_type_ids[n, span] = (
+                t_pre + [t_q] * lq + t_mid + [t_p] * lp + t_suf
+            )
+    return features
+
+
+def _torch_scores(model, features) -> List[float]:
+    """Forward pass of a sentence-transformers CrossEncoder's underlying HF model."""
+    import torch  # type: ignore
+
+    hf_model = model.model
+    features = {k: torch.from_numpy(v).to(hf_model.device) for k, v in features.items()}
+    with torch.inference_mode():
+        logits = hf_model(**features).logits
+        activation = getattr(model, "activation_fn", None) or getattr(
+            model, "activation_fct", None
+        )
+        if activation is not None:
+            logits = activation(logits)
+        elif logits.shape[-1] == 1:
+            logits = torch.sigmoid(logits)
+        scores = logits[:, 0] if logits.ndim == 2 else logits
+    return scores.float().cpu().tolist()
+
+
+def _predict_pretokenized(
+    model, query: str, passages: List[str], passage_keys: List[bytes], batch_size: int
+) -> Optional[List[float]]:
+    """Score pairs reusing cached passage token ids; None if the model doesn't expose a tokenizer."""
+    tok = getattr(model, "tokenizer", None)
+    if tok is None:
         return None
+    max_length = _max_length(model, tok)
+    template = _pair_template(tok)
+    budget = _pair_budget(template, max_length) if template is not None else 0
+    if budget > 0:
+        q_ids = tok(query, add_special_tokens=False)["input_ids"]
+        p_ids = [_passage_ids(tok, p, key) for p, key in zip(passages, passage_keys)]
+    out: List[float] = []
+    for i in range(0, len(passages), batch_size):
+        if budget > 0:
+            features = _encode_pairs(tok, template, q_ids, p_ids[i : i + batch_size], budget)
+        else:
+            # No usable pair layout: let the tokenizer build and truncate the pairs
+            batch = passages[i : i + batch_size]
+            features = dict(
+                tok(
+                    [query] * len(batch),
+                    batch,
+                    truncation="longest_first",
+                    padding=True,
+                    max_length=max_length,
+                    return_tensors="np",
+                )
+            )
+        if hasattr(model, "score_features"):
+            out.extend(float(x) for x in model.score_features(features))
+        else:
+            out.extend(_torch_scores(model, features))
+    return out
 
 
 def get_reranker() -> Optional[object]:
@@ -38,9 +330,44 @@ def score_pairs(query: str, passages: List[str]) -> Optional[List[float]]:
     if model is None:
         return None
     try:
-        pairs = [(query, p) for p in passages]
-        # type: ignore[attr-defined]
-        scores = model.predict(pairs)  # returns list[float]
-        return list(map(float, scores))
+        q_digest = _digest(query)
+        p_digests = [_digest(p) for p in passages]
+        keys = [q_digest + d for d in p_digests]
+        scores: List[Optional[float]] = []
+        misses: List[int] = []
+        for i, key in enumerate(keys):
+            cached = _SCORE_CACHE.get(key)
+            if cached is not None:
+                _SCORE_CACHE.move_to_end(key)
+            else:
+                misses.append(i)
+            scores.append(cached)
+        if misses:
+            batch_size = int(os.getenv("WEB_RERANK_BATCH_SIZE", "64"))
+            try:
+                fresh = _predict_pretokenized(
+                    model,
+                    query,
+                    [passages[i] for i in misses],
+                    [p_digests[i] for i in misses],
+                    batch_size,
+                )
+            except Exception:
+                fresh = None
+            if fresh is None:
+                pairs = [(query, passages[i]) for i in misses]
+                # type: ignore[attr-defined]
+                fresh = model.predict(
+                    pairs,
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                )
+            for i, score in zip(misses, fresh):
+                scores[i] = float(score)
+                _SCORE_CACHE[keys[i]] = float(score)
+            while len(_SCORE_CACHE) > _SCORE_CACHE_MAX:
+                _SCORE_CACHE.popitem(last=False)
+        return [float(s) for s in scores]
     except Exception:
-        return None
\ No newline at end of file
+        return None
@@ -1,21 +1,195 @@
 """
 Lightweight telemetry/tracing helpers.
 Writes JSON lines to logs/telemetry.log and returns a trace_id per request.
+
+When TELEMETRY_SHM_NAME is set, events are instead copied as packed binary
+records into a shared-memory ring buffer; ``scripts/telemetry_drain.py``
+drains the ring out-of-process and writes the JSON lines. A ring record's
+payload is capped at 64 KiB (its length field is a u16); a larger event is
+replaced by a ``{"truncated": true}`` marker and counted by
+``truncated_records()``.
 """
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import struct
+import threading
 import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+# Prefer orjson when installed: faster and emits UTF-8 bytes directly
+try:
+    import orjson  # type: ignore
+
+    def _dumps(rec: Dict[str, Any]) -> bytes:
+        return orjson.dumps(rec, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+except Exception:  # pragma: no cover
+
+    def _dumps(rec: Dict[str, Any]) -> bytes:
+        return json.dumps(rec, ensure_ascii=False, default=str).encode("utf-8")
+
 # Ensure logs dir exists
 os.makedirs("logs", exist_ok=True)
 _TELEMETRY_PATH = os.path.join("logs", "telemetry.log")
 
 
+# Ring layout: control block (head:u64, capacity:u64) followed by the data area.
+# head counts bytes ever written; a record never straddles the end of the data
+# area, the writer wraps early and a zero ts_ns marks the skipped tail.
+_CONTROL = struct.Struct("<QQ")
+# ts_ns, kind_id, trace_id (raw uuid bytes), payload_len
+_RECORD = struct.Struct("<QH16sH")
+_MAX_PAYLOAD = 0xFFFF
+
+# Events in this process whose payload exceeded _MAX_PAYLOAD
+_truncated_records = 0
+
+# Stable ids for known event kinds; anything else is id 0 with "kind" in the payload
+_KINDS = ("", "deep_research_start", "deep_research_end", "deep_research_error")
+_KIND_IDS = {k: i for i, k in enumerate(_KINDS) if k}
+
+
+class SharedRingBuffer:
+    """Single-writer ring of telemetry records in ``multiprocessing.shared_memory``."""
+
+    def __init__(self, name: str, size: int = 1 << 20, create: bool = True):
+        from multiprocessing import shared_memory
+
+        if create:
+            self._shm = shared_memory.SharedMemory(
+                name=name, create=True, size=_CONTROL.size + size
+            )
+            _CONTROL.pack_into(self._shm.buf, 0, 0, size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._owner = create
+        self.name = name
+        self.buf = self._shm.buf
+        self.capacity = _CONTROL.unpack_from(self.buf, 0)[1]
+        self._lock = threading.Lock()
+
+    @property
+    def head(self) -> int:
+        return _CONTROL.unpack_from(self.buf, 0)[0]
+
+    def write(self, ts_ns: int, kind_id: int, trace: bytes, payload: bytes) -> None:
+        size = _RECORD.size + len(payload)
+        with self._lock:
+            head = self.head
+            pos = head % self.capacity
+            if pos + size > self.capacity:
+                if pos + _RECORD.size <= self.capacity:
+                    _RECORD.pack_into(self.buf, _CONTROL.size + pos, 0, 0, b"", 0)
+                head += self.capacity - pos
+                pos = 0
+            off = _CONTROL.size + pos
+            _RECORD.pack_into(self.buf, off, ts_ns, kind_id, trace, len(payload))
+            self.buf[off + _RECORD.size : off + size] = payload
+            # Publish only after the record is fully written
+            struct.pack_into("<Q", self.buf, 0, head + size)
+
+    def read_from(self, tail: int) -> tuple[list[tuple[int, int, bytes, bytes]], int, int]:
+        """Return (records, new_tail, dropped_bytes) for everything written since ``tail``."""
+        head = self.head
+        if head - tail > self.capacity:
+            # Reader was lapped; records can't be re-synchronised mid-ring, so
+            # skip everything pending and resume at the head
+            return [], head, head - tail
+        start = tail
+        records = []
+        while tail < head:
+            pos = tail % self.capacity
+            if pos + _RECORD.size > self.capacity:
+                tail += self.capacity - pos
+                continue
+            off = _CONTROL.size + pos
+            ts_ns, kind_id, trace, plen = _RECORD.unpack_from(self.buf, off)
+            if ts_ns == 0:
+                tail += self.capacity - pos
+                continue
+            payload = bytes(self.buf[off + _RECORD.size : off + _RECORD.size + plen])
+            records.append((ts_ns, kind_id, trace, payload))
+            tail += _RECORD.size + plen
+        latest = self.head
+        if latest - self.capacity > start:
+            # The writer lapped us mid-copy, so what we read may be torn
+            return [], latest, latest - start
+        return records, tail, 0
+
+    def close(self) -> None:
+        self.buf = None
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except Exception:
+                pass
+
+
+def decode_record(ts_ns: int, kind_id: int, trace: bytes, payload: bytes) -> Dict[str, Any]:
+    """Turn a ring record back into the dict ``log_event`` would have written."""
+    try:
+        data = json.loads(payload) if payload else {}
+    except Exception:
+        data = {"payload": payload.decode("utf-8", "replace")}
+    kind = data.pop("kind", None) or (_KINDS[kind_id] if kind_id < len(_KINDS) else "")
+    trace_id = data.pop("trace_id", None) or trace.hex()
+    ts = datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isoformat()
+    ts = ts.replace("+00:00", "Z")
+    return {"ts": ts, "trace_id": trace_id, "kind": kind, **data}
+
+
+_RING: Optional[SharedRingBuffer] = None
+_shm_name = os.getenv("TELEMETRY_SHM_NAME", "").strip()
+if _shm_name:
+    try:
+        # "{pid}" gives each worker process its own single-writer ring
+        _RING = SharedRingBuffer(
+            _shm_name.format(pid=os.getpid()),
+            size=int(os.getenv("TELEMETRY_SHM_SIZE", str(1 << 20))),
+        )
+        atexit.register(_RING.close)
+    except Exception:
+        _RING = None
+
+
+def truncated_records() -> int:
+    """Number of events this process logged to the ring with a truncated payload."""
+    return _truncated_records
+
+
+def _log_to_ring(ring: SharedRingBuffer, kind: str, trace_id: str, data: Optional[Dict[str, Any]]) -> None:
+    global _truncated_records
+    extra = dict(data or {})
+    kind_id = _KIND_IDS.get(kind, 0)
+    if not kind_id:
+        extra["kind"] = kind
+    try:
+        trace = bytes.fromhex(trace_id)
+        if len(trace) != 16:
+            raise ValueError
+    except (TypeError, ValueError):
+        trace = b""
+        extra["trace_id"] = trace_id
+    payload = _dumps(extra) if extra else b""
+    if len(payload) > _MAX_PAYLOAD:
+        _truncated_records += 1
+        payload = _dumps(
+            {
+                "kind": kind,
+                "trace_id": trace_id,
+                "truncated": True,
+                "payload_bytes": len(payload),
+            }
+        )
+    ring.write(time.time_ns(), kind_id, trace, payload)
+
+
 def new_trace_id() -> str:
     return uuid.uuid4().hex
 
@@ -25,6 +199,12 @@ def now_iso() -> str:
 
 
 def log_event(kind: str, trace_id: str, data: Optional[Dict[str, Any]] = None) -> None:
+    if _RING is not None:
+        try:
+            _log_to_ring(_RING, kind, trace_id, data)
+        except Exception:
+            pass
+        return
     rec = {
         "ts": now_iso(),
         "trace_id": trace_id,
@@ -32,8 +212,8 @@ def log_event(kind: str, trace_id: str, data: Optional[Dict[str, Any]] = None) -
         **(data or {}),
     }
     try:
-        with open(_TELEMETRY_PATH, "a", encoding="utf-8") as f:
-            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        with open(_TELEMETRY_PATH, "ab") as f:
+            f.write(_dumps(rec) + b"\n")
     except Exception:
         # Best-effort logging
         pass
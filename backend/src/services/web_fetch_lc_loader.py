@@ -5,10 +5,94 @@ LangChain-based URL loader used as an optional backend for WebFetchService
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 
+# Native async fetch + fast C-backed HTML parsing when available;
+# WebBaseLoader (requests + BeautifulSoup in a thread) is the fallback.
+try:
+    import aiohttp  # type: ignore
+except Exception:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # type: ignore
+except Exception:  # pragma: no cover
+    try:
+        from selectolax.parser import HTMLParser  # type: ignore
+    except Exception:
+        HTMLParser = None  # type: ignore
+
+_FETCH_TIMEOUT_SEC = 15
+
+# Pages at least this large are parsed in a worker process; smaller ones are
+# cheaper to parse inline than to pickle across a process boundary.
+_PROCESS_PARSE_MIN_CHARS = 100_000
+
+# Process-wide session so connections (and TLS sessions) are pooled across fetches
+_session = None
+_session_loop = None
+
+
+async def _get_session():
+    """Return the shared aiohttp session, creating it for the running loop if needed."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is not None and not _session.closed and _session_loop is not loop:
+        # A session is bound to the loop it was created on; release the stale one
+        stale, _session = _session, None
+        try:
+            await stale.close()
+        except Exception:
+            pass
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=_FETCH_TIMEOUT_SEC),
+        )
+        _session_loop = loop
+    return _session
+
+
+async def _parse_html_offloaded(
+    html: str, offload: Callable[..., Awaitable] | None
+) -> tuple[str | None, str | None]:
+    """Parse large pages via ``offload`` so CPU work runs outside the GIL."""
+    if offload is None or len(html) < _PROCESS_PARSE_MIN_CHARS:
+        return _parse_html(html)
+    try:
+        return await offload(_parse_html, html)
+    except Exception:
+        # Unavailable pool: parse inline rather than failing the fetch
+        return _parse_html(html)
+
+
+async def close_session() -> None:
+    """Close the shared aiohttp session (call on application shutdown)."""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+def _parse_html(html: str) -> tuple[str | None, str | None]:
+    """Return (content, title) extracted from an HTML document."""
+    tree = HTMLParser(html)
+    tree.strip_tags(["script", "style", "noscript"])
+    title_node = tree.css_first("title")
+    title = title_node.text(strip=True) if title_node is not None else None
+    body = tree.body
+    content = body.text(separator="\n", strip=True) if body is not None else None
+    return content or None, title or None
+
 
 class LangChainWebLoader:
+    def __init__(self, offload: Callable[..., Awaitable] | None = None):
+        # offload(fn, *args) runs fn in a worker pool; WebFetchService passes its
+        # extraction pool's runner so both backends share one set of processes
+        self._offload = offload
+
     def is_available(self) -> bool:  # pragma: no cover
         try:
             return True
@@ -17,6 +101,26 @@ class LangChainWebLoader:
 
     async def fetch(
         self, url: str
+    ) -> tuple[str | None, str | None, datetime | None, str | None]:
+        """Fetch URL and return (content, title, published_at, content_type)."""
+        if aiohttp is None or HTMLParser is None:
+            return await self._fetch_with_web_base_loader(url)
+
+        session = await _get_session()
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            content_type = resp.headers.get("content-type", "text/html").lower()
+            if "html" not in content_type:
+                # Let the caller fall back to its PDF-capable fetch path
+                raise ValueError(f"Unsupported content type: {content_type}")
+            html = await resp.text()
+
+        content, title = await _parse_html_offloaded(html, self._offload)
+        # published_at is not extracted here; leave None
+        return content, title, None, content_type
+
+    async def _fetch_with_web_base_loader(
+        self, url: str
     ) -> tuple[str | None, str | None, datetime | None, str | None]:
         """Fetch URL using LangChain WebBaseLoader and return (content, title, published_at, content_type)."""
         from langchain_community.document_loaders import WebBaseLoader  # type: ignore
@@ -4,12 +4,20 @@ Supports HTML and PDF extraction with fallback strategies
 """
 
 import asyncio
+import io
 import logging
+import multiprocessing
 import os
+import re
 import time
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict, deque
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from typing import Any
 from urllib.parse import urlparse
 
 # Optional httpx at module scope for consistent patching in tests
@@ -20,6 +28,103 @@ except Exception:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+# Advertise brotli only when a decoder is installed; httpx decompresses transparently
+try:
+    import brotli  # type: ignore  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    try:
+        import brotlicffi  # type: ignore  # noqa: F401
+
+        _ACCEPT_ENCODING = "gzip, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+_ACCEPT = "text/html,application/xhtml+xml,application/pdf,application/xml;q=0.9,*/*;q=0.8"
+
+# Fetch results kept in the LRU cache
+_CACHE_MAX_ENTRIES = 200
+
+# Payloads at least this large are extracted in a worker process; smaller ones
+# are cheaper to parse inline than to pickle across a process boundary
+_PROCESS_EXTRACT_MIN_BYTES = 50_000
+
+# Start method for extraction workers. Forking this process (it already runs
+# executor, tokenizer and connection-pool threads) can hand a child a lock that
+# another thread held at fork time, so workers are started fresh instead.
+_EXTRACT_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Receive buffers that grew past this are dropped instead of pooled, so one
+# large page does not pin max_bytes of memory per pool slot for the process life
+_POOLED_BUFFER_MAX_BYTES = 256 * 1024
+
+# Query-param prefixes stripped from canonical URLs (str.startswith accepts a tuple)
+_TRACKING_PREFIXES = ("utm_", "fbclid", "gclid", "ref")
+
+# <meta> property/name keys holding an article's publish date, in priority order
+_DATE_META_NAMES = ("article:published_time", "datePublished", "publishdate")
+
+# A word for token estimates: any run of non-whitespace (spaces, tabs, newlines split)
+_WORD_RE = re.compile(r"\S+")
+
+# Leading markup that identifies an HTML body (lowercased, after BOM/whitespace)
+_HTML_SIGNATURES = (b"<!doctype html", b"<html", b"<head", b"<body", b"<!--")
+
+
+# URL parsing is pure, and the same sources are re-enriched across searches, so
+# results are memoized at module level (lru_cache on a method would pin self)
+@lru_cache(maxsize=1024)
+def _parse_url(url: str) -> tuple[str, str]:
+    """Return (canonical_url, domain); the canonical form drops the fragment and tracking params"""
+    parsed = urlparse(url)
+    normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+    if parsed.query:
+        query_parts = [
+            part
+            for part in parsed.query.split("&")
+            if not part.startswith(_TRACKING_PREFIXES)
+        ]
+        if query_parts:
+            normalized += "?" + "&".join(query_parts)
+    return normalized, parsed.netloc
+
+
+@lru_cache(maxsize=1024)
+def _url_domain(url: str) -> str:
+    """Return the netloc of a URL"""
+    return urlparse(url).netloc
+
+
+def _sniff_content_kind(body: bytes | bytearray, content_type: str) -> str | None:
+    """Classify a body as "pdf" or "html" from its leading bytes
+
+    Servers often send application/octet-stream or mislabel PDFs, so the magic
+    bytes win; the Content-Type header is only consulted when they are inconclusive.
+    """
+    if body[:5] == b"%PDF-":
+        return "pdf"
+    head = bytes(body[:64]).lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if head.startswith(_HTML_SIGNATURES):
+        return "html"
+    if "html" in content_type:
+        return "html"
+    if "pdf" in content_type:
+        return "pdf"
+    return None
+
+
+def _decode_body(buf: bytearray, size: int, encoding: str | None) -> str:
+    """Decode the first ``size`` bytes of a receive buffer without copying them"""
+    with memoryview(buf) as view, view[:size] as body:
+        try:
+            return str(body, encoding or "utf-8", "replace")
+        except LookupError:
+            # Unknown charset label in the Content-Type header
+            return str(body, "utf-8", "replace")
+
 
 @dataclass
 class FetchResult:
@@ -68,10 +173,10 @@ def sanitize_web_content(text: str) -> tuple[str, bool]:
     return "\n".join(clean_lines), True
 
 
-def compute_trust_score(url: str, content: str | None, allowlist: set[str] | None, blocklist: set[str]) -> float:
+def compute_trust_score(url: str, content: str | None, allowlist: frozenset[str] | None, blocklist: frozenset[str]) -> float:
     """Compute a simple trust score in [0,1] based on domain lists and heuristics."""
     try:
-        domain = urlparse(url).netloc
+        domain = _url_domain(url)
     except Exception:
         domain = ""
     score = 0.5
@@ -85,6 +190,215 @@ def compute_trust_score(url: str, content: str | None, allowlist: set[str] | Non
     return max(0.0, min(1.0, score))
 
 
+# Optional extraction library entry points, imported once per process
+_EXTRACTORS: dict[str, Any] | None = None
+
+
+def _load_extractors() -> dict[str, Any]:
+    """Import optional extraction libraries once; missing ones map to None"""
+    global _EXTRACTORS
+    if _EXTRACTORS is not None:
+        return _EXTRACTORS
+    ext: dict[str, Any] = dict.fromkeys(
+        (
+            "trafilatura",
+            "Document",
+            "BeautifulSoup",
+            "SoupStrainer",
+            "lxml",
+            "pymupdf",
+            "pypdf",
+        )
+    )
+    try:
+        import trafilatura
+
+        ext["trafilatura"] = trafilatura
+    except ImportError:
+        pass
+
+    try:
+        from readability import Document
+
+        ext["Document"] = Document
+    except ImportError:
+        pass
+
+    try:
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        ext["BeautifulSoup"] = BeautifulSoup
+        ext["SoupStrainer"] = SoupStrainer
+    except ImportError:
+        pass
+
+    try:
+        import lxml
+
+        ext["lxml"] = lxml
+    except ImportError:
+        pass
+
+    try:
+        import pymupdf
+
+        ext["pymupdf"] = pymupdf
+    except ImportError:
+        pass
+
+    try:
+        import pypdf
+
+        ext["pypdf"] = pypdf
+    except ImportError:
+        pass
+
+    _EXTRACTORS = ext
+    return ext
+
+
+def _extract_html_worker(
+    html: str, url: str, libs: dict[str, bool]
+) -> tuple[str | None, str | None, datetime | None]:
+    """
+    Extract readable content from HTML using available libraries
+    Returns: (content, title, published_at)
+
+    Module-level so it can run in the extraction process pool.
+    """
+    ext = _load_extractors()
+    content = None
+    title = None
+    published_at = None
+    # lxml's C parser is several times faster than the pure-Python html.parser
+    parser = "lxml" if libs.get("lxml") else "html.parser"
+
+    # Try trafilatura first (best for article extraction)
+    if libs.get("trafilatura"):
+        try:
+            # Text and metadata from one parse (extract + extract_metadata parsed twice)
+            data = ext["trafilatura"].bare_extraction(
+                html,
+                include_comments=False,
+                include_tables=False,
+                with_metadata=True,
+            )
+            # trafilatura < 2 returns a dict, 2.x a Document with the same fields
+            if data is not None and not isinstance(data, dict):
+                data = data.as_dict()
+            content = data.get("text") if data else None
+            if content:
+                title = data.get("title")
+                date_str = data.get("date")
+                if date_str:
+                    try:
+                        published_at = datetime.fromisoformat(date_str)
+                    except Exception:
+                        pass
+
+                logger.debug(f"Extracted content with trafilatura from {url[:60]}")
+                return content, title, published_at
+        except Exception as e:
+            logger.debug(f"Trafilatura extraction failed: {e}")
+
+    # Fallback to readability-lxml
+    if libs.get("readability") and libs.get("beautifulsoup"):
+        try:
+            BeautifulSoup = ext["BeautifulSoup"]
+            doc = ext["Document"](html)
+            title = doc.title()
+            content_html = doc.summary()
+
+            # Extract text from the (much smaller) readability summary
+            soup = BeautifulSoup(content_html, parser)
+            content = soup.get_text(separator="\n", strip=True)
+
+            # Published date from meta tags: build a tree of <meta> tags only
+            # instead of re-parsing the full document into a soup
+            metas = BeautifulSoup(html, parser, parse_only=ext["SoupStrainer"]("meta"))
+            meta_content: dict[str, str] = {}
+            for meta in metas.find_all("meta"):
+                key = meta.get("property") or meta.get("name")
+                if key and meta.get("content"):
+                    meta_content.setdefault(key, meta["content"])
+            for meta_name in _DATE_META_NAMES:
+                if meta_name in meta_content:
+                    try:
+                        published_at = datetime.fromisoformat(
+                            meta_content[meta_name].replace("Z", "+00:00")
+                        )
+                        break
+                    except Exception:
+                        pass
+
+            logger.debug(f"Extracted content with readability from {url[:60]}")
+            return content, title, published_at
+        except Exception as e:
+            logger.debug(f"Readability extraction failed: {e}")
+
+    # Final fallback to BeautifulSoup text extraction
+    if libs.get("beautifulsoup"):
+        try:
+            soup = ext["BeautifulSoup"](html, parser)
+
+            # Remove script and style elements
+            for script in soup(["script", "style", "nav", "footer", "header"]):
+                script.decompose()
+
+            # Get title
+            title_tag = soup.find("title")
+            title = title_tag.get_text() if title_tag else None
+
+            # Get text
+            content = soup.get_text(separator="\n", strip=True)
+
+            logger.debug(f"Extracted content with BeautifulSoup from {url[:60]}")
+            return content, title, published_at
+        except Exception as e:
+            logger.debug(f"BeautifulSoup extraction failed: {e}")
+
+    return None, None, None
+
+
+def _extract_pdf_worker(
+    pdf_bytes: bytes | bytearray, url: str, libs: dict[str, bool]
+) -> tuple[str | None, str | None]:
+    """
+    Extract text from PDF using available libraries
+    Returns: (content, title)
+
+    Module-level so it can run in the extraction process pool.
+    """
+    ext = _load_extractors()
+    # Try PyMuPDF first (best quality)
+    if libs.get("pymupdf"):
+        try:
+            doc = ext["pymupdf"].open(stream=pdf_bytes, filetype="pdf")
+            title = doc.metadata.get("title")
+            content = "\n".join(page.get_text() for page in doc)
+            doc.close()
+
+            logger.debug(f"Extracted PDF content with PyMuPDF from {url[:60]}")
+            return content, title
+        except Exception as e:
+            logger.debug(f"PyMuPDF extraction failed: {e}")
+
+    # Fallback to pypdf
+    if libs.get("pypdf"):
+        try:
+            reader = ext["pypdf"].PdfReader(io.BytesIO(pdf_bytes))
+            title = reader.metadata.title if reader.metadata else None
+            # extract_text() can return None for pages without a text layer
+            content = "\n".join(page.extract_text() or "" for page in reader.pages)
+
+            logger.debug(f"Extracted PDF content with pypdf from {url[:60]}")
+            return content, title
+        except Exception as e:
+            logger.debug(f"pypdf extraction failed: {e}")
+
+    return None, None
+
+
 class WebFetchService:
     """Service for fetching and extracting content from web URLs"""
 
@@ -101,6 +415,7 @@ class WebFetchService:
         allowlist_domains: list[str] | None = None,
         max_fetch: int = 3,
         prefer_impl: str = "custom",  # "custom" (httpx) or "langchain"
+        head_preflight: bool = False,
     ):
         """
         Initialize web fetch service
@@ -116,6 +431,7 @@ class WebFetchService:
             blocklist_domains: Domains to skip (optional)
             allowlist_domains: Only fetch from these domains if set (optional)
             max_fetch: Maximum number of URLs to fetch per enrichment call
+            head_preflight: Send a HEAD first and skip bodies announced above max_bytes
         """
         self.enabled = enabled
         self.concurrency = concurrency
@@ -124,31 +440,46 @@ class WebFetchService:
         self.max_bytes = max_bytes
         self.pdf_enabled = pdf_enabled
         self.user_agent = user_agent
-        self.blocklist_domains = set(blocklist_domains or [])
+        # Domain lists never change after construction
+        self.blocklist_domains = frozenset(blocklist_domains or [])
         self.allowlist_domains = (
-            set(allowlist_domains or []) if allowlist_domains else None
+            frozenset(allowlist_domains) if allowlist_domains else None
         )
         self.max_fetch = max_fetch
         self.prefer_impl = prefer_impl
+        self.head_preflight = head_preflight
 
-        # Cache: canonical_url -> (FetchResult, timestamp)
-        self._cache: dict[str, tuple[FetchResult, datetime]] = {}
+        # LRU cache: canonical_url -> (FetchResult, time.monotonic() stamp,
+        # conditional request headers built from ETag/Last-Modified), most recent last
+        self._cache: OrderedDict[str, tuple[FetchResult, float, dict[str, str]]] = OrderedDict()
+        self._cache_ttl_float = float(cache_ttl)
 
-        # Rate limiting: domain -> list of request timestamps
-        self._rate_limit_tracker: dict[str, list[float]] = defaultdict(list)
+        # Rate limiting: domain -> monotonic timestamps of requests in the last minute
         self._domain_rate_limit = 5  # Max requests per minute per domain
+        self._rate_limit_tracker: dict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=self._domain_rate_limit)
+        )
 
         # Semaphore for concurrency control
         self._semaphore = asyncio.Semaphore(concurrency)
 
-        # Stats
-        self._stats = {
-            "fetched_count": 0,
-            "cache_hits": 0,
-            "failures": 0,
-            "total_fetch_time": 0.0,
-            "failures_by_reason": defaultdict(int),
-        }
+        # Shared HTTP client (pooled keep-alive connections), built on first fetch
+        self._client = None
+        self._client_loop = None
+
+        # Reusable receive buffers; each keeps its grown capacity (up to
+        # _POOLED_BUFFER_MAX_BYTES) between fetches
+        self._buffer_pool: deque[bytearray] = deque(maxlen=concurrency * 2)
+
+        # Process pool for CPU-bound HTML/PDF extraction, built on first large payload
+        self._extract_pool: ProcessPoolExecutor | None = None
+
+        # Stats (plain attributes: bumped on every fetch and failure path)
+        self._fetched_count = 0
+        self._cache_hits = 0
+        self._failures = 0
+        self._total_fetch_time = 0.0
+        self._failures_by_reason: Counter[str] = Counter()
 
         # Check for optional dependencies
         self._httpx_available = self._check_httpx()
@@ -173,75 +504,78 @@ class WebFetchService:
 
     def _check_extraction_libs(self) -> dict[str, bool]:
         """Check which extraction libraries are available"""
-        libs = {}
-
-        # HTML extraction
-        try:
-            import trafilatura
-
-            libs["trafilatura"] = True
-        except ImportError:
-            libs["trafilatura"] = False
-
-        try:
-            from readability import Document
-
-            libs["readability"] = True
-        except ImportError:
-            libs["readability"] = False
-
-        try:
-            from bs4 import BeautifulSoup
-
-            libs["beautifulsoup"] = True
-        except ImportError:
-            libs["beautifulsoup"] = False
-
-        # PDF extraction
-        try:
-            import pymupdf
-
-            libs["pymupdf"] = True
-        except ImportError:
-            libs["pymupdf"] = False
-
-        try:
-            import pypdf
-
-            libs["pypdf"] = True
-        except ImportError:
-            libs["pypdf"] = False
+        ext = _load_extractors()
+        return {
+            # HTML extraction
+            "trafilatura": ext["trafilatura"] is not None,
+            "readability": ext["Document"] is not None,
+            "beautifulsoup": ext["BeautifulSoup"] is not None,
+            "lxml": ext["lxml"] is not None,
+            # PDF extraction
+            "pymupdf": ext["pymupdf"] is not None,
+            "pypdf": ext["pypdf"] is not None,
+        }
 
-        return libs
+    async def _get_client(self, local_httpx):
+        """Return the shared AsyncClient, creating it for the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            # A client is bound to the loop it was created on; release the stale one
+            stale, self._client = self._client, None
+            try:
+                await stale.aclose()
+            except Exception:
+                logger.debug("Failed to close HTTP client from a previous event loop")
+        if self._client is None:
+            kwargs = {
+                # Constant headers live on the client so requests only pass overrides
+                "headers": {
+                    "User-Agent": self.user_agent,
+                    "Accept": _ACCEPT,
+                    "Accept-Language": "en-US,en;q=0.9",
+                    "Accept-Encoding": _ACCEPT_ENCODING,
+                },
+                "timeout": local_httpx.Timeout(self.timeout),
+                "follow_redirects": True,
+                "limits": local_httpx.Limits(
+                    max_connections=self.concurrency * 4,
+                    max_keepalive_connections=self.concurrency * 2,
+                    keepalive_expiry=30,
+                ),
+            }
+            try:
+                self._client = local_httpx.AsyncClient(http2=True, **kwargs)
+            except ImportError:
+                # HTTP/2 needs the optional h2 package (httpx[http2])
+                self._client = local_httpx.AsyncClient(**kwargs)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client and extraction pool (call on application shutdown)"""
+        client, self._client, self._client_loop = self._client, None, None
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown(wait=False, cancel_futures=True)
+            self._extract_pool = None
+        if client is not None:
+            await client.aclose()
+
+    def _parse(self, url: str) -> tuple[str, str]:
+        """Parse URL once, returning (canonical_url, domain)"""
+        return _parse_url(url)
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL by removing fragments and tracking params"""
-        parsed = urlparse(url)
-        # Remove fragment
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        if parsed.query:
-            # Remove common tracking params
-            query_parts = []
-            for part in parsed.query.split("&"):
-                # Check if part starts with any tracking param prefix
-                is_tracking = False
-                for prefix in ["utm_", "fbclid", "gclid", "ref"]:
-                    if part.startswith(prefix):
-                        is_tracking = True
-                        break
-                if not is_tracking:
-                    query_parts.append(part)
-            if query_parts:
-                normalized += "?" + "&".join(query_parts)
-        return normalized
+        return _parse_url(url)[0]
 
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL"""
-        return urlparse(url).netloc
+        return _url_domain(url)
 
-    def _is_allowed_domain(self, url: str) -> bool:
+    def _is_allowed_domain(self, url: str, domain: str | None = None) -> bool:
         """Check if domain is allowed based on allow/block lists"""
-        domain = self._get_domain(url)
+        if domain is None:
+            domain = self._get_domain(url)
 
         # Check allowlist first (if set, only these domains are allowed)
         if self.allowlist_domains:
@@ -253,23 +587,24 @@ class WebFetchService:
 
         return True
 
-    def _check_domain_rate_limit(self, url: str) -> bool:
+    def _check_domain_rate_limit(self, url: str, domain: str | None = None) -> bool:
         """Check if request to domain is within rate limit"""
-        domain = self._get_domain(url)
-        now = time.time()
-        minute_ago = now - 60
+        if domain is None:
+            domain = self._get_domain(url)
+        dq = self._rate_limit_tracker[domain]
+        now = time.monotonic()
+        minute_ago = now - 60.0
 
-        # Clean old entries
-        self._rate_limit_tracker[domain] = [
-            t for t in self._rate_limit_tracker[domain] if t > minute_ago
-        ]
+        # Drop expired entries from the left (timestamps are in order)
+        while dq and dq[0] <= minute_ago:
+            dq.popleft()
 
         # Check limit
-        if len(self._rate_limit_tracker[domain]) >= self._domain_rate_limit:
+        if len(dq) >= self._domain_rate_limit:
             return False
 
         # Record this request
-        self._rate_limit_tracker[domain].append(now)
+        dq.append(now)
         return True
 
     def _get_cached_result(self, canonical_url: str) -> FetchResult | None:
@@ -277,34 +612,61 @@ class WebFetchService:
         if canonical_url not in self._cache:
             return None
 
-        result, timestamp = self._cache[canonical_url]
-        age = (datetime.now() - timestamp).total_seconds()
+        result, timestamp, validators = self._cache[canonical_url]
 
-        if age > self.cache_ttl:
-            # Cache expired
-            del self._cache[canonical_url]
+        if time.monotonic() - timestamp > self._cache_ttl_float:
+            # Cache expired; keep entries that can be revalidated with a conditional GET
+            if not validators:
+                del self._cache[canonical_url]
             return None
 
-        self._stats["cache_hits"] += 1
+        self._cache.move_to_end(canonical_url)
+        self._cache_hits += 1
         logger.debug(f"Returning cached result for: {canonical_url[:60]}")
         return result
 
-    def _cache_result(self, canonical_url: str, result: FetchResult):
-        """Cache fetch result"""
-        self._cache[canonical_url] = (result, datetime.now())
+    def _cache_result(
+        self, canonical_url: str, result: FetchResult, validators: dict[str, str] | None = None
+    ):
+        """Cache fetch result along with any conditional request headers"""
+        self._cache[canonical_url] = (result, time.monotonic(), validators or {})
+        self._cache.move_to_end(canonical_url)
 
-        # Simple cache size management (keep last 200 entries)
-        if len(self._cache) > 200:
-            # Remove oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
+        # At most one insert per call, so a single O(1) pop keeps the bound
+        if len(self._cache) > _CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
 
     def _estimate_tokens(self, text: str) -> int:
         """Rough token estimate (words * 1.3)"""
         if not text:
             return 0
-        words = len(text.split())
-        return int(words * 1.3)
+        # Matches are counted one at a time, so unlike text.split() no list of
+        # word strings the size of the page is built
+        return int(sum(1 for _ in _WORD_RE.finditer(text)) * 1.3)
+
+    def _get_extract_pool(self) -> ProcessPoolExecutor:
+        if self._extract_pool is None:
+            self._extract_pool = ProcessPoolExecutor(
+                max_workers=min(os.cpu_count() or 2, self.concurrency),
+                mp_context=_EXTRACT_MP_CONTEXT,
+            )
+        return self._extract_pool
+
+    async def _offload(self, fn, *args):
+        """Run fn(*args) in the extraction pool (shared with the LangChain loader)"""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_extract_pool(), fn, *args)
+        except BrokenProcessPool:
+            # A crashed worker breaks the pool; rebuild it next time, run inline now
+            self._extract_pool = None
+            return fn(*args)
+
+    async def _run_extractor(self, worker, payload, url: str):
+        """Run an extractor in the process pool, inline for small payloads"""
+        if len(payload) < _PROCESS_EXTRACT_MIN_BYTES:
+            return worker(payload, url, self._extraction_libs)
+        return await self._offload(worker, payload, url, self._extraction_libs)
 
     async def _extract_html_content(
         self, html: str, url: str
@@ -313,102 +675,10 @@ class WebFetchService:
         Extract readable content from HTML using available libraries
         Returns: (content, title, published_at)
         """
-        content = None
-        title = None
-        published_at = None
-
-        # Try trafilatura first (best for article extraction)
-        if self._extraction_libs.get("trafilatura"):
-            try:
-                import trafilatura
-                from trafilatura.metadata import extract_metadata
-
-                content = trafilatura.extract(
-                    html, include_comments=False, include_tables=False
-                )
-                if content:
-                    # Try to extract metadata
-                    metadata = extract_metadata(html)
-                    if metadata:
-                        title = metadata.title
-                        if metadata.date:
-                            try:
-                                published_at = datetime.fromisoformat(metadata.date)
-                            except Exception:
-                                pass
-
-                    logger.debug(f"Extracted content with trafilatura from {url[:60]}")
-                    return content, title, published_at
-            except Exception as e:
-                logger.debug(f"Trafilatura extraction failed: {e}")
-
-        # Fallback to readability-lxml
-        if self._extraction_libs.get("readability") and self._extraction_libs.get(
-            "beautifulsoup"
-        ):
-            try:
-                from bs4 import BeautifulSoup
-                from readability import Document
-
-                doc = Document(html)
-                title = doc.title()
-                content_html = doc.summary()
-
-                # Extract text from HTML
-                soup = BeautifulSoup(content_html, "html.parser")
-                content = soup.get_text(separator="\n", strip=True)
-
-                # Try to extract published date from meta tags
-                soup_full = BeautifulSoup(html, "html.parser")
-                for meta_name in [
-                    "article:published_time",
-                    "datePublished",
-                    "publishdate",
-                ]:
-                    meta = soup_full.find("meta", property=meta_name) or soup_full.find(
-                        "meta", attrs={"name": meta_name}
-                    )
-                    if meta and meta.get("content"):
-                        try:
-                            published_at = datetime.fromisoformat(
-                                meta["content"].replace("Z", "+00:00")
-                            )
-                            break
-                        except Exception:
-                            pass
-
-                logger.debug(f"Extracted content with readability from {url[:60]}")
-                return content, title, published_at
-            except Exception as e:
-                logger.debug(f"Readability extraction failed: {e}")
-
-        # Final fallback to BeautifulSoup text extraction
-        if self._extraction_libs.get("beautifulsoup"):
-            try:
-                from bs4 import BeautifulSoup
-
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Remove script and style elements
-                for script in soup(["script", "style", "nav", "footer", "header"]):
-                    script.decompose()
-
-                # Get title
-                title_tag = soup.find("title")
-                title = title_tag.get_text() if title_tag else None
-
-                # Get text
-                content = soup.get_text(separator="\n", strip=True)
-
-                logger.debug(f"Extracted content with BeautifulSoup from {url[:60]}")
-                return content, title, published_at
-            except Exception as e:
-                logger.debug(f"BeautifulSoup extraction failed: {e}")
-
-        return None, None, None
+        return await self._run_extractor(_extract_html_worker, html, url)
 
     async def _extract_pdf_content(
-        self, pdf_bytes: bytes, url: str
+        self, pdf_bytes: bytes | bytearray, url: str
     ) -> tuple[str | None, str | None]:
         """
         Extract text from PDF using available libraries
@@ -416,51 +686,36 @@ class WebFetchService:
         """
         if not self.pdf_enabled:
             return None, None
-
-        # Try PyMuPDF first (best quality)
-        if self._extraction_libs.get("pymupdf"):
-            try:
-                import io
-
-                import pymupdf
-
-                doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
-                content_parts = []
-                title = doc.metadata.get("title")
-
-                for page in doc:
-                    content_parts.append(page.get_text())
-
-                content = "\n".join(content_parts)
-                doc.close()
-
-                logger.debug(f"Extracted PDF content with PyMuPDF from {url[:60]}")
-                return content, title
-            except Exception as e:
-                logger.debug(f"PyMuPDF extraction failed: {e}")
-
-        # Fallback to pypdf
-        if self._extraction_libs.get("pypdf"):
-            try:
-                import io
-
-                import pypdf
-
-                reader = pypdf.PdfReader(io.BytesIO(pdf_bytes))
-                content_parts = []
-                title = reader.metadata.title if reader.metadata else None
-
-                for page in reader.pages:
-                    content_parts.append(page.extract_text())
-
-                content = "\n".join(content_parts)
-
-                logger.debug(f"Extracted PDF content with pypdf from {url[:60]}")
-                return content, title
-            except Exception as e:
-                logger.debug(f"pypdf extraction failed: {e}")
-
-        return None, None
+        return await self._run_extractor(_extract_pdf_worker, pdf_bytes, url)
+
+    def _borrow_buf(self) -> bytearray:
+        """Take a receive buffer from the pool, or a new one if it is empty"""
+        return self._buffer_pool.popleft() if self._buffer_pool else bytearray()
+
+    def _return_buf(self, buf: bytearray):
+        """Give a buffer back for reuse; its contents are not cleared"""
+        if len(buf) > _POOLED_BUFFER_MAX_BYTES:
+            return
+        # clear() would release the allocation, which is what the pool avoids
+        self._buffer_pool.append(buf)
+
+    def _too_large_result(self, url: str, response, size: int) -> FetchResult:
+        """Record and return the failure for a body over max_bytes"""
+        error = f"Content too large: {size} bytes"
+        logger.debug(error)
+        self._failures += 1
+        self._failures_by_reason["too_large"] += 1
+        return FetchResult(
+            url=url,
+            canonical_url=str(response.url),
+            content=None,
+            content_type=response.headers.get("content-type"),
+            title=None,
+            published_at=None,
+            extracted_at=datetime.now(),
+            tokens_estimate=0,
+            error=error,
+        )
 
     async def fetch_url(self, url: str) -> FetchResult:
         """
@@ -485,8 +740,8 @@ class WebFetchService:
                 error="Web fetch disabled",
             )
 
-        # Normalize URL
-        canonical_url = self._normalize_url(url)
+        # Normalize URL and resolve its domain with a single parse
+        canonical_url, domain = self._parse(url)
 
         # Check cache
         cached = self._get_cached_result(canonical_url)
@@ -494,11 +749,11 @@ class WebFetchService:
             return cached
 
         # Check domain allowlist/blocklist
-        if not self._is_allowed_domain(url):
-            error = f"Domain blocked or not in allowlist: {self._get_domain(url)}"
+        if not self._is_allowed_domain(url, domain):
+            error = f"Domain blocked or not in allowlist: {domain}"
             logger.debug(error)
-            self._stats["failures"] += 1
-            self._stats["failures_by_reason"]["blocked_domain"] += 1
+            self._failures += 1
+            self._failures_by_reason["blocked_domain"] += 1
             return FetchResult(
                 url=url,
                 canonical_url=canonical_url,
@@ -512,11 +767,11 @@ class WebFetchService:
             )
 
         # Check rate limit
-        if not self._check_domain_rate_limit(url):
-            error = f"Rate limit exceeded for domain: {self._get_domain(url)}"
+        if not self._check_domain_rate_limit(url, domain):
+            error = f"Rate limit exceeded for domain: {domain}"
             logger.debug(error)
-            self._stats["failures"] += 1
-            self._stats["failures_by_reason"]["rate_limited"] += 1
+            self._failures += 1
+            self._failures_by_reason["rate_limited"] += 1
             return FetchResult(
                 url=url,
                 canonical_url=canonical_url,
@@ -538,16 +793,15 @@ class WebFetchService:
                 if (self.prefer_impl or os.getenv("WEB_FETCH_IMPL", "custom")).lower() == "langchain":
                     from .web_fetch_lc_loader import LangChainWebLoader
 
-                    lc = LangChainWebLoader()
+                    lc = LangChainWebLoader(offload=self._offload)
                     if lc.is_available():
                         content, title, published_at, content_type = await lc.fetch(url)
-                        canonical = self._normalize_url(url)
                         tokens_estimate = (
                             self._estimate_tokens(content) if content else 0
                         )
                         result = FetchResult(
                             url=url,
-                            canonical_url=canonical,
+                            canonical_url=canonical_url,
                             content=(content[:10000] if content else None),
                             content_type=content_type or "text/html",
                             title=title,
@@ -557,7 +811,7 @@ class WebFetchService:
                             error=None if content else "No content extracted",
                         )
                         if content:
-                            self._cache_result(canonical, result)
+                            self._cache_result(canonical_url, result)
                         return result
             except Exception:
                 # If LC path fails, fall through to custom HTTPX fetch
@@ -577,118 +831,145 @@ class WebFetchService:
                 if local_httpx is None:
                     raise ImportError("httpx not available")
 
-                headers = {
-                    "User-Agent": self.user_agent,
-                    "Accept": "text/html,application/xhtml+xml,application/pdf,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                }
-
-                async with local_httpx.AsyncClient(
-                    timeout=self.timeout, follow_redirects=True
-                ) as client:
-                    response = await client.get(url, headers=headers)
+                client = await self._get_client(local_httpx)
+                if self.head_preflight:
+                    # Cheap early reject; servers that refuse HEAD just skip the check
+                    try:
+                        head = await client.head(url)
+                        announced = int(head.headers.get("content-length", 0) or 0)
+                        if announced > self.max_bytes:
+                            return self._too_large_result(url, head, announced)
+                    except Exception:
+                        pass
+                # An entry still present here expired but carries validators, so
+                # ask the origin whether it changed (If-None-Match/If-Modified-Since)
+                stale = self._cache.get(canonical_url)
+                conditional = stale[2] if stale else None
+                # Stream the body so oversized responses are cut off at max_bytes
+                # instead of being buffered whole (Content-Length may be absent or lie)
+                async with client.stream("GET", url, headers=conditional) as response:
+                    if response.status_code == 304 and stale:
+                        # Unchanged: refresh the cached result without a body
+                        cached = stale[0]
+                        self._cache_result(canonical_url, cached, conditional)
+                        self._cache_hits += 1
+                        return cached
                     response.raise_for_status()
-
-                    # Check content length
-                    content_length = int(response.headers.get("content-length", 0))
-                    if content_length > self.max_bytes:
-                        error = f"Content too large: {content_length} bytes"
-                        logger.debug(error)
-                        self._stats["failures"] += 1
-                        self._stats["failures_by_reason"]["too_large"] += 1
-                        return FetchResult(
-                            url=url,
-                            canonical_url=str(response.url),
-                            content=None,
-                            content_type=response.headers.get("content-type"),
-                            title=None,
-                            published_at=None,
-                            extracted_at=datetime.now(),
-                            tokens_estimate=0,
-                            error=error,
-                        )
-
-                    # Update canonical URL from final redirect
-                    canonical_url = str(response.url)
-                    content_type = response.headers.get("content-type", "").lower()
-
-                    # Extract content based on content type
-                    content = None
-                    title = None
-                    published_at = None
-
-                    if "html" in content_type:
-                        html = response.text
-                        content, title, published_at = await self._extract_html_content(
-                            html, url
-                        )
-                    elif "pdf" in content_type and self.pdf_enabled:
-                        pdf_bytes = response.content
-                        content, title = await self._extract_pdf_content(pdf_bytes, url)
-                    else:
-                        error = f"Unsupported content type: {content_type}"
-                        logger.debug(error)
-                        self._stats["failures"] += 1
-                        self._stats["failures_by_reason"]["unsupported_type"] += 1
-                        return FetchResult(
-                            url=url,
-                            canonical_url=canonical_url,
-                            content=None,
-                            content_type=content_type,
-                            title=None,
-                            published_at=None,
-                            extracted_at=datetime.now(),
-                            tokens_estimate=0,
-                            error=error,
-                        )
-
-                    # Create result
-                    tokens_estimate = self._estimate_tokens(content) if content else 0
-
-                    # Sanitize + trust
-                    sanitized_content, is_suspicious = sanitize_web_content(content or "")
-                    trust = compute_trust_score(
-                        canonical_url,
-                        sanitized_content,
-                        self.allowlist_domains,
-                        self.blocklist_domains,
+                    content_length = int(response.headers.get("content-length", 0) or 0)
+                    too_large = content_length if content_length > self.max_bytes else 0
+                    # Pooled buffer: bytes past `size` are stale data from an earlier fetch
+                    buf = self._borrow_buf()
+                    size = 0
+                    if not too_large:
+                        async for chunk in response.aiter_bytes(chunk_size=65536):
+                            end = size + len(chunk)
+                            if end > self.max_bytes:
+                                too_large = end
+                                break
+                            # Overwrites in place within capacity, grows past it
+                            buf[size:end] = chunk
+                            size = end
+
+                if too_large:
+                    self._return_buf(buf)
+                    return self._too_large_result(url, response, too_large)
+
+                # Update canonical URL from final redirect
+                request_key = canonical_url
+                canonical_url = str(response.url)
+                content_type = response.headers.get("content-type", "").lower()
+
+                # Extract content based on magic bytes, then content type
+                content = None
+                title = None
+                published_at = None
+
+                kind = _sniff_content_kind(buf[: min(size, 64)], content_type)
+                if kind == "html":
+                    html = _decode_body(buf, size, response.charset_encoding)
+                    # The decoded str is independent of buf, so it can be reused now
+                    self._return_buf(buf)
+                    content, title, published_at = await self._extract_html_content(
+                        html, url
                     )
-
-                    result = FetchResult(
+                elif kind == "pdf" and self.pdf_enabled:
+                    # Hand the receive buffer over as-is (PyMuPDF reads a bytearray
+                    # directly, no full-size bytes copy). The extractor may keep
+                    # views into it, so it leaves the pool instead of being returned.
+                    del buf[size:]
+                    content, title = await self._extract_pdf_content(buf, url)
+                else:
+                    self._return_buf(buf)
+                    error = f"Unsupported content type: {content_type}"
+                    logger.debug(error)
+                    self._failures += 1
+                    self._failures_by_reason["unsupported_type"] += 1
+                    return FetchResult(
                         url=url,
                         canonical_url=canonical_url,
-                        content=sanitized_content[:10000]
-                        if sanitized_content
-                        else None,  # Cap at 10k chars for safety
+                        content=None,
                         content_type=content_type,
-                        title=title,
-                        published_at=published_at,
+                        title=None,
+                        published_at=None,
                         extracted_at=datetime.now(),
-                        tokens_estimate=min(
-                            tokens_estimate, 3000
-                        ),  # Cap token estimate
-                        error=None if sanitized_content else "No content extracted",
-                        domain=self._get_domain(canonical_url),
-                        trust_score=trust,
-                        is_suspicious=is_suspicious,
+                        tokens_estimate=0,
+                        error=error,
                     )
 
-                    # Update stats
-                    fetch_time = time.time() - start_time
-                    self._stats["fetched_count"] += 1
-                    self._stats["total_fetch_time"] += fetch_time
+                # Create result
+                tokens_estimate = self._estimate_tokens(content) if content else 0
 
-                    if content:
-                        # Cache successful result
-                        self._cache_result(canonical_url, result)
-                        logger.info(
-                            f"Successfully fetched and extracted content from {url[:60]} ({fetch_time:.2f}s, {tokens_estimate} tokens)"
-                        )
-                    else:
-                        self._stats["failures"] += 1
-                        self._stats["failures_by_reason"]["extraction_failed"] += 1
+                # Sanitize + trust
+                sanitized_content, is_suspicious = sanitize_web_content(content or "")
+                trust = compute_trust_score(
+                    canonical_url,
+                    sanitized_content,
+                    self.allowlist_domains,
+                    self.blocklist_domains,
+                )
+
+                result = FetchResult(
+                    url=url,
+                    canonical_url=canonical_url,
+                    content=sanitized_content[:10000]
+                    if sanitized_content
+                    else None,  # Cap at 10k chars for safety
+                    content_type=content_type,
+                    title=title,
+                    published_at=published_at,
+                    extracted_at=datetime.now(),
+                    tokens_estimate=min(
+                        tokens_estimate, 3000
+                    ),  # Cap token estimate
+                    error=None if sanitized_content else "No content extracted",
+                    domain=self._get_domain(canonical_url),
+                    trust_score=trust,
+                    is_suspicious=is_suspicious,
+                )
 
-                    return result
+                # Update stats
+                fetch_time = time.time() - start_time
+                self._fetched_count += 1
+                self._total_fetch_time += fetch_time
+
+                if content:
+                    # Cache successful result with validators for later revalidation
+                    validators = {}
+                    if response.headers.get("etag"):
+                        validators["If-None-Match"] = response.headers["etag"]
+                    if response.headers.get("last-modified"):
+                        validators["If-Modified-Since"] = response.headers["last-modified"]
+                    # Keyed by the requested URL, which is what lookups use; the
+                    # final URL after redirects would never be hit or revalidated
+                    self._cache_result(request_key, result, validators)
+                    logger.info(
+                        f"Successfully fetched and extracted content from {url[:60]} ({fetch_time:.2f}s, {tokens_estimate} tokens)"
+                    )
+                else:
+                    self._failures += 1
+                    self._failures_by_reason["extraction_failed"] += 1
+
+                return result
 
             except Exception as e:
                 # Classify common httpx errors robustly even if module-level symbol was mutated
@@ -706,8 +987,8 @@ class WebFetchService:
                 ):
                     error = f"Timeout fetching URL: {url}"
                     logger.debug(error)
-                    self._stats["failures"] += 1
-                    self._stats["failures_by_reason"]["timeout"] += 1
+                    self._failures += 1
+                    self._failures_by_reason["timeout"] += 1
                     return FetchResult(
                         url=url,
                         canonical_url=canonical_url,
@@ -728,9 +1009,9 @@ class WebFetchService:
                     status = getattr(getattr(e, "response", None), "status_code", None)
                     error = f"HTTP error {status if status is not None else ''}: {url}"
                     logger.debug(error)
-                    self._stats["failures"] += 1
+                    self._failures += 1
                     if status is not None:
-                        self._stats["failures_by_reason"][f"http_{status}"] += 1
+                        self._failures_by_reason[f"http_{status}"] += 1
                     return FetchResult(
                         url=url,
                         canonical_url=canonical_url,
@@ -749,8 +1030,8 @@ class WebFetchService:
                 # Generic error fallback
                 error = f"Error fetching URL: {str(e)}"
                 logger.debug(error)
-                self._stats["failures"] += 1
-                self._stats["failures_by_reason"]["other"] += 1
+                self._failures += 1
+                self._failures_by_reason["other"] += 1
                 return FetchResult(
                     url=url,
                     canonical_url=canonical_url,
@@ -800,55 +1081,75 @@ class WebFetchService:
 
         logger.info(f"Fetching {len(urls_to_fetch)} URLs (max: {self.max_fetch})")
 
-        # Fetch concurrently with semaphore control
-        tasks = [self.fetch_url(url) for url in urls_to_fetch]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle any exceptions from gather
-        fetch_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Exception fetching {urls_to_fetch[i]}: {result}")
-                fetch_results.append(
-                    FetchResult(
-                        url=urls_to_fetch[i],
-                        canonical_url=urls_to_fetch[i],
-                        content=None,
-                        content_type=None,
-                        title=None,
-                        published_at=None,
-                        extracted_at=datetime.now(),
-                        tokens_estimate=0,
-                        error=str(result),
-                    )
-                )
-            else:
-                fetch_results.append(result)
+        # Fetch concurrently with semaphore control; per-URL errors become results,
+        # so one failure never cancels its siblings
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self._fetch_url_safe(url)) for url in urls_to_fetch]
+
+        return [task.result() for task in tasks]
+
+    async def fetch_multiple_iter(self, urls: list[str]) -> AsyncIterator[FetchResult]:
+        """
+        Fetch URLs concurrently, yielding each result as soon as it completes
+
+        Results arrive in completion order, not input order. Fetches still
+        pending when the consumer stops iterating are cancelled.
 
-        return fetch_results
+        Args:
+            urls: List of URLs to fetch (capped at max_fetch)
+
+        Yields:
+            FetchResult objects
+        """
+        if not self.enabled:
+            for result in await self.fetch_multiple(urls):
+                yield result
+            return
+
+        tasks = [asyncio.create_task(self._fetch_url_safe(url)) for url in urls[: self.max_fetch]]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_url_safe(self, url: str) -> FetchResult:
+        """fetch_url that turns an unexpected exception into an error result"""
+        try:
+            return await self.fetch_url(url)
+        except Exception as e:
+            logger.error(f"Exception fetching {url}: {e}")
+            return FetchResult(
+                url=url,
+                canonical_url=url,
+                content=None,
+                content_type=None,
+                title=None,
+                published_at=None,
+                extracted_at=datetime.now(),
+                tokens_estimate=0,
+                error=str(e),
+            )
 
     def get_stats(self) -> dict[str, any]:
         """Get fetch statistics"""
         cache_hit_rate = 0.0
-        if self._stats["fetched_count"] + self._stats["cache_hits"] > 0:
-            cache_hit_rate = self._stats["cache_hits"] / (
-                self._stats["fetched_count"] + self._stats["cache_hits"]
-            )
+        if self._fetched_count + self._cache_hits > 0:
+            cache_hit_rate = self._cache_hits / (self._fetched_count + self._cache_hits)
 
         avg_fetch_ms = 0.0
-        if self._stats["fetched_count"] > 0:
-            avg_fetch_ms = (
-                self._stats["total_fetch_time"] / self._stats["fetched_count"]
-            ) * 1000
+        if self._fetched_count > 0:
+            avg_fetch_ms = (self._total_fetch_time / self._fetched_count) * 1000
 
         return {
             "enabled": self.enabled,
-            "fetched_count": self._stats["fetched_count"],
-            "cache_hits": self._stats["cache_hits"],
+            "fetched_count": self._fetched_count,
+            "cache_hits": self._cache_hits,
             "cache_hit_rate": cache_hit_rate,
             "cache_size": len(self._cache),
-            "failures": self._stats["failures"],
-            "failures_by_reason": dict(self._stats["failures_by_reason"]),
+            "failures": self._failures,
+            "failures_by_reason": dict(self._failures_by_reason),
             "avg_fetch_ms": avg_fetch_ms,
             "extraction_libs_available": {
                 k: v for k, v in self._extraction_libs.items() if v
@@ -907,6 +1208,8 @@ def get_web_fetch_service() -> WebFetchService:
             allowlist_domains=allowlist,
             max_fetch=max_fetch,
             prefer_impl=os.getenv("WEB_FETCH_IMPL", "custom"),
+            head_preflight=os.getenv("WEB_FETCH_HEAD_PREFLIGHT", "false").lower()
+            == "true",
         )
 
     return _web_fetch_service_instance
@@ -4,22 +4,103 @@ WebResearchOrchestrator: search → fetch → synthesize → cite
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import logging
 import os
+import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from typing import Any, List
 
-from .web_fetch_service import get_web_fetch_service
+from .web_fetch_service import get_web_fetch_service, sanitize_web_content
 from .web_search_service import SearchResult, get_web_search_service
 
-# Simple in-memory synthesis cache: key -> (timestamp, result)
-_SYNTH_CACHE: dict[str, tuple] = {}
+logger = logging.getLogger(__name__)
+
+# In-memory synthesis LRU: key -> (time.monotonic() stamp, result), most recent last.
+# Bounded so expired entries for queries that are never repeated cannot accumulate;
+# monotonic stamps keep ages immune to wall-clock jumps.
+_SYNTH_CACHE: OrderedDict[str, tuple] = OrderedDict()
+_SYNTH_CACHE_MAX = int(os.getenv("WEB_SYNTH_CACHE_MAX", "1024"))
+
+# Background stale-while-revalidate refreshes by cache key (one per key at a time;
+# also holds the task references so they are not garbage collected mid-run)
+_REFRESH_INFLIGHT: dict[str, asyncio.Task] = {}
+
+# Synthesis pipelines currently running, by cache key (single-flight)
+_INFLIGHT: dict[str, asyncio.Task] = {}
+
+
+def _synth_cache_get(key: str, ttl: int) -> tuple[dict[str, Any] | None, bool]:
+    """Return (result, is_stale)
+
+    Entries up to ttl old are fresh; up to 2 * ttl they are served stale while a
+    refresh runs in the background; older ones are dropped.
+    """
+    entry = _SYNTH_CACHE.get(key)
+    if entry is None:
+        return None, False
+    ts, cached = entry
+    age = time.monotonic() - ts
+    if age > ttl * 2:
+        del _SYNTH_CACHE[key]
+        return None, False
+    _SYNTH_CACHE.move_to_end(key)
+    return cached, age > ttl
+
+
+def _refresh_done(key: str, task: asyncio.Task) -> None:
+    _REFRESH_INFLIGHT.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background synthesis refresh failed: {task.exception()}")
+
+
+def _synth_cache_put(key: str, value: dict[str, Any]) -> None:
+    _SYNTH_CACHE[key] = (time.monotonic(), value)
+    _SYNTH_CACHE.move_to_end(key)
+    if len(_SYNTH_CACHE) > _SYNTH_CACHE_MAX:
+        _SYNTH_CACHE.popitem(last=False)
+
+
+# Prefer orjson when installed for Redis cache payloads: C speed, bytes out
+try:
+    import orjson  # type: ignore
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except Exception:  # pragma: no cover
+    import json
+
+    _dumps = json.dumps
+    _loads = json.loads
 
 # Optional Redis cache
 try:
-    from .redis_client import get_redis
+    from .redis_client import aget_redis
 except Exception:
-    get_redis = lambda: None  # type: ignore
+
+    async def aget_redis():  # type: ignore
+        return None
+
+
+@lru_cache(maxsize=1)
+def _load_prompt_cached() -> str:
+    """Read the synthesis prompt once per process (it does not change at runtime)"""
+    base = os.path.join(os.path.dirname(__file__), "prompts", "web_synthesis_prompt.txt")
+    try:
+        with open(base, encoding="utf-8") as f:
+            return f.read()
+    except Exception:
+        # Safe fallback
+        return (
+            "You are a web research assistant. Use ONLY the sources below. "
+            "Output a markdown summary with sections and numbered Sources. Use inline citations [1], [2].\nEvidence Pack:"
+        )
 
 
 # Lazy import AI service to avoid cycles
@@ -29,25 +110,17 @@ async def _get_ai_service(model_name: str | None):
     return await get_ai_service(model_name)
 
 
+# Substring match (like the former `k in q.lower()` checks), in one C-level scan
+_TIME_SENSITIVE_RE = re.compile(
+    "latest|recent|news|today|current|now|this week|this month|2024|2025",
+    re.IGNORECASE,
+)
+
+
 def _is_time_sensitive(q: str) -> bool:
     if not q:
         return False
-    ql = q.lower()
-    return any(
-        k in ql
-        for k in [
-            "latest",
-            "recent",
-            "news",
-            "today",
-            "current",
-            "now",
-            "this week",
-            "this month",
-            "2024",
-            "2025",
-        ]
-    )
+    return _TIME_SENSITIVE_RE.search(q) is not None
 
 
 def _chunk_text(text: str, max_chars: int = 600, overlap: int = 60) -> List[str]:
@@ -56,26 +129,102 @@ def _chunk_text(text: str, max_chars: int = 600, overlap: int = 60) -> List[str]
     text = text.strip()
     if len(text) <= max_chars:
         return [text]
-    chunks: List[str] = []
-    start = 0
-    while start < len(text):
-        end = min(len(text), start + max_chars)
-        chunks.append(text[start:end])
-        if end >= len(text):
-            break
-        start = end - overlap
-        if start < 0:
-            start = 0
-    return chunks
-
-
-@dataclass
+    # Windows start every `step` chars; the last one is the first reaching the end
+    step = max(1, max_chars - overlap)
+    return [text[s : s + max_chars] for s in range(0, len(text) - max_chars + step, step)]
+
+
+# A sentence runs from a non-space char to . ! or ? followed by whitespace (so
+# "3.14" is not a boundary) or to the end of the text
+_SENTENCE_RE = re.compile(r"\S.*?(?:[.!?](?=\s)|\Z)", re.S)
+
+
+def _cache_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _query_tokens(query: str) -> set[str]:
+    return {t for t in query.lower().split() if len(t) > 2}
+
+
+def _simple_overlap_score(text: str, q_tokens: set[str]) -> float:
+    # Nothing to match (e.g. a query of short words): skip lowercasing the text
+    if not text or not q_tokens:
+        return 0.0
+    text_lower = text.lower()
+    hits = sum(1 for t in q_tokens if t in text_lower)
+    return hits / max(1, len(q_tokens))
+
+
+def _extract_quotes(text: str, q_tokens: set[str], max_quotes: int = 2) -> list[str]:
+    if not text:
+        return []
+    scored = (
+        (_simple_overlap_score(s, q_tokens), s)
+        for s in (m.group(0) for m in _SENTENCE_RE.finditer(text))
+    )
+    # Bounded heap instead of sorting every sentence; ties keep document order
+    top = heapq.nlargest(max_quotes, scored, key=itemgetter(0))
+    return [s for sc, s in top if sc > 0]
+
+
+def _index_by_url(enriched: list) -> dict[str, Any]:
+    """Map both url and canonical_url of each fetch result to it (first match wins)"""
+    index: dict[str, Any] = {}
+    for f in enriched:
+        for u in (f.url, f.canonical_url):
+            if u:
+                index.setdefault(u, f)
+    return index
+
+
+# FetchResult trust metadata read in one C-level call per fetch result
+_trust_fields = attrgetter("trust_score", "is_suspicious", "domain")
+_NO_TRUST = (None, None, None)
+
+# Evidence content cap (chars) and the citation snippet length taken from it
+_MAX_EVIDENCE_CHARS = 8000
+_SNIPPET_CHARS = 200
+
+
+@dataclass(slots=True)
 class Evidence:
     title: str
     url: str
     content: str
     tokens: int
     published_at: datetime | None = None
+    snippet: str = ""
+
+    def __post_init__(self):
+        # Capped once here rather than at each construction site (slicing a str
+        # already within the bound returns it without a copy)
+        self.content = self.content[:_MAX_EVIDENCE_CHARS]
+        if not self.snippet:
+            self.snippet = self.content[:_SNIPPET_CHARS]
+
+
+# Prompt columns pulled per evidence in one C-level call
+_prompt_fields = attrgetter("title", "published_at", "url", "content")
+# Fixed evidence-block layout: (idx, title, meta_date, url, content)
+_EV_FMT = "[%d] %s%s\nURL: %s\nContent:\n%s\n"
+
+
+def _render_evidence(evidence: List[Evidence], start: int = 1) -> list[str]:
+    """Render numbered evidence-pack blocks for the synthesis prompt"""
+    return [
+        _EV_FMT
+        % (
+            idx,
+            title,
+            published_at.strftime(" (published %Y-%m-%d)") if published_at else "",
+            url,
+            content,
+        )
+        for idx, (title, published_at, url, content) in enumerate(
+            map(_prompt_fields, evidence), start
+        )
+    ]
 
 
 class WebResearchOrchestrator:
@@ -83,6 +232,7 @@ class WebResearchOrchestrator:
         self.web_search = get_web_search_service()
         self.web_fetch = get_web_fetch_service()
         self.max_fetch_default = int(os.getenv("WEB_FETCH_MAX_FETCH", "3"))
+        self._prompt_header = _load_prompt_cached()
 
     async def run(
         self,
@@ -90,31 +240,90 @@ class WebResearchOrchestrator:
         model_name: str | None = None,
         max_results: int = 5,
         max_fetch: int | None = None,
+        force_refresh: bool = False,
     ) -> dict[str, Any]:
         time_sensitive = _is_time_sensitive(query)
 
         # Check synthesis cache for non-time-sensitive queries
         cache_ttl = int(os.getenv("WEB_SYNTH_CACHE_TTL", "300"))
-        cache_key = f"{(model_name or 'default')}:::{query.strip()}"
-        # Redis first
-        if not time_sensitive and cache_ttl > 0:
-            r = get_redis()
+        # Synthesis is the top cache tier; search results and fetched pages are cached
+        # by WebSearchService and WebFetchService. The key ignores case and spacing
+        # so trivially different phrasings of a query share one entry.
+        cache_key = f"{(model_name or 'default')}:::{_cache_query(query)}"
+        use_cache = not time_sensitive and cache_ttl > 0 and not force_refresh
+        # In-memory first (no round trip); both tiers are written together
+        if use_cache:
+            cached, stale = _synth_cache_get(cache_key, cache_ttl)
+            if cached is not None:
+                if stale and cache_key not in _REFRESH_INFLIGHT:
+                    # Serve the stale answer now and refresh it in the background
+                    task = asyncio.create_task(
+                        self.run(query, model_name, max_results, max_fetch, force_refresh=True)
+                    )
+                    _REFRESH_INFLIGHT[cache_key] = task
+                    task.add_done_callback(lambda t: _refresh_done(cache_key, t))
+                return cached
+        # Redis (shared across workers)
+        if use_cache:
+            r = await aget_redis()
             if r is not None:
                 try:
-                    cached = r.get(f"synth:{cache_key}")
+                    cached = await r.get(f"synth:{cache_key}")
                     if cached:
-                        import json
-                        return json.loads(cached)
+                        return _loads(cached)
                 except Exception:
                     pass
-        # In-memory fallback
-        if not time_sensitive and cache_ttl > 0 and cache_key in _SYNTH_CACHE:
-            ts, cached = _SYNTH_CACHE[cache_key]
-            if (datetime.now() - ts).total_seconds() <= cache_ttl:
-                return cached
-            else:
-                del _SYNTH_CACHE[cache_key]
 
+        # Single flight: concurrent misses for the same key share one pipeline run
+        pending = _INFLIGHT.get(cache_key)
+        if pending is None:
+            pending = asyncio.create_task(
+                self._run_pipeline(
+                    query, model_name, max_results, max_fetch, time_sensitive, cache_key, cache_ttl
+                )
+            )
+            _INFLIGHT[cache_key] = pending
+            pending.add_done_callback(lambda _t: _INFLIGHT.pop(cache_key, None))
+        # Shielded so one caller giving up does not cancel the run others await
+        return await asyncio.shield(pending)
+
+    async def _run_pipeline(
+        self,
+        query: str,
+        model_name: str | None,
+        max_results: int,
+        max_fetch: int | None,
+        time_sensitive: bool,
+        cache_key: str,
+        cache_ttl: int,
+    ) -> dict[str, Any]:
+        # Resolve the AI service (may probe the model server) while search and fetch run
+        ai_task = asyncio.create_task(_get_ai_service(model_name))
+        background: list[asyncio.Task] = [ai_task]
+        try:
+            return await self._run_stages(
+                query, max_results, max_fetch, time_sensitive, cache_key, cache_ttl, ai_task,
+                background,
+            )
+        finally:
+            # Any stage may return early or raise before its tasks are awaited
+            for task in background:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark retrieved so a failure is not logged as unhandled
+
+    async def _run_stages(
+        self,
+        query: str,
+        max_results: int,
+        max_fetch: int | None,
+        time_sensitive: bool,
+        cache_key: str,
+        cache_ttl: int,
+        ai_task: asyncio.Task,
+        background: list[asyncio.Task],
+    ) -> dict[str, Any]:
         # 1) Search
         results: list[SearchResult] = await self.web_search.search(
             query,
@@ -140,18 +349,27 @@ class WebResearchOrchestrator:
                 "web_impl": impl,
             }
 
-        # Deduplicate by URL
-        seen = set()
-        deduped: list[SearchResult] = []
-        for r in results:
-            if r.url and r.url not in seen:
-                seen.add(r.url)
-                deduped.append(r)
-        results = deduped
+        # Deduplicate by URL, keeping the first result for each URL in rank order
+        results_by_url = {r.url: r for r in reversed(results) if r.url}
+        results = [results_by_url[u] for u in dict.fromkeys(r.url for r in results if r.url)]
 
         # 2) Fetch/enrich
         max_fetch = max_fetch or self.max_fetch_default
         top_urls = [r.url for r in results[:max_fetch] if r.url]
+        # With deepening on, prefetch the next candidates alongside the top ones so a
+        # thin pack is topped up without a second, serial fetch round trip. The spare
+        # pages are kept apart from `enriched` and only read by the deepening pass.
+        deepen_enabled = os.getenv("WEB_AGENT_DEEPEN", "false").lower() == "true"
+        spare_urls = (
+            [r.url for r in results[max_fetch : max_fetch * 2] if r.url]
+            if deepen_enabled
+            else []
+        )
+        spare_task = (
+            asyncio.create_task(self.web_fetch.fetch_multiple(spare_urls)) if spare_urls else None
+        )
+        if spare_task is not None:
+            background.append(spare_task)
         enriched = await self.web_fetch.fetch_multiple(top_urls) if top_urls else []
 
         # Optionally supplement with MCP-fetched docs when configured
@@ -159,13 +377,12 @@ class WebResearchOrchestrator:
         if mcp_enabled:
             try:
                 from .mcp.multi_client import get_multi_mcp_client
-                from .web_fetch_service import sanitize_web_content
 
                 client = get_multi_mcp_client()
                 # Best-effort warm connect (idempotent)
                 await client.warm_connect()
                 # Prefer candidates not yet fetched
-                existing_urls = {r.url for r in results[:max_fetch] if r.url}
+                existing_urls = set(top_urls)
                 mcp_candidates = [r.url for r in results if r.url and r.url not in existing_urls]
                 added = 0
                 max_mcp = int(os.getenv("WEB_MCP_MAX_DOCS", "2"))
@@ -203,14 +420,13 @@ class WebResearchOrchestrator:
                 # MCP optional path; ignore failures gracefully
                 pass
 
-        # Optional: rerank results before packaging evidence
-        def _simple_overlap_score(text: str, query: str) -> float:
-            q_tokens = {t for t in query.lower().split() if len(t) > 2}
-            if not text:
-                return 0.0
-            hits = sum(1 for t in q_tokens if t in text.lower())
-            return hits / max(1, len(q_tokens))
+        # Join fetch results to search results by URL once instead of scanning per lookup
+        enriched_by_url = _index_by_url(enriched)
 
+        # Query tokens for overlap scoring, built once and shared by every call
+        q_tokens = _query_tokens(query)
+
+        # Optional: rerank results before packaging evidence
         rerank_enabled = os.getenv("WEB_RERANK_ENABLED", "false").lower() == "true"
         if rerank_enabled:
             # Try local cross-encoder first
@@ -224,7 +440,7 @@ class WebResearchOrchestrator:
             max_chars = int(os.getenv("WEB_RERANK_PASSAGE_CHARS", "600"))
             overlap = int(os.getenv("WEB_RERANK_PASSAGE_OVERLAP", "60"))
             for r in candidates:
-                fr = next((f for f in enriched if f.url == r.url or f.canonical_url == r.url), None)
+                fr = enriched_by_url.get(r.url)
                 base = (fr.content if fr and fr.content else (r.snippet or "")) or ""
                 for chunk in _chunk_text(base, max_chars=max_chars, overlap=overlap):
                     passage_records.append((r, chunk))
@@ -254,12 +470,14 @@ class WebResearchOrchestrator:
                 # Replace evidence_pack later using selected chunks
                 selected_chunks = selected
             else:
-                # Fallback heuristic mix of overlap + provider relevance
+                # Fallback heuristic mix of overlap + provider relevance. Kept as plain
+                # str scans: with only max_fetch candidates, numpy.char over padded
+                # UCS-4 copies of the page text measured ~10x slower.
                 scored: list[tuple[float, SearchResult]] = []
                 for r in results[:max_fetch]:
-                    fr = next((f for f in enriched if f.url == r.url or f.canonical_url == r.url), None)
+                    fr = enriched_by_url.get(r.url)
                     basis = (fr.content if fr and fr.content else (r.snippet or ""))
-                    s = 0.7 * _simple_overlap_score(basis, query) + 0.3 * float(r.relevance_score or 0.0)
+                    s = 0.7 * _simple_overlap_score(basis, q_tokens) + 0.3 * float(r.relevance_score or 0.0)
                     scored.append((s, r))
                 scored.sort(key=lambda x: x[0], reverse=True)
                 results = [r for _, r in scored] + results[max_fetch:]
@@ -269,14 +487,14 @@ class WebResearchOrchestrator:
         if rerank_enabled and 'selected_chunks' in locals() and selected_chunks:
             # Build evidence from selected chunks
             for r, chunk in selected_chunks[:max_fetch]:
-                fr = next((f for f in enriched if f.url == r.url or f.canonical_url == r.url), None)
+                fr = enriched_by_url.get(r.url)
                 # Simple token estimate
                 tokens = int(len(chunk.split()) * 1.3)
                 evidence_pack.append(
                     Evidence(
                         title=r.title or (fr.title if fr else r.title) or "Untitled",
                         url=fr.canonical_url if fr and fr.canonical_url else r.url,
-                        content=chunk[:8000],
+                        content=chunk,
                         tokens=tokens,
                         published_at=fr.published_at if fr else None,
                     )
@@ -284,17 +502,14 @@ class WebResearchOrchestrator:
         else:
             for r in results[:max_fetch]:
                 # find matching fetch result
-                fr = next(
-                    (f for f in enriched if f.url == r.url or f.canonical_url == r.url),
-                    None,
-                )
+                fr = enriched_by_url.get(r.url)
                 content = fr.content if fr and fr.content else (r.snippet or "")
                 tokens = fr.tokens_estimate if fr and fr.tokens_estimate else 0
                 evidence_pack.append(
                     Evidence(
                         title=r.title or (fr.title if fr else r.title) or "Untitled",
                         url=fr.canonical_url if fr and fr.canonical_url else r.url,
-                        content=content[:8000],
+                        content=content,
                         tokens=tokens,
                         published_at=fr.published_at if fr else None,
                     )
@@ -320,7 +535,7 @@ class WebResearchOrchestrator:
                             Evidence(
                                 title=title,
                                 url=url,
-                                content=str(content)[:8000],
+                                content=str(content),
                                 tokens=tokens,
                                 published_at=getattr(fr, "published_at", None),
                             )
@@ -335,24 +550,13 @@ class WebResearchOrchestrator:
                 pass
 
         # 3) Build synthesis prompt
-        def build_prompt(evidence: list[Evidence]) -> str:
-            prompt_header = self._load_prompt()
-            pack_lines: list[str] = []
-            for idx, ev in enumerate(evidence, 1):
-                meta_date = (
-                    f" (published {ev.published_at.strftime('%Y-%m-%d')})"
-                    if ev.published_at
-                    else ""
-                )
-                pack_lines.append(
-                    f"[{idx}] {ev.title}{meta_date}\nURL: {ev.url}\nContent:\n{ev.content}\n"
-                )
-            return f"{prompt_header}\n\n" + "\n".join(pack_lines)
-
-        prompt = build_prompt(evidence_pack)
+        # Rendered blocks are kept so a deepening pass only renders what it appends
+        pack_blocks = _render_evidence(evidence_pack)
+        prompt_head = f"{self._prompt_header}\n\n"
+        prompt = prompt_head + "\n".join(pack_blocks)
 
         # Optional deepening pass for low-confidence packs
-        deepen_enabled = os.getenv("WEB_AGENT_DEEPEN", "false").lower() == "true"
+        deepened: list = []
         if deepen_enabled:
             min_docs = int(os.getenv("WEB_AGENT_DEEPEN_MIN_DOCS", "2"))
             min_tokens = int(os.getenv("WEB_AGENT_DEEPEN_MIN_TOKENS", "800"))
@@ -362,25 +566,24 @@ class WebResearchOrchestrator:
                 or total_tokens < min_tokens
             ):
                 # Try to fetch a couple more results not yet fetched
-                extra_candidates = [
-                    r.url
-                    for r in results
-                    if r.url not in set(e.url for e in evidence_pack)
-                ]
+                evidence_urls = {e.url for e in evidence_pack}
+                extra_candidates = [r.url for r in results if r.url not in evidence_urls]
                 extra_to_fetch = extra_candidates[
                     : max(0, (max_fetch or self.max_fetch_default))
                 ]
                 if extra_to_fetch:
-                    extra_enriched = await self.web_fetch.fetch_multiple(extra_to_fetch)
+                    # Most candidates were prefetched alongside the first batch
+                    spare_by_url = _index_by_url(await spare_task) if spare_task else {}
+                    prefetched = {**spare_by_url, **enriched_by_url}
+                    extra_enriched = [prefetched[u] for u in extra_to_fetch if u in prefetched]
+                    missing = [u for u in extra_to_fetch if u not in prefetched]
+                    if missing:
+                        extra_enriched += await self.web_fetch.fetch_multiple(missing)
+                    deepened = extra_enriched
                     for fr in extra_enriched:
                         # Find title from original results
-                        rmatch = next(
-                            (
-                                r
-                                for r in results
-                                if r.url == fr.url or r.url == fr.canonical_url
-                            ),
-                            None,
+                        rmatch = results_by_url.get(fr.url) or results_by_url.get(
+                            fr.canonical_url
                         )
                         title = (
                             rmatch.title
@@ -392,56 +595,57 @@ class WebResearchOrchestrator:
                             Evidence(
                                 title=title,
                                 url=fr.canonical_url or fr.url,
-                                content=(content or "")[:8000],
+                                content=content or "",
                                 tokens=fr.tokens_estimate or 0,
                                 published_at=fr.published_at,
                             )
                         )
                     # Rebuild prompt with new evidence
-                    prompt = build_prompt(evidence_pack)
+                    pack_blocks += _render_evidence(
+                        evidence_pack[len(pack_blocks):], len(pack_blocks) + 1
+                    )
+                    prompt = prompt_head + "\n".join(pack_blocks)
+
+        # The confident path never reads the prefetched spare pages
+        if spare_task is not None and not spare_task.done():
+            spare_task.cancel()
 
         # 4) Synthesize via AIService
-        ai_service = await _get_ai_service(model_name)
+        ai_service = await ai_task
         # Use non-stream generate_response with 'context' set to None; pack goes in prompt
         result = await ai_service.generate_response(prompt, context=None)
         text = result.get("response", "") if isinstance(result, dict) else str(result)
 
         # 5) Build citations mapping with optional quotes and trust
-        def _extract_quotes(text: str, query: str, max_quotes: int = 2) -> list[str]:
-            if not text:
-                return []
-            sentences = [s.strip() for s in text.split(". ") if s.strip()]
-            scores = []
-            for s in sentences:
-                score = _simple_overlap_score(s, query)
-                scores.append((score, s))
-            scores.sort(key=lambda x: x[0], reverse=True)
-            return [s for sc, s in scores[:max_quotes] if sc > 0]
-
-        # Build a quick lookup to fetch trust metadata if available
-        trust_map: dict[str, dict[str, Any]] = {}
-        for fr in enriched:
-            trust_map[fr.canonical_url or fr.url] = {
-                "trust_score": getattr(fr, "trust_score", 0.5),
-                "is_suspicious": getattr(fr, "is_suspicious", False),
-                "domain": getattr(fr, "domain", None),
-            }
+        # Build a quick lookup to fetch trust metadata: url -> (trust, suspicious, domain)
+        trust_map: dict[str, tuple] = {}
+        for fr in (*enriched, *deepened):
+            try:
+                trust = _trust_fields(fr)
+            except AttributeError:
+                # Duck-typed records without the FetchResult trust fields
+                trust = (
+                    getattr(fr, "trust_score", 0.5),
+                    getattr(fr, "is_suspicious", False),
+                    getattr(fr, "domain", None),
+                )
+            trust_map[fr.canonical_url or fr.url] = trust
 
         citations: list[dict[str, Any]] = []
         for idx, ev in enumerate(evidence_pack, 1):
-            tm = trust_map.get(ev.url, {})
+            trust_score, is_suspicious, domain = trust_map.get(ev.url, _NO_TRUST)
             citations.append(
                 {
                     "id": idx,
                     "title": ev.title,
                     "url": ev.url,
-                    "snippet": ev.content[:200],
+                    "snippet": ev.snippet,
                     "source": "web_search",
                     "source_type": "web",
-                    "quotes": _extract_quotes(ev.content, query),
-                    "trust": tm.get("trust_score"),
-                    "suspicious": tm.get("is_suspicious"),
-                    "domain": tm.get("domain"),
+                    "quotes": _extract_quotes(ev.content, q_tokens),
+                    "trust": trust_score,
+                    "suspicious": is_suspicious,
+                    "domain": domain,
                 }
             )
 
@@ -456,27 +660,15 @@ class WebResearchOrchestrator:
         # Store in synthesis cache for non-time-sensitive queries
         if not time_sensitive and cache_ttl > 0:
             # Redis write
-            r = get_redis()
+            r = await aget_redis()
             if r is not None:
                 try:
-                    import json
-                    r.setex(f"synth:{cache_key}", cache_ttl, json.dumps(final))
+                    await r.setex(f"synth:{cache_key}", cache_ttl, _dumps(final))
                 except Exception:
                     pass
-            _SYNTH_CACHE[cache_key] = (datetime.now(), final)
+            _synth_cache_put(cache_key, final)
 
         return final
 
     def _load_prompt(self) -> str:
-        base = os.path.join(
-            os.path.dirname(__file__), "prompts", "web_synthesis_prompt.txt"
-        )
-        try:
-            with open(base, encoding="utf-8") as f:
-                return f.read()
-        except Exception:
-            # Safe fallback
-            return (
-                "You are a web research assistant. Use ONLY the sources below. "
-                "Output a markdown summary with sections and numbered Sources. Use inline citations [1], [2].\nEvidence Pack:"
-            )
+        return self._prompt_header
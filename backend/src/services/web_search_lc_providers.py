@@ -1,19 +1,184 @@
 """
 LangChain-backed web search providers implementing the same interface as WebSearchProvider
+
+SerpAPI and Tavily are called directly over a shared httpx.AsyncClient (their
+LangChain wrappers are sync-only); DuckDuckGo still goes through its wrapper.
 """
 
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, repeat
+
+try:
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover
+    httpx = None  # type: ignore
+
+# Probed once: the DuckDuckGo provider needs langchain-community's wrapper
+_LC_AVAILABLE = importlib.util.find_spec("langchain_community") is not None
+
+# Prefer orjson when installed for decoding upstream JSON: C speed, reads bytes
+try:
+    import orjson  # type: ignore
+
+    _loads = orjson.loads
+except Exception:  # pragma: no cover
+    import json
+
+    _loads = json.loads
 
 # We avoid importing WebSearchProvider/SearchResult at module import time to prevent
 # circular imports. We'll import SearchResult inside methods when needed.
 
+# Shared result LRU: (provider, normalized query, max_results) -> (monotonic ts, results).
+# Empty results and provider errors are cached too, for the shorter _NEG_TTL, so a
+# failing upstream is not hammered with retries of the same query.
+_RESULT_CACHE: OrderedDict[
+    tuple[str, str, int], tuple[float, list | Exception]
+] = OrderedDict()
+_CACHE_TTL = float(os.getenv("WEB_SEARCH_LC_CACHE_TTL", "300"))
+_NEG_TTL = float(os.getenv("WEB_SEARCH_LC_NEG_CACHE_TTL", "30"))
+_CACHE_MAX = int(os.getenv("WEB_SEARCH_LC_CACHE_MAX", "512"))
+
+# Provider calls currently running, by cache key (single-flight)
+_INFLIGHT: dict[tuple[str, str, int], asyncio.Task] = {}
+
+# Per-provider cap on concurrent upstream calls, shared across service instances
+_SEMAPHORES: dict[str, asyncio.Semaphore] = {}
+
+
+def _cache_get(key: tuple[str, str, int]) -> list | Exception | None:
+    entry = _RESULT_CACHE.get(key)
+    if entry is None:
+        return None
+    ts, results = entry
+    ttl = _CACHE_TTL if results and isinstance(results, list) else _NEG_TTL
+    if time.monotonic() - ts >= ttl:
+        del _RESULT_CACHE[key]
+        return None
+    _RESULT_CACHE.move_to_end(key)
+    return results
+
+
+def _cache_put(key: tuple[str, str, int], results: list | Exception) -> None:
+    _RESULT_CACHE[key] = (time.monotonic(), results)
+    _RESULT_CACHE.move_to_end(key)
+    if len(_RESULT_CACHE) > _CACHE_MAX:
+        _RESULT_CACHE.popitem(last=False)
+
+
+_SERPAPI_URL = "https://serpapi.com/search.json"
+_TAVILY_URL = "https://api.tavily.com/search"
+_HTTP_TIMEOUT_SEC = float(os.getenv("WEB_SEARCH_HTTP_TIMEOUT", "10"))
+
+# Process-wide client so SerpAPI/Tavily connections stay pooled across searches;
+# web_search_service's providers use it too, so there is one pool per process
+_HTTP = None
+_HTTP_LOOP = None
+
+
+async def _get_http():
+    """Return the shared AsyncClient, creating it for the running loop if needed."""
+    global _HTTP, _HTTP_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTP is not None and not _HTTP.is_closed and _HTTP_LOOP is not loop:
+        # A client is bound to the loop it was created on; release the stale one
+        stale, _HTTP = _HTTP, None
+        try:
+            await stale.aclose()
+        except Exception:
+            pass
+    if _HTTP is None or _HTTP.is_closed:
+        pool_size = os.getenv("WEB_SEARCH_POOL_SIZE", "100")
+        kwargs = {
+            "timeout": httpx.Timeout(_HTTP_TIMEOUT_SEC),
+            "limits": httpx.Limits(
+                max_connections=int(os.getenv("WEB_SEARCH_MAX_CONN", pool_size)),
+                max_keepalive_connections=int(
+                    os.getenv("WEB_SEARCH_KEEPALIVE", pool_size)
+                ),
+            ),
+        }
+        try:
+            _HTTP = httpx.AsyncClient(http2=True, **kwargs)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package (httpx[http2])
+            _HTTP = httpx.AsyncClient(**kwargs)
+        _HTTP_LOOP = loop
+    return _HTTP
+
+
+async def close_http() -> None:
+    """Close the shared search HTTP client (call on application shutdown)."""
+    global _HTTP, _HTTP_LOOP
+    client, _HTTP, _HTTP_LOOP = _HTTP, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def _redact_url(url) -> str:
+    """The request URL with its api_key query parameter masked."""
+    if "api_key" in url.params:
+        url = url.copy_set_param("api_key", "REDACTED")
+    return str(url)
+
+
+def _check_status(r, provider: str) -> None:
+    """raise_for_status() without the credential leak.
+
+    httpx.HTTPStatusError embeds the full request URL in its message, and the
+    SerpAPI key travels as a query parameter; that message would reach the
+    logs and the negative cache.
+    """
+    if not r.is_success:
+        raise RuntimeError(
+            f"{provider} request failed: HTTP {r.status_code} for {_redact_url(r.request.url)}"
+        )
+
+
+# DuckDuckGo has no REST API; one wrapper is built on first use and reused
+@lru_cache(maxsize=1)
+def _get_ddg():
+    from langchain_community.utilities import DuckDuckGoSearchAPIWrapper  # type: ignore
+
+    return DuckDuckGoSearchAPIWrapper()
+
+
+# Rank-decaying relevance (1.0, 0.9, ... 0.1); every later rank scores 0.1
+_RELEVANCE_SCORES = tuple(max(0.1, 1.0 - i * 0.1) for i in range(10))
+
+
+@lru_cache(maxsize=None)
+def _env(name: str) -> str | None:
+    """API key lookup, read once per process (changing a key needs a restart;
+    tests call _env.cache_clear())"""
+    return os.getenv(name)
+
+
+def _first(item: dict, keys: tuple[str, ...], default: str = "") -> str:
+    """First non-empty value of item among keys, in order, else default"""
+    for k in keys:
+        v = item.get(k)
+        if v:
+            return v
+    return default
+
 
 class _BaseLCProvider:
+    # Stateless singletons: everything lives on the class or in module caches
+    __slots__ = ()
+
     name: str = "lc"
+    # Default cap on concurrent upstream calls; WEB_SEARCH_MAX_CONCURRENCY_<NAME> overrides
+    MAX_CONCURRENCY: int = 5
 
     def is_available(self) -> bool:  # pragma: no cover - simple import check
         return True
@@ -21,133 +186,192 @@ class _BaseLCProvider:
     async def search(
         self, query: str, max_results: int = 5, **kwargs
     ) -> list[SearchResult]:
+        """Search through the shared TTL cache; misses go to the provider"""
+        key = (self.name, " ".join(query.lower().split()), max_results)
+        results = _cache_get(key)
+        if results is None:
+            results = await self._single_flight(
+                key, lambda: self._search_and_cache(key, query, max_results)
+            )
+        elif isinstance(results, Exception):
+            # Recent failure for this provider/query: fail fast without a call
+            # A fresh error per hit, so callers never share (and grow) one traceback
+            raise RuntimeError(f"{self.name} recently failed") from results
+        # Shallow copy so callers cannot reorder or trim the shared list
+        return list(results)
+
+    async def _single_flight(
+        self, key: tuple[str, str, int], coro_factory: Callable[[], Awaitable[list]]
+    ) -> list:
+        """Run coro_factory() once per key; concurrent callers await the same task"""
+        task = _INFLIGHT.get(key)
+        if task is None:
+            task = asyncio.create_task(coro_factory())
+            _INFLIGHT[key] = task
+            task.add_done_callback(lambda _t: _INFLIGHT.pop(key, None))
+        # Shielded so one caller timing out does not cancel the call others await
+        return await asyncio.shield(task)
+
+    async def _search_and_cache(
+        self, key: tuple[str, str, int], query: str, max_results: int
+    ) -> list[SearchResult]:
+        try:
+            async with self._semaphore():
+                results = await self._search(query, max_results)
+        except Exception as e:
+            _cache_put(key, e)
+            raise
+        _cache_put(key, results)
+        return results
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Per-provider semaphore, created on first use inside the running loop"""
+        sem = _SEMAPHORES.get(self.name)
+        if sem is None:
+            limit = int(
+                os.getenv(
+                    f"WEB_SEARCH_MAX_CONCURRENCY_{self.name.upper()}",
+                    str(self.MAX_CONCURRENCY),
+                )
+            )
+            sem = _SEMAPHORES[self.name] = asyncio.Semaphore(max(1, limit))
+        return sem
+
+    async def _search(self, query: str, max_results: int) -> list[SearchResult]:
         raise NotImplementedError
 
+    @classmethod
+    def _build_results(
+        cls,
+        items: list[dict],
+        title_keys: tuple[str, ...],
+        url_keys: tuple[str, ...],
+        snippet_keys: tuple[str, ...],
+        max_results: int,
+    ) -> list[SearchResult]:
+        """Normalize raw provider dicts into SearchResults sharing one timestamp"""
+        from .web_search_service import SearchResult  # local import to avoid cycle
+
+        now = datetime.now()
+        return [
+            SearchResult(
+                title=_first(r, title_keys, "No title"),
+                url=_first(r, url_keys),
+                snippet=_first(r, snippet_keys)[:500],
+                source="web_search",
+                relevance_score=score,
+                timestamp=now,
+            )
+            for r, score in zip(items[:max_results], chain(_RELEVANCE_SCORES, repeat(0.1)))
+        ]
+
 
 class LangChainSerpAPIProvider(_BaseLCProvider):
-    """LangChain SerpAPI wrapper provider.
+    """SerpAPI provider for the LangChain backend, called directly over httpx.
 
-    Requires SERPAPI_API_KEY and langchain-community installed.
+    Requires SERPAPI_API_KEY and httpx installed.
     """
 
+    __slots__ = ()
     name = "serpapi"
 
     def is_available(self) -> bool:
-        if not os.getenv("SERPAPI_API_KEY"):
-            return False
-        try:
-            return True
-        except Exception:
-            return False
-
-    async def search(
-        self, query: str, max_results: int = 5, **kwargs
-    ) -> list[SearchResult]:
-        from langchain_community.utilities import SerpAPIWrapper  # type: ignore
-
-        from .web_search_service import SearchResult  # local import to avoid cycle
+        return httpx is not None and bool(_env("SERPAPI_API_KEY"))
 
-        loop = asyncio.get_event_loop()
-        wrapper = SerpAPIWrapper()
-        # wrapper.results returns list of dicts similar to serpapi
-        raw = await loop.run_in_executor(None, lambda: wrapper.results(query))
-        # Some versions return a dict with 'organic_results'; normalize to list
-        if isinstance(raw, dict):
-            items = raw.get("organic_results", [])
-        else:
-            items = raw or []
-        results: list[SearchResult] = []
-        for i, r in enumerate(items[:max_results]):
-            results.append(
-                SearchResult(
-                    title=r.get("title") or "No title",
-                    url=r.get("link") or r.get("url") or "",
-                    snippet=(r.get("snippet") or r.get("content") or "")[:500],
-                    source="web_search",
-                    relevance_score=max(0.1, 1.0 - i * 0.1),
-                    timestamp=datetime.now(),
-                )
-            )
-        return results
+    async def _search(self, query: str, max_results: int) -> list[SearchResult]:
+        client = await _get_http()
+        r = await client.get(
+            _SERPAPI_URL,
+            params={
+                "engine": "google",
+                "q": query,
+                "api_key": _env("SERPAPI_API_KEY"),
+                "num": max_results,
+            },
+        )
+        _check_status(r, "SerpAPI")
+        items = (_loads(r.content).get("organic_results") or [])[:max_results]
+        return self._build_results(
+            items, ("title",), ("link", "url"), ("snippet", "content"), max_results
+        )
 
 
 class LangChainTavilyProvider(_BaseLCProvider):
-    """LangChain Tavily wrapper provider.
+    """Tavily provider for the LangChain backend, called directly over httpx.
 
-    Requires TAVILY_API_KEY and langchain-community installed.
+    Requires TAVILY_API_KEY and httpx installed.
     """
 
+    __slots__ = ()
     name = "tavily"
 
     def is_available(self) -> bool:
-        if not os.getenv("TAVILY_API_KEY"):
-            return False
-        try:
-            return True
-        except Exception:
-            return False
+        return httpx is not None and bool(_env("TAVILY_API_KEY"))
 
-    async def search(
-        self, query: str, max_results: int = 5, **kwargs
-    ) -> list[SearchResult]:
-        from langchain_community.utilities import TavilySearchAPIWrapper  # type: ignore
-
-        from .web_search_service import SearchResult  # local import to avoid cycle
-
-        loop = asyncio.get_event_loop()
-        wrapper = TavilySearchAPIWrapper(max_results=max_results)
-        raw = await loop.run_in_executor(None, lambda: wrapper.results(query))
-        results: list[SearchResult] = []
-        for i, r in enumerate((raw or [])[:max_results]):
-            results.append(
-                SearchResult(
-                    title=r.get("title") or "No title",
-                    url=r.get("url") or "",
-                    snippet=(r.get("content") or "")[:500],
-                    source="web_search",
-                    relevance_score=max(0.1, 1.0 - i * 0.1),
-                    timestamp=datetime.now(),
-                )
-            )
-        return results
+    async def _search(self, query: str, max_results: int) -> list[SearchResult]:
+        client = await _get_http()
+        r = await client.post(
+            _TAVILY_URL,
+            json={"query": query, "max_results": max_results},
+            headers={"Authorization": f"Bearer {_env('TAVILY_API_KEY')}"},
+        )
+        r.raise_for_status()
+        return self._build_results(
+            _loads(r.content).get("results") or [],
+            ("title",),
+            ("url",),
+            ("content",),
+            max_results,
+        )
 
 
 class LangChainDuckDuckGoProvider(_BaseLCProvider):
     """LangChain DuckDuckGo wrapper provider."""
 
+    __slots__ = ()
     name = "duckduckgo"
 
     def is_available(self) -> bool:
-        try:
-            return True
-        except Exception:
-            return False
+        return _LC_AVAILABLE
 
-    async def search(
-        self, query: str, max_results: int = 5, **kwargs
-    ) -> list[SearchResult]:
-        from langchain_community.utilities import (
-            DuckDuckGoSearchAPIWrapper,  # type: ignore
+    async def _search(self, query: str, max_results: int) -> list[SearchResult]:
+        wrapper = _get_ddg()
+        # wrapper.results returns list of dicts with {link, title, snippet}
+        raw = await asyncio.to_thread(wrapper.results, query, max_results=max_results)
+        return self._build_results(
+            raw or [], ("title",), ("link", "url"), ("snippet",), max_results
         )
 
-        from .web_search_service import SearchResult  # local import to avoid cycle
 
-        loop = asyncio.get_event_loop()
-        wrapper = DuckDuckGoSearchAPIWrapper()
-        # wrapper.results returns list of dicts with {link, title, snippet}
-        raw = await loop.run_in_executor(
-            None, lambda: wrapper.results(query, max_results=max_results)
-        )
-        results: list[SearchResult] = []
-        for i, r in enumerate((raw or [])[:max_results]):
-            results.append(
-                SearchResult(
-                    title=r.get("title") or "No title",
-                    url=r.get("link") or r.get("url") or "",
-                    snippet=(r.get("snippet") or "")[:500],
-                    source="web_search",
-                    relevance_score=max(0.1, 1.0 - i * 0.1),
-                    timestamp=datetime.now(),
-                )
+async def search_best_of(
+    query: str, providers: list, max_results: int = 5, timeout: float | None = 10.0
+) -> list[SearchResult]:
+    """Query available providers concurrently; first non-empty result wins.
+
+    Losing searches are cancelled once a winner is found (their shielded upstream
+    calls still finish and fill the cache). Providers that fail or return nothing
+    are skipped; returns [] if none succeed within timeout.
+    """
+    tasks = [
+        asyncio.create_task(p.search(query, max_results))
+        for p in providers
+        if p.is_available()
+    ]
+    pending = set(tasks)
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    try:
+        while pending:
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
             )
-        return results
+            if not done:
+                break
+            for task in done:
+                if not task.cancelled() and task.exception() is None and task.result():
+                    return task.result()
+        return []
+    finally:
+        for task in tasks:
+            task.cancel()
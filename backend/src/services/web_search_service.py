@@ -4,11 +4,13 @@ Supports multiple providers with fallback and caching
 """
 
 import asyncio
+import hashlib
 import logging
 import os
+import re
 import time
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any
 
@@ -23,18 +25,40 @@ except Exception:
     except Exception:  # pragma: no cover
         DDGS = None  # type: ignore
 
+# SerpAPI and Tavily are called over their REST APIs with a shared async client
 try:
-    from serpapi import GoogleSearch  # type: ignore
+    import httpx  # type: ignore
 except Exception:  # pragma: no cover
-    GoogleSearch = None  # type: ignore
+    httpx = None  # type: ignore
 
+# Prefer orjson when installed for decoding provider JSON: C speed, reads bytes
 try:
-    from tavily import TavilyClient  # type: ignore
+    import orjson  # type: ignore
+
+    _loads = orjson.loads
 except Exception:  # pragma: no cover
-    TavilyClient = None  # type: ignore
+    import json
+
+    _loads = json.loads
+
+# One pooled client (and URL set) is shared with the LangChain-backend providers,
+# so both backends reuse the same connections to each provider
+from .web_search_lc_providers import (
+    _SERPAPI_URL,
+    _TAVILY_URL,
+    _check_status,
+    _get_http,
+)
+
+# Substring match (like the former `k in query.lower()` checks), in one C-level scan
+_TIME_SENSITIVE_RE = re.compile(
+    "latest|recent|news|update|what's new|current|today|now|this week|this month"
+    "|2024|2025",
+    re.IGNORECASE,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Represents a single web search result"""
 
@@ -53,26 +77,30 @@ class SearchResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API responses"""
-        result = {
+        published_at = self.published_at
+        return {
             "title": self.title,
             "url": self.url,
             "snippet": self.snippet,
             "source": self.source,
             "relevance_score": self.relevance_score,
             "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+            # Optional enrichment fields, included only if present
+            **{
+                k: v
+                for k, v in (
+                    ("content", self.content),
+                    ("canonical_url", self.canonical_url),
+                    ("content_type", self.content_type),
+                    (
+                        "published_at",
+                        published_at.isoformat() if published_at is not None else None,
+                    ),
+                    ("tokens_estimate", self.tokens_estimate),
+                )
+                if v is not None
+            },
         }
-        # Include optional enrichment fields only if present
-        if self.content is not None:
-            result["content"] = self.content
-        if self.canonical_url is not None:
-            result["canonical_url"] = self.canonical_url
-        if self.content_type is not None:
-            result["content_type"] = self.content_type
-        if self.published_at is not None:
-            result["published_at"] = self.published_at.isoformat()
-        if self.tokens_estimate is not None:
-            result["tokens_estimate"] = self.tokens_estimate
-        return result
 
 
 class WebSearchProvider:
@@ -106,17 +134,12 @@ class DuckDuckGoProvider(WebSearchProvider):
     def is_available(self) -> bool:
         """Check if DuckDuckGo (ddgs) is available"""
         if self._available is None:
-            try:
-                # Prefer the new package name first
-                self._available = True
-            except Exception:
-                try:
-                    self._available = True
-                except Exception:
-                    logger.warning(
-                        "DuckDuckGo search package not installed. Install with: pip install ddgs (or duckduckgo-search)"
-                    )
-                    self._available = False
+            # DDGS is resolved once at module import (ddgs, then duckduckgo_search)
+            self._available = DDGS is not None
+            if not self._available:
+                logger.warning(
+                    "DuckDuckGo search package not installed. Install with: pip install ddgs (or duckduckgo-search)"
+                )
         return self._available
 
     async def search(self, query: str, max_results: int = 5) -> list[SearchResult]:
@@ -129,12 +152,12 @@ class DuckDuckGoProvider(WebSearchProvider):
             if DDGS is None:
                 raise RuntimeError("DDGS not available")
             # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None, lambda: list(DDGS().text(query, max_results=max_results))
+            results = await asyncio.to_thread(
+                lambda: list(DDGS().text(query, max_results=max_results))
             )
 
             search_results = []
+            now = datetime.now()  # one timestamp per batch
             for i, result in enumerate(results):
                 try:
                     search_result = SearchResult(
@@ -145,7 +168,7 @@ class DuckDuckGoProvider(WebSearchProvider):
                         relevance_score=max(
                             0.1, 1.0 - (i * 0.1)
                         ),  # Decreasing relevance
-                        timestamp=datetime.now(),
+                        timestamp=now,
                     )
                     search_results.append(search_result)
                 except Exception as e:
@@ -153,7 +176,9 @@ class DuckDuckGoProvider(WebSearchProvider):
                     continue
 
             logger.info(
-                f"DuckDuckGo search returned {len(search_results)} results for query: {query[:50]}"
+                "DuckDuckGo search returned %d results for query: %.50s",
+                len(search_results),
+                query,
             )
             return search_results
 
@@ -176,24 +201,20 @@ class SerpAPIProvider(WebSearchProvider):
             self._available = False
             return False
         if self._available is None:
-            try:
-                import serpapi  # noqa: F401
-                self._available = True
-            except ImportError:
-                logger.warning(
-                    "google-search-results not installed. Install with: pip install google-search-results"
-                )
-                self._available = False
+            self._available = httpx is not None
+            if not self._available:
+                logger.warning("httpx not installed. Install with: pip install httpx")
         return self._available
 
     async def search(
-        self, query: str, max_results: int = 5, **kwargs
+        self, query: str, max_results: int = 5, client=None, **kwargs
     ) -> list[SearchResult]:
         """Search using SerpAPI
 
         Args:
             query: Search query string
             max_results: Maximum number of results to return
+            client: httpx.AsyncClient to use (defaults to the shared pooled client)
             **kwargs: Additional arguments (ignored for compatibility)
         """
         if not self.is_available():
@@ -202,23 +223,23 @@ class SerpAPIProvider(WebSearchProvider):
             )
 
         try:
-            # Use serpapi.Client to match test expectations
-            import serpapi
-
             # Build search parameters
             params = {
                 "q": query,
                 "num": max_results,
                 "engine": "google",
+                "api_key": self.api_key,
             }
 
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
             try:
-                def _call():
-                    client = serpapi.Client(api_key=self.api_key)
-                    return client.search(params)
-                response = await loop.run_in_executor(None, _call)
+                client = client or await _get_http()
+                r = await client.get(_SERPAPI_URL, params=params)
+                # Not raise_for_status(): its error message carries the api_key
+                _check_status(r, "SerpAPI")
+                response = _loads(r.content)
+                # SerpAPI can report errors (e.g. bad key) in the body of a 200
+                if response.get("error"):
+                    raise RuntimeError(response["error"])
             except Exception as e:
                 error_msg = str(e)
                 if "Invalid API key" in error_msg or "401" in error_msg:
@@ -226,7 +247,7 @@ class SerpAPIProvider(WebSearchProvider):
                         "SerpAPI authentication failed. Please verify your API key. "
                         "Get your API key from https://serpapi.com/manage-api-key"
                     ) from e
-                elif "403" in error_msg or "Rate limit" in error_msg:
+                elif "403" in error_msg or "429" in error_msg or "Rate limit" in error_msg:
                     raise RuntimeError(
                         "SerpAPI rate limit exceeded or access forbidden. "
                         "Check your plan limits at https://serpapi.com/dashboard"
@@ -236,6 +257,7 @@ class SerpAPIProvider(WebSearchProvider):
 
             search_results = []
             organic_results = response.get("organic_results", []) or []
+            now = datetime.now()  # one timestamp per batch
 
             for i, result in enumerate(organic_results[:max_results]):
                 try:
@@ -247,7 +269,7 @@ class SerpAPIProvider(WebSearchProvider):
                         relevance_score=max(
                             0.1, 1.0 - (i * 0.1)
                         ),  # Decreasing relevance
-                        timestamp=datetime.now(),
+                        timestamp=now,
                     )
                     search_results.append(search_result)
                 except Exception as e:
@@ -255,7 +277,9 @@ class SerpAPIProvider(WebSearchProvider):
                     continue
 
             logger.info(
-                f"SerpAPI search returned {len(search_results)} results for query: {query[:50]}"
+                "SerpAPI search returned %d results for query: %.50s",
+                len(search_results),
+                query,
             )
             return search_results
 
@@ -278,18 +302,18 @@ class TavilyProvider(WebSearchProvider):
             self._available = False
             return False
         if self._available is None:
-            try:
-                import tavily  # noqa: F401
-                self._available = True
-            except ImportError:
-                logger.warning(
-                    "tavily-python not installed. Install with: pip install tavily-python"
-                )
-                self._available = False
+            self._available = httpx is not None
+            if not self._available:
+                logger.warning("httpx not installed. Install with: pip install httpx")
         return self._available
 
     async def search(
-        self, query: str, max_results: int = 5, search_depth: str = "advanced", **kwargs
+        self,
+        query: str,
+        max_results: int = 5,
+        search_depth: str = "advanced",
+        client=None,
+        **kwargs,
     ) -> list[SearchResult]:
         """Search using Tavily
 
@@ -297,18 +321,20 @@ class TavilyProvider(WebSearchProvider):
             query: Search query string
             max_results: Maximum number of results to return
             search_depth: Search depth ("basic" or "advanced") - advanced gets fresher results
+            client: httpx.AsyncClient to use (defaults to the shared pooled client)
             **kwargs: Additional arguments (ignored for compatibility)
         """
         if not self.is_available():
             raise RuntimeError("Tavily provider not available (API key not configured)")
 
         try:
-            # Use module-level TavilyClient reference to allow tests to monkeypatch
-            TavilyClient_local = TavilyClient
-            if TavilyClient_local is None:
-                raise RuntimeError("Tavily client not available")
+            client = client or await _get_http()
+            headers = {"Authorization": f"Bearer {self.api_key}"}
 
-            client = TavilyClient_local(api_key=self.api_key)
+            async def _post(payload: dict) -> dict:
+                r = await client.post(_TAVILY_URL, json=payload, headers=headers)
+                r.raise_for_status()
+                return _loads(r.content)
 
             # Build search parameters
             # Note: Free/dev API keys may have limited parameters
@@ -326,12 +352,8 @@ class TavilyProvider(WebSearchProvider):
             # include_answer may not be available on all plans
             # search_params["include_answer"] = True  # Commented out for compatibility
 
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
             try:
-                response = await loop.run_in_executor(
-                    None, lambda: client.search(**search_params)
-                )
+                response = await _post(search_params)
             except Exception as e:
                 error_msg = str(e)
                 # Check if it's a ForbiddenError (API key issue)
@@ -352,9 +374,7 @@ class TavilyProvider(WebSearchProvider):
                             ),  # Limit results for dev keys
                         }
                         try:
-                            response = await loop.run_in_executor(
-                                None, lambda: client.search(**minimal_params)
-                            )
+                            response = await _post(minimal_params)
                         except Exception as e2:
                             raise RuntimeError(
                                 f"Tavily API error: {error_msg}. "
@@ -370,6 +390,7 @@ class TavilyProvider(WebSearchProvider):
                     raise
 
             search_results = []
+            now = datetime.now()  # one timestamp per batch
             for i, result in enumerate(response.get("results", [])):
                 try:
                     search_result = SearchResult(
@@ -378,7 +399,7 @@ class TavilyProvider(WebSearchProvider):
                         snippet=result.get("content", "")[:500],  # Limit snippet length
                         source="web_search",
                         relevance_score=result.get("score", max(0.1, 1.0 - (i * 0.1))),
-                        timestamp=datetime.now(),
+                        timestamp=now,
                     )
                     search_results.append(search_result)
                 except Exception as e:
@@ -386,7 +407,9 @@ class TavilyProvider(WebSearchProvider):
                     continue
 
             logger.info(
-                f"Tavily search returned {len(search_results)} results for query: {query[:50]}"
+                "Tavily search returned %d results for query: %.50s",
+                len(search_results),
+                query,
             )
             return search_results
 
@@ -406,6 +429,7 @@ class WebSearchService:
         enable_cache: bool = True,
         timeout_sec: int = 8,
         impl: str = "custom",  # "custom" or "langchain"
+        hedged_search: bool = False,
     ):
         """
         Initialize web search service
@@ -417,6 +441,7 @@ class WebSearchService:
             enable_cache: Enable result caching
             timeout_sec: Max seconds to wait for a single provider before falling back
             impl: Backend implementation (custom or langchain)
+            hedged_search: Race primary and fallback for time-sensitive queries
         """
         self.provider_name = provider.lower()
         self.cache_ttl = cache_ttl
@@ -424,6 +449,7 @@ class WebSearchService:
         self.enable_cache = enable_cache
         self.timeout_sec = timeout_sec
         self.impl = (impl or "custom").lower()
+        self.hedged_search = hedged_search
 
         # Initialize providers (custom)
         self.duckduckgo = DuckDuckGoProvider()
@@ -453,14 +479,18 @@ class WebSearchService:
         self.primary_provider = self._get_provider(self.provider_name)
         self.fallback_provider = self._get_fallback_provider()
 
-        # Cache: query -> (results, timestamp)
-        self._cache: dict[str, tuple] = {}
+        # LRU cache: _cache_key(query) -> (results, monotonic ts), least recent first
+        self._cache: OrderedDict[int, tuple] = OrderedDict()
         # Circuit breaker state per provider
         self._cb_failures: dict[str, int] = {}
         self._cb_open_until: dict[str, float] = {}
 
-        # Rate limiting: track requests per minute
-        self._rate_limit_tracker: dict[str, list[float]] = defaultdict(list)
+        # Rate limiting: one token bucket for the service, refilled at rate_limit/min
+        self._tokens = float(rate_limit)
+        self._tokens_refilled = time.monotonic()
+
+        # Searches currently running, by (query, max_results, use_cache, force_fresh)
+        self._inflight: dict[tuple, asyncio.Task] = {}
 
         logger.info(
             f"WebSearchService initialized: provider={self.provider_name}, impl={self.impl}, "
@@ -526,48 +556,26 @@ class WebSearchService:
         return None
 
     def _check_rate_limit(self, query: str) -> bool:
-        """Check if request is within rate limit"""
+        """Check if request is within rate limit (shared by all queries)"""
         if self.rate_limit <= 0:
             return True  # No rate limiting
 
-        now = time.time()
-        minute_ago = now - 60
-
-        # Clean old entries
-        self._rate_limit_tracker[query] = [
-            t for t in self._rate_limit_tracker[query] if t > minute_ago
-        ]
-
-        # Check limit
-        if len(self._rate_limit_tracker[query]) >= self.rate_limit:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.rate_limit),
+            self._tokens + (now - self._tokens_refilled) * self.rate_limit / 60,
+        )
+        self._tokens_refilled = now
+        if self._tokens < 1:
             return False
-
-        # Record this request
-        self._rate_limit_tracker[query].append(now)
+        self._tokens -= 1
         return True
 
     def _is_time_sensitive_query(self, query: str) -> bool:
         """Detect if query is time-sensitive (e.g., latest news, recent updates)"""
         if not query:
             return False
-
-        query_lower = query.lower()
-        time_sensitive_keywords = [
-            "latest",
-            "recent",
-            "news",
-            "update",
-            "what's new",
-            "current",
-            "today",
-            "now",
-            "this week",
-            "this month",
-            "2024",
-            "2025",
-        ]
-
-        return any(keyword in query_lower for keyword in time_sensitive_keywords)
+        return _TIME_SENSITIVE_RE.search(query) is not None
 
     def _enhance_query_for_freshness(self, query: str) -> str:
         """Enhance query with temporal keywords for better freshness"""
@@ -586,23 +594,32 @@ class WebSearchService:
 
         return query
 
+    @staticmethod
+    def _cache_key(query: str) -> int:
+        """64-bit digest of the query, so cache keys stay small however long it is"""
+        return int.from_bytes(
+            hashlib.blake2b(query.encode(), digest_size=8).digest(), "little"
+        )
+
     def _get_cached_result(self, query: str) -> list[SearchResult] | None:
         """Get cached result if available and not expired"""
         if not self.enable_cache:
             return None
 
-        if query not in self._cache:
+        key = self._cache_key(query)
+        entry = self._cache.get(key)
+        if entry is None:
             return None
 
-        results, timestamp = self._cache[query]
-        age = (datetime.now() - timestamp).total_seconds()
+        results, ts = entry
 
-        if age > self.cache_ttl:
+        if time.monotonic() - ts > self.cache_ttl:
             # Cache expired
-            del self._cache[query]
+            del self._cache[key]
             return None
 
-        logger.debug(f"Returning cached result for query: {query[:50]}")
+        self._cache.move_to_end(key)
+        logger.debug("Returning cached result for query: %.50s", query)
         return results
 
     def _cache_result(self, query: str, results: list[SearchResult]):
@@ -610,13 +627,13 @@ class WebSearchService:
         if not self.enable_cache:
             return
 
-        self._cache[query] = (results, datetime.now())
+        key = self._cache_key(query)
+        self._cache[key] = (results, time.monotonic())
+        self._cache.move_to_end(key)
 
-        # Simple cache size management (keep last 100 queries)
+        # Keep the 100 most recently used queries
         if len(self._cache) > 100:
-            # Remove oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
+            self._cache.popitem(last=False)
 
     async def enrich_results(self, results: list[SearchResult]) -> list[SearchResult]:
         """
@@ -641,13 +658,14 @@ class WebSearchService:
             # Web fetch disabled, return original results
             return results
 
-        # Extract URLs to fetch
-        urls = [result.url for result in results]
+        # Unique URLs in rank order (so max_fetch keeps the best-ranked ones);
+        # fetch_map below fans each fetch back out to every duplicate result
+        urls = list(dict.fromkeys(result.url for result in results if result.url))
 
         if not urls:
             return results
 
-        logger.info(f"Enriching {len(urls)} search results with fetched content")
+        logger.info("Enriching %d search results with fetched content", len(urls))
 
         # Fetch content for all URLs
         fetch_results = await fetch_service.fetch_multiple(urls)
@@ -661,14 +679,11 @@ class WebSearchService:
             fetch_result = fetch_map.get(result.url)
 
             if fetch_result and fetch_result.content and not fetch_result.error:
-                # Create enriched result with fetched content
-                enriched_result = SearchResult(
-                    title=result.title or fetch_result.title or result.title,
-                    url=result.url,
-                    snippet=result.snippet,
-                    source=result.source,
-                    relevance_score=result.relevance_score,
-                    timestamp=result.timestamp,
+                # Enriched copy: results may be shared with the search cache, so
+                # they are never mutated in place
+                enriched_result = replace(
+                    result,
+                    title=result.title or fetch_result.title,
                     content=fetch_result.content,
                     canonical_url=fetch_result.canonical_url,
                     content_type=fetch_result.content_type,
@@ -677,19 +692,21 @@ class WebSearchService:
                 )
                 enriched_results.append(enriched_result)
                 logger.debug(
-                    f"Enriched result for {result.url[:60]} with {fetch_result.tokens_estimate} tokens"
+                    "Enriched result for %.60s with %s tokens",
+                    result.url,
+                    fetch_result.tokens_estimate,
                 )
             else:
                 # Keep original result if fetch failed
                 enriched_results.append(result)
                 if fetch_result and fetch_result.error:
                     logger.debug(
-                        f"Failed to enrich {result.url[:60]}: {fetch_result.error}"
+                        "Failed to enrich %.60s: %s", result.url, fetch_result.error
                     )
 
         success_count = sum(1 for r in enriched_results if r.content is not None)
         logger.info(
-            f"Successfully enriched {success_count}/{len(results)} search results"
+            "Successfully enriched %d/%d search results", success_count, len(results)
         )
 
         return enriched_results
@@ -712,6 +729,65 @@ class WebSearchService:
         self._cb_failures[name] = 0
         self._cb_open_until[name] = 0
 
+    async def _call_provider(
+        self,
+        provider: WebSearchProvider,
+        query: str,
+        max_results: int,
+        is_time_sensitive: bool,
+    ) -> list[SearchResult]:
+        """Run one provider search under the per-provider timeout"""
+        if isinstance(provider, TavilyProvider):
+            search_depth = "advanced" if is_time_sensitive else "basic"
+            coro = provider.search(query, max_results, search_depth=search_depth)
+        else:
+            coro = provider.search(query, max_results)
+        return await asyncio.wait_for(coro, timeout=self.timeout_sec)
+
+    async def _hedged_search(
+        self, query: str, max_results: int, is_time_sensitive: bool
+    ) -> list[SearchResult] | None:
+        """Race primary and fallback; first non-empty result wins, the rest are cancelled.
+
+        Returns None if every raced provider failed or came back empty.
+        """
+        tasks: dict[asyncio.Task, str] = {}
+        for name, provider in (
+            (self.provider_name, self.primary_provider),
+            (getattr(self.fallback_provider, "name", "fallback"), self.fallback_provider),
+        ):
+            if provider is not None and self._cb_allowed(name):
+                task = asyncio.create_task(
+                    self._call_provider(provider, query, max_results, is_time_sensitive)
+                )
+                tasks[task] = name
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name = tasks[task]
+                    if task.exception() is not None:
+                        logger.warning(
+                            f"Hedged provider ({name}) failed: {task.exception()}"
+                        )
+                        self._cb_record_failure(name)
+                    elif task.result():
+                        self._cb_record_success(name)
+                        logger.info(
+                            "Hedged web search won by %s with %d results for query: '%.50s'",
+                            name,
+                            len(task.result()),
+                            query,
+                        )
+                        return task.result()
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def search(
         self,
         query: str,
@@ -737,7 +813,23 @@ class WebSearchService:
         if not query or not query.strip():
             return []
 
-        original_query = query.strip()
+        # Identical concurrent searches share one run (single-flight); this matters
+        # most for time-sensitive queries, which bypass the result cache
+        key = (query.strip(), max_results, use_cache, force_fresh)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._search(query.strip(), max_results, use_cache, force_fresh)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        # Shielded so one caller timing out does not cancel the search others await;
+        # shallow copy so callers cannot reorder or trim the shared list
+        return list(await asyncio.shield(task))
+
+    async def _search(
+        self, original_query: str, max_results: int, use_cache: bool, force_fresh: bool
+    ) -> list[SearchResult]:
 
         # Detect time-sensitive queries
         is_time_sensitive = self._is_time_sensitive_query(original_query)
@@ -753,24 +845,23 @@ class WebSearchService:
         if is_time_sensitive or force_fresh:
             use_cache = False  # Disable cache for time-sensitive queries
             logger.info(
-                f"Time-sensitive query detected: '{original_query[:50]}' - cache disabled"
+                "Time-sensitive query detected: '%.50s' - cache disabled", original_query
             )
 
         # Check cache first (only if not time-sensitive and cache enabled)
         if use_cache and not force_fresh:
             cached = self._get_cached_result(enhanced_query)
             if cached is not None:
-                logger.debug(
-                    f"Returning cached result for query: {enhanced_query[:50]}"
-                )
+                logger.debug("Returning cached result for query: %.50s", enhanced_query)
                 return cached[:max_results]
 
         # Check rate limit
         if not self._check_rate_limit(enhanced_query):
-            logger.warning(f"Rate limit exceeded for query: {enhanced_query[:50]}")
+            logger.warning("Rate limit exceeded for query: %.50s", enhanced_query)
             # Return cached result even if expired, or empty list
-            if enhanced_query in self._cache:
-                return self._cache[enhanced_query][0][:max_results]
+            stale = self._cache.get(self._cache_key(enhanced_query))
+            if stale is not None:
+                return stale[0][:max_results]
             return []
 
         # Use enhanced query for search
@@ -780,35 +871,43 @@ class WebSearchService:
 
         # Log search details
         logger.info(
-            f"Web search: query='{original_query[:50]}', "
-            f"enhanced='{search_query[:50]}', "
-            f"time_sensitive={is_time_sensitive}, "
-            f"use_cache={use_cache}, "
-            f"max_results={max_results}"
+            "Web search: query='%.50s', enhanced='%.50s', time_sensitive=%s, "
+            "use_cache=%s, max_results=%d",
+            original_query,
+            search_query,
+            is_time_sensitive,
+            use_cache,
+            max_results,
+        )
+
+        # Hedged: race primary and fallback instead of trying them in turn
+        hedged = (
+            self.hedged_search
+            and is_time_sensitive
+            and self.primary_provider is not None
+            and self.fallback_provider is not None
         )
+        if hedged:
+            results = await self._hedged_search(
+                search_query, max_results, is_time_sensitive
+            )
+            if results:
+                return results
 
         # Try primary provider (respect circuit breaker)
-        if self.primary_provider and self._cb_allowed(self.provider_name):
+        if not hedged and self.primary_provider and self._cb_allowed(self.provider_name):
             try:
-                # Pass search_depth for Tavily provider (SerpAPI doesn't need this)
-                if isinstance(self.primary_provider, TavilyProvider):
-                    search_depth = "advanced" if is_time_sensitive else "basic"
-                    results = await asyncio.wait_for(
-                        self.primary_provider.search(
-                            search_query, max_results, search_depth=search_depth
-                        ),
-                        timeout=self.timeout_sec,
-                    )
-                else:
-                    results = await asyncio.wait_for(
-                        self.primary_provider.search(search_query, max_results),
-                        timeout=self.timeout_sec,
-                    )
+                results = await self._call_provider(
+                    self.primary_provider, search_query, max_results, is_time_sensitive
+                )
 
                 if results:
                     logger.info(
-                        f"Web search returned {len(results)} results for query: '{search_query[:50]}' "
-                        f"(time_sensitive={is_time_sensitive})"
+                        "Web search returned %d results for query: '%.50s' "
+                        "(time_sensitive=%s)",
+                        len(results),
+                        search_query,
+                        is_time_sensitive,
                     )
                     # Only cache if not time-sensitive
                     if not is_time_sensitive and use_cache:
@@ -823,30 +922,22 @@ class WebSearchService:
                 self._cb_record_failure(self.provider_name)
 
         # Try fallback provider (respect circuit breaker)
-        if self.fallback_provider:
+        if not hedged and self.fallback_provider:
             fb_name = getattr(self.fallback_provider, "name", "fallback")
             if not self._cb_allowed(fb_name):
                 logger.warning(f"Circuit open for fallback provider '{fb_name}', skipping")
             else:
                 try:
-                    logger.info(f"Using fallback provider for query: {search_query[:50]}")
-                    if isinstance(self.fallback_provider, TavilyProvider):
-                        search_depth = "advanced" if is_time_sensitive else "basic"
-                        results = await asyncio.wait_for(
-                            self.fallback_provider.search(
-                                search_query, max_results, search_depth=search_depth
-                            ),
-                            timeout=self.timeout_sec,
-                        )
-                    else:
-                        results = await asyncio.wait_for(
-                            self.fallback_provider.search(search_query, max_results),
-                            timeout=self.timeout_sec,
-                        )
+                    logger.info("Using fallback provider for query: %.50s", search_query)
+                    results = await self._call_provider(
+                        self.fallback_provider, search_query, max_results, is_time_sensitive
+                    )
 
                     if results:
                         logger.info(
-                            f"Fallback web search returned {len(results)} results for query: '{search_query[:50]}'"
+                            "Fallback web search returned %d results for query: '%.50s'",
+                            len(results),
+                            search_query,
                         )
                         # Only cache if not time-sensitive
                         if not is_time_sensitive and use_cache:
@@ -867,19 +958,9 @@ class WebSearchService:
                         "LangChain providers failed; attempting CUSTOM primary provider"
                     )
                     try:
-                        if isinstance(custom_primary, TavilyProvider):
-                            search_depth = "advanced" if is_time_sensitive else "basic"
-                            results = await asyncio.wait_for(
-                                custom_primary.search(
-                                    search_query, max_results, search_depth=search_depth
-                                ),
-                                timeout=self.timeout_sec,
-                            )
-                        else:
-                            results = await asyncio.wait_for(
-                                custom_primary.search(search_query, max_results),
-                                timeout=self.timeout_sec,
-                            )
+                        results = await self._call_provider(
+                            custom_primary, search_query, max_results, is_time_sensitive
+                        )
                         if results:
                             return results
                     except Exception:
@@ -904,19 +985,9 @@ class WebSearchService:
                         f"LangChain providers failed; attempting CUSTOM fallback provider: {fallback_name}"
                     )
                     try:
-                        if isinstance(custom_fallback, TavilyProvider):
-                            search_depth = "advanced" if is_time_sensitive else "basic"
-                            results = await asyncio.wait_for(
-                                custom_fallback.search(
-                                    search_query, max_results, search_depth=search_depth
-                                ),
-                                timeout=self.timeout_sec,
-                            )
-                        else:
-                            results = await asyncio.wait_for(
-                                custom_fallback.search(search_query, max_results),
-                                timeout=self.timeout_sec,
-                            )
+                        results = await self._call_provider(
+                            custom_fallback, search_query, max_results, is_time_sensitive
+                        )
                         if results:
                             return results
                     except Exception:
@@ -957,7 +1028,7 @@ class WebSearchService:
             "results": [r.to_dict() for r in results],
             "count": len(results),
             "provider": self.provider_name,
-            "cached": query in self._cache,
+            "cached": self._cache_key(query) in self._cache,
         }
 
     def clear_cache(self):
@@ -1014,6 +1085,7 @@ def get_web_search_service() -> WebSearchService:
             enable_cache=enable_cache,
             timeout_sec=int(os.getenv("WEB_SEARCH_TIMEOUT", "8")),
             impl=os.getenv("WEB_SEARCH_IMPL", "custom").lower(),
+            hedged_search=os.getenv("WEB_SEARCH_HEDGED", "false").lower() == "true",
         )
 
     return _web_search_service_instance
@@ -15,3 +15,16 @@ def test_adapter_memory_add_and_context():
     assert ctx[0]["role"] == "user"
     assert "hello" in ctx[0]["content"].lower()
     assert ctx[1]["role"] == "assistant"
+
+
+def test_token_bounded_memory_drops_oldest_messages():
+    mem = create_memory(max_tokens=10)
+
+    mem.add_user("a" * 16)  # 4 tokens
+    mem.add_ai("b" * 16)  # 4 tokens
+    mem.add_user("c" * 16)  # 4 tokens -> oldest evicted
+
+    ctx = mem.get_context()
+    assert [m["content"][0] for m in ctx] == ["b", "c"]
+    assert ctx[0]["role"] == "assistant"
+    assert mem.token_count == 8
@@ -0,0 +1,68 @@
+import pytest
+
+from backend.src.services import rate_limit
+
+
+class _FakeRedis:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.counts = {}
+        self.calls = []
+
+    def register_script(self, script):
+        async def run(keys, args):
+            if self.fail:
+                raise ConnectionError("redis down")
+            self.calls.append(keys)
+            curr, prev = (self.counts.get(k, 0) for k in keys)
+            weight, limit, _ttl = args
+            if prev * weight + curr >= limit:
+                return 0
+            self.counts[keys[0]] = curr + 1
+            return 1
+
+        return run
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_uses_window_keys(monkeypatch):
+    monkeypatch.setattr(rate_limit.time, "time", lambda: 125.0)
+    fake = _FakeRedis()
+    limiter = rate_limit.RedisRateLimiter(fake)
+
+    assert [await limiter.allow("web:1.2.3.4", 2, 60) for _ in range(3)] == [True, True, False]
+    assert fake.calls[0] == ["rl:web:1.2.3.4:2", "rl:web:1.2.3.4:1"]
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_falls_back_to_local_when_unreachable():
+    limiter = rate_limit.RedisRateLimiter(_FakeRedis(fail=True))
+
+    assert [await limiter.allow("k", 1, 60) for _ in range(2)] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_warns_once_until_recovered(caplog):
+    fake = _FakeRedis(fail=True)
+    limiter = rate_limit.RedisRateLimiter(fake)
+
+    with caplog.at_level("DEBUG", logger=rate_limit.__name__):
+        for _ in range(3):
+            await limiter.allow("k", 10, 60)
+        fake.fail = False
+        await limiter.allow("k", 10, 60)
+        fake.fail = True
+        await limiter.allow("k", 10, 60)
+
+    levels = [r.levelname for r in caplog.records]
+    assert levels == ["WARNING", "DEBUG", "DEBUG", "INFO", "WARNING"]
+
+
+def test_get_rate_limiter_prefers_redis(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_rate_limiter", None)
+    monkeypatch.setattr(rate_limit, "get_redis", lambda: _FakeRedis())
+    assert isinstance(rate_limit.get_rate_limiter(), rate_limit.RedisRateLimiter)
+
+    monkeypatch.setattr(rate_limit, "_rate_limiter", None)
+    monkeypatch.setattr(rate_limit, "get_redis", lambda: None)
+    assert isinstance(rate_limit.get_rate_limiter(), rate_limit.RateLimiter)
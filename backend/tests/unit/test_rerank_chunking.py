@@ -100,3 +100,12 @@ async def test_rerank_chunk_selection(monkeypatch):
     # Expect a citation from url http://b due to higher score
     assert any(c.get("url", "").startswith("http://b") for c in out["citations"]) \
         or any(c.get("url", "").startswith("http://b") for c in (out.get("results", []) or []))
+
+
+def test_chunk_text_windows_cover_text_exactly():
+    text = "".join(chr(97 + i % 26) for i in range(1000))
+    chunks = _chunk_text(text, max_chars=100, overlap=10)
+
+    assert len(chunks) == 11
+    assert chunks[-1] == text[900:]
+    assert all(a[-10:] == b[:10] for a, b in zip(chunks, chunks[1:]))
@@ -0,0 +1,101 @@
+import pytest
+
+from backend.src.services import reranker
+
+
+def test_score_pairs_only_predicts_uncached_pairs(monkeypatch):
+    calls = []
+
+    class FakeModel:
+        def predict(self, pairs, **kwargs):
+            calls.append([p for _, p in pairs])
+            return [float(len(p)) for _, p in pairs]
+
+    monkeypatch.setattr(reranker, "_RERANKER", FakeModel())
+    monkeypatch.setattr(reranker, "_SCORE_CACHE", reranker.OrderedDict())
+
+    assert reranker.score_pairs("q", ["a", "bb"]) == [1.0, 2.0]
+    assert reranker.score_pairs("q", ["bb", "ccc"]) == [2.0, 3.0]
+    # Second call only submits the passage not seen before
+    assert calls == [["a", "bb"], ["ccc"]]
+
+
+def test_passage_token_ids_are_reused_across_queries(monkeypatch):
+    pytest.importorskip("numpy")
+    tokenized = []
+
+    class FakeTokenizer:
+        pad_token_id = 0
+        model_max_length = 512
+
+        def __call__(self, text, pair=None, add_special_tokens=True):
+            tokenized.append(text)
+            ids = [len(w) for w in text.split()]
+            if pair is None:
+                return {"input_ids": ids}
+            pair_ids = [len(w) for w in pair.split()]
+            return {
+                "input_ids": [101] + ids + [102] + pair_ids + [102],
+                "token_type_ids": [0] * (len(ids) + 2) + [1] * (len(pair_ids) + 1),
+            }
+
+    class FakeModel:
+        tokenizer = FakeTokenizer()
+
+        def score_features(self, features):
+            return features["attention_mask"].sum(axis=1)
+
+    monkeypatch.setattr(reranker, "_RERANKER", FakeModel())
+    monkeypatch.setattr(reranker, "_SCORE_CACHE", reranker.OrderedDict())
+    monkeypatch.setattr(reranker, "_TOKEN_CACHE", reranker.OrderedDict())
+
+    # [CLS] q [SEP] p [SEP]
+    assert reranker.score_pairs("q1", ["a b", "c"]) == [6.0, 5.0]
+    tokenized.clear()
+    assert reranker.score_pairs("q2 x", ["a b", "c"]) == [7.0, 6.0]
+    # Only the new query is tokenized; passages come from the cache
+    assert tokenized == ["q2 x"]
+
+
+def test_encode_pairs_honors_left_padding():
+    pytest.importorskip("numpy")
+
+    class LeftTokenizer:
+        pad_token_id = 9
+        padding_side = "left"
+
+    template = ([101], [102], [102], None)
+    features = reranker._encode_pairs(LeftTokenizer(), template, [5], [[6, 7], [8]], 10)
+
+    assert features["input_ids"].tolist() == [
+        [101, 5, 102, 6, 7, 102],
+        [9, 101, 5, 102, 8, 102],
+    ]
+    assert features["attention_mask"].tolist() == [[1] * 6, [0] + [1] * 5]
+
+
+def test_pairs_fall_back_to_tokenizer_without_a_template(monkeypatch):
+    pytest.importorskip("numpy")
+    import numpy as np
+
+    batches = []
+
+    class OpaqueTokenizer:
+        def __call__(self, text, pair=None, **kwargs):
+            if isinstance(text, list):
+                batches.append((text, pair, kwargs["truncation"]))
+                return {"input_ids": np.ones((len(text), 3), dtype=np.int64)}
+            # Pieces never appear verbatim in the pair encoding
+            return {"input_ids": [7] if pair is None else [1, 2]}
+
+    class FakeModel:
+        tokenizer = OpaqueTokenizer()
+
+        def score_features(self, features):
+            return features["input_ids"].sum(axis=1)
+
+    monkeypatch.setattr(reranker, "_RERANKER", FakeModel())
+    monkeypatch.setattr(reranker, "_SCORE_CACHE", reranker.OrderedDict())
+
+    assert reranker.score_pairs("q", ["a", "b"]) == [3.0, 3.0]
+    assert batches == [(["q", "q"], ["a", "b"], "longest_first")]
@@ -2,13 +2,28 @@
 Unit tests for SerpAPI provider
 """
 
-from unittest.mock import Mock, patch
+import traceback
+from unittest.mock import patch
 
+import httpx
 import pytest
 
 from backend.src.services.web_search_service import SerpAPIProvider
 
 
+def mock_http(response=None, status_code=200):
+    """Patch the shared provider client with one answering every request"""
+
+    def handler(request):
+        return httpx.Response(status_code, json=response or {})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return patch(
+        "backend.src.services.web_search_service._get_http",
+        return_value=client,
+    )
+
+
 class TestSerpAPIProvider:
     """Test SerpAPI provider"""
 
@@ -31,21 +46,18 @@ class TestSerpAPIProvider:
         assert not provider.is_available()
 
     def test_is_available_no_module(self):
-        """Test provider not available without serpapi module"""
-        with patch(
-            "backend.src.services.web_search_service.os.getenv", return_value="test_key"
-        ):
-            provider = SerpAPIProvider(api_key="test_key")
+        """Test provider not available without httpx"""
+        provider = SerpAPIProvider(api_key="test_key")
 
-            with patch("builtins.__import__", side_effect=ImportError):
-                assert not provider.is_available()
+        with patch("backend.src.services.web_search_service.httpx", None):
+            assert not provider.is_available()
 
     @pytest.mark.asyncio
     async def test_search_success(self):
         """Test successful search"""
         provider = SerpAPIProvider(api_key="test_key")
 
-        # Mock serpapi module and response
+        # Mock SerpAPI response
         mock_response = {
             "organic_results": [
                 {
@@ -65,13 +77,7 @@ class TestSerpAPIProvider:
             "backend.src.services.web_search_service.SerpAPIProvider.is_available",
             return_value=True,
         ):
-            # Mock serpapi.Client where it's imported in the search method
-            with patch("serpapi.Client") as mock_client_class:
-                mock_client = Mock()
-                # client.search() returns a SerpResults object that acts like a dict
-                mock_client.search.return_value = mock_response
-                mock_client_class.return_value = mock_client
-
+            with mock_http(mock_response):
                 results = await provider.search("test query", max_results=5)
 
                 assert len(results) == 2
@@ -98,12 +104,7 @@ class TestSerpAPIProvider:
             "backend.src.services.web_search_service.SerpAPIProvider.is_available",
             return_value=True,
         ):
-            # Mock serpapi.Client where it's imported in the search method
-            with patch("serpapi.Client") as mock_client_class:
-                mock_client = Mock()
-                mock_client.search.side_effect = Exception("Invalid API key")
-                mock_client_class.return_value = mock_client
-
+            with mock_http({"error": "Invalid API key."}):
                 with pytest.raises(RuntimeError, match="SerpAPI authentication failed"):
                     await provider.search("test query")
 
@@ -116,15 +117,29 @@ class TestSerpAPIProvider:
             "backend.src.services.web_search_service.SerpAPIProvider.is_available",
             return_value=True,
         ):
-            # Mock serpapi.Client where it's imported in the search method
-            with patch("serpapi.Client") as mock_client_class:
-                mock_client = Mock()
-                mock_client.search.side_effect = Exception("Rate limit exceeded")
-                mock_client_class.return_value = mock_client
-
+            with mock_http(status_code=429):
                 with pytest.raises(RuntimeError, match="SerpAPI rate limit exceeded"):
                     await provider.search("test query")
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [500, 401])
+    async def test_search_errors_do_not_leak_api_key(self, status_code, caplog):
+        """Test the API key never reaches error messages, tracebacks or logs"""
+        provider = SerpAPIProvider(api_key="SECRET_KEY_123")
+
+        with patch(
+            "backend.src.services.web_search_service.SerpAPIProvider.is_available",
+            return_value=True,
+        ):
+            with mock_http(status_code=status_code):
+                with pytest.raises(RuntimeError) as exc:
+                    await provider.search("test query")
+
+        rendered = "".join(traceback.format_exception(exc.value))
+        assert "SECRET_KEY_123" not in str(exc.value)
+        assert "SECRET_KEY_123" not in rendered
+        assert "SECRET_KEY_123" not in caplog.text
+
     @pytest.mark.asyncio
     async def test_search_empty_results(self):
         """Test search with empty results"""
@@ -136,12 +151,7 @@ class TestSerpAPIProvider:
             "backend.src.services.web_search_service.SerpAPIProvider.is_available",
             return_value=True,
         ):
-            # Mock serpapi.Client where it's imported in the search method
-            with patch("serpapi.Client") as mock_client_class:
-                mock_client = Mock()
-                mock_client.search.return_value = mock_response
-                mock_client_class.return_value = mock_client
-
+            with mock_http(mock_response):
                 results = await provider.search("test query", max_results=5)
 
                 assert len(results) == 0
@@ -167,12 +177,7 @@ class TestSerpAPIProvider:
             "backend.src.services.web_search_service.SerpAPIProvider.is_available",
             return_value=True,
         ):
-            # Mock serpapi.Client where it's imported in the search method
-            with patch("serpapi.Client") as mock_client_class:
-                mock_client = Mock()
-                mock_client.search.return_value = mock_response
-                mock_client_class.return_value = mock_client
-
+            with mock_http(mock_response):
                 results = await provider.search("test query", max_results=3)
 
                 # Should return only 3 results
@@ -201,12 +206,7 @@ class TestSerpAPIProvider:
             "backend.src.services.web_search_service.SerpAPIProvider.is_available",
             return_value=True,
         ):
-            # Mock serpapi.Client where it's imported in the search method
-            with patch("serpapi.Client") as mock_client_class:
-                mock_client = Mock()
-                mock_client.search.return_value = mock_response
-                mock_client_class.return_value = mock_client
-
+            with mock_http(mock_response):
                 results = await provider.search("test query", max_results=5)
 
                 assert len(results) == 2
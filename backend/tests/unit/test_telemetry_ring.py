@@ -0,0 +1,60 @@
+import uuid
+
+from backend.src.services import telemetry
+
+
+def test_ring_round_trips_events_across_wraparound():
+    ring = telemetry.SharedRingBuffer(f"tlm_test_{uuid.uuid4().hex[:8]}", size=512)
+    try:
+        tail = ring.head
+        seen = []
+        for i in range(20):
+            trace_id = telemetry.new_trace_id()
+            telemetry._log_to_ring(ring, "deep_research_end", trace_id, {"i": i})
+            telemetry._log_to_ring(ring, "custom_kind", "not-hex", None)
+            records, tail, dropped = ring.read_from(tail)
+            assert dropped == 0
+            seen.extend(telemetry.decode_record(*r) for r in records)
+
+        assert len(seen) == 40
+        assert seen[-2]["kind"] == "deep_research_end"
+        assert seen[-2]["i"] == 19
+        assert seen[-2]["trace_id"] == trace_id
+        assert seen[-1]["kind"] == "custom_kind"
+        assert seen[-1]["trace_id"] == "not-hex"
+    finally:
+        ring.close()
+
+
+def test_lapped_reader_skips_overwritten_records():
+    ring = telemetry.SharedRingBuffer(f"tlm_test_{uuid.uuid4().hex[:8]}", size=256)
+    try:
+        for i in range(50):
+            telemetry._log_to_ring(ring, "deep_research_start", telemetry.new_trace_id(), {"i": i})
+        records, tail, dropped = ring.read_from(0)
+        assert records == []
+        assert dropped == tail == ring.head
+
+        telemetry._log_to_ring(ring, "deep_research_start", telemetry.new_trace_id(), {"i": 50})
+        records, tail, dropped = ring.read_from(tail)
+        assert [telemetry.decode_record(*r)["i"] for r in records] == [50]
+    finally:
+        ring.close()
+
+
+def test_oversized_payload_is_replaced_by_counted_marker():
+    ring = telemetry.SharedRingBuffer(f"tlm_test_{uuid.uuid4().hex[:8]}", size=1 << 18)
+    try:
+        before = telemetry.truncated_records()
+        trace_id = telemetry.new_trace_id()
+        telemetry._log_to_ring(ring, "deep_research_end", trace_id, {"blob": "x" * 70_000})
+        records, _, _ = ring.read_from(0)
+
+        event = telemetry.decode_record(*records[0])
+        assert event["truncated"] is True
+        assert event["payload_bytes"] > telemetry._MAX_PAYLOAD
+        assert event["trace_id"] == trace_id
+        assert event["ts"].endswith("Z") and "+00:00" not in event["ts"]
+        assert telemetry.truncated_records() == before + 1
+    finally:
+        ring.close()
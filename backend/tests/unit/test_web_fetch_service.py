@@ -2,6 +2,7 @@
 Unit tests for web fetch service
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -10,10 +11,45 @@ import pytest
 from backend.src.services.web_fetch_service import (
     FetchResult,
     WebFetchService,
+    _POOLED_BUFFER_MAX_BYTES,
+    _sniff_content_kind,
     get_web_fetch_service,
 )
 
 
+def _mock_stream_client(response=None, exc=None):
+    """AsyncClient mock whose stream() yields ``response`` or raises ``exc``"""
+
+    class _Stream:
+        async def __aenter__(self):
+            if exc is not None:
+                raise exc
+            return response
+
+        async def __aexit__(self, *args):
+            return None
+
+    client = AsyncMock()
+    client.stream = Mock(side_effect=lambda *a, **k: _Stream())
+    return client
+
+
+def _mock_stream_response(body: bytes, headers: dict, url: str):
+    response = Mock()
+    response.status_code = 200
+    response.headers = headers
+    response.url = url
+    response.charset_encoding = None
+    response.raise_for_status = Mock()
+
+    async def aiter_bytes(chunk_size=None):
+        for i in range(0, len(body), chunk_size or len(body) or 1):
+            yield body[i : i + (chunk_size or len(body))]
+
+    response.aiter_bytes = aiter_bytes
+    return response
+
+
 class TestFetchResult:
     """Test FetchResult dataclass"""
 
@@ -146,6 +182,54 @@ class TestWebFetchService:
         # Non-existent URL should return None
         assert service._get_cached_result("https://other.com") is None
 
+    def test_cache_expires_after_ttl(self):
+        """Test that cached results expire on the monotonic clock"""
+        service = WebFetchService(enabled=False, cache_ttl=60)
+        result = FetchResult(
+            url="https://example.com",
+            canonical_url="https://example.com",
+            content="Test",
+            content_type="text/html",
+            title=None,
+            published_at=None,
+            extracted_at=datetime.now(),
+            tokens_estimate=1,
+        )
+
+        with patch("backend.src.services.web_fetch_service.time.monotonic", return_value=1000.0):
+            service._cache_result("https://example.com", result)
+        with patch("backend.src.services.web_fetch_service.time.monotonic", return_value=1059.0):
+            assert service._get_cached_result("https://example.com") is result
+        with patch("backend.src.services.web_fetch_service.time.monotonic", return_value=1061.0):
+            assert service._get_cached_result("https://example.com") is None
+        assert "https://example.com" not in service._cache
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that a cache hit protects an entry from eviction"""
+        service = WebFetchService(enabled=False)
+
+        def result(url):
+            return FetchResult(
+                url=url,
+                canonical_url=url,
+                content="Test",
+                content_type="text/html",
+                title=None,
+                published_at=None,
+                extracted_at=datetime.now(),
+                tokens_estimate=1,
+            )
+
+        for i in range(200):
+            service._cache_result(f"https://example.com/{i}", result(f"{i}"))
+        assert service._get_cached_result("https://example.com/0") is not None
+
+        service._cache_result("https://example.com/new", result("new"))
+
+        assert len(service._cache) == 200
+        assert "https://example.com/0" in service._cache
+        assert "https://example.com/1" not in service._cache
+
     def test_estimate_tokens(self):
         """Test token estimation"""
         service = WebFetchService(enabled=False)
@@ -157,6 +241,9 @@ class TestWebFetchService:
         assert tokens > 0
         assert tokens == int(len(text.split()) * 1.3)
 
+        # Newlines, tabs and repeated spaces separate words like single spaces
+        assert service._estimate_tokens("one\ntwo\tthree   four") == int(4 * 1.3)
+
     @pytest.mark.asyncio
     async def test_fetch_url_disabled(self):
         """Test fetch_url when service is disabled"""
@@ -197,21 +284,13 @@ class TestWebFetchService:
         """Test successful HTML fetch"""
         service = WebFetchService(enabled=True, concurrency=1)
 
-        # Mock httpx response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {"content-type": "text/html", "content-length": "1000"}
-        mock_response.url = "https://example.com/page"
-        mock_response.text = (
-            "<html><head><title>Test</title></head><body>Test content</body></html>"
+        # Mock streamed httpx response
+        mock_response = _mock_stream_response(
+            b"<html><head><title>Test</title></head><body>Test content</body></html>",
+            {"content-type": "text/html", "content-length": "1000"},
+            "https://example.com/page",
         )
-        mock_response.raise_for_status = Mock()
-
-        # Mock httpx client
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client = _mock_stream_client(mock_response)
 
         import httpx as httpx_module
 
@@ -229,23 +308,113 @@ class TestWebFetchService:
                     assert result.canonical_url == "https://example.com/page"
                     assert result.content_type == "text/html"
 
+    @pytest.mark.asyncio
+    async def test_fetch_url_reuses_receive_buffer(self):
+        """Test that a pooled buffer is reused without leaking the previous body"""
+        pytest.importorskip("bs4")
+        service = WebFetchService(enabled=True)
+        pages = {
+            "https://example.com/long": b"<html><head><title>Long</title></head><body><p>"
+            + b"first " * 200
+            + b"</p></body></html>",
+            "https://example.com/short": b"<html><head><title>Short</title></head><body><p>second</p></body></html>",
+        }
+
+        import httpx as httpx_module
+
+        async def fetch(url):
+            client = _mock_stream_client(
+                _mock_stream_response(pages[url], {"content-type": "text/html"}, url)
+            )
+            service._client = None
+            with patch.object(httpx_module, "AsyncClient", return_value=client):
+                with patch.object(service, "_extraction_libs", {"beautifulsoup": True}):
+                    return await service.fetch_url(url)
+
+        await fetch("https://example.com/long")
+        first_buf = service._buffer_pool[0]
+        result = await fetch("https://example.com/short")
+
+        assert len(service._buffer_pool) == 1
+        assert service._buffer_pool[0] is first_buf
+        assert result.title == "Short"
+        assert "first" not in result.content
+
+    def test_oversized_buffers_are_not_pooled(self):
+        """Test that buffers grown past the pool cap are dropped on return"""
+        service = WebFetchService(enabled=True)
+
+        service._return_buf(bytearray(_POOLED_BUFFER_MAX_BYTES + 1))
+        assert len(service._buffer_pool) == 0
+
+        service._return_buf(bytearray(_POOLED_BUFFER_MAX_BYTES))
+        assert len(service._buffer_pool) == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_url_caches_redirected_page_under_requested_url(self):
+        """Test that a page reached through a redirect is served from cache next time"""
+        pytest.importorskip("bs4")
+        service = WebFetchService(enabled=True)
+        body = b"<html><head><title>Moved</title></head><body><p>" + b"text " * 50 + b"</p></body></html>"
+        mock_client = _mock_stream_client(
+            _mock_stream_response(body, {"content-type": "text/html"}, "https://example.com/new")
+        )
+
+        import httpx as httpx_module
+
+        with patch.object(httpx_module, "AsyncClient", return_value=mock_client):
+            with patch.object(service, "_extraction_libs", {"beautifulsoup": True}):
+                first = await service.fetch_url("https://example.com/old")
+                second = await service.fetch_url("https://example.com/old")
+
+        assert first.canonical_url == "https://example.com/new"
+        assert second is first
+        assert mock_client.stream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_url_revalidates_expired_entry(self):
+        """Test that an expired entry with an ETag is revalidated and refreshed on 304"""
+        service = WebFetchService(enabled=True, cache_ttl=60)
+        cached = FetchResult(
+            url="https://example.com/page",
+            canonical_url="https://example.com/page",
+            content="Cached",
+            content_type="text/html",
+            title=None,
+            published_at=None,
+            extracted_at=datetime.now(),
+            tokens_estimate=1,
+        )
+        with patch("backend.src.services.web_fetch_service.time.monotonic", return_value=1000.0):
+            service._cache_result("https://example.com/page", cached, {"If-None-Match": '"v1"'})
+
+        not_modified = _mock_stream_response(b"", {}, "https://example.com/page")
+        not_modified.status_code = 304
+        mock_client = _mock_stream_client(not_modified)
+
+        import httpx as httpx_module
+
+        with patch.object(httpx_module, "AsyncClient", return_value=mock_client):
+            with patch("backend.src.services.web_fetch_service.time.monotonic", return_value=1100.0):
+                result = await service.fetch_url("https://example.com/page")
+                assert service._get_cached_result("https://example.com/page") is cached
+
+        assert result is cached
+        assert mock_client.stream.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
     @pytest.mark.asyncio
     async def test_fetch_url_timeout(self):
         """Test fetch_url with timeout"""
         service = WebFetchService(enabled=True, timeout_ms=100)
 
-        # Mock timeout exception
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-
         try:
             import httpx as httpx_module
         except ImportError:
             pytest.skip("httpx not installed")
 
-        mock_client.get = AsyncMock(
-            side_effect=httpx_module.TimeoutException("Timeout")
+        # Mock timeout exception
+        mock_client = _mock_stream_client(
+            exc=httpx_module.TimeoutException("Timeout")
         )
 
         with patch.object(httpx_module, "AsyncClient", return_value=mock_client):
@@ -272,11 +441,8 @@ class TestWebFetchService:
         mock_response = Mock()
         mock_response.status_code = 404
 
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-        mock_client.get = AsyncMock(
-            side_effect=httpx_module.HTTPStatusError(
+        mock_client = _mock_stream_client(
+            exc=httpx_module.HTTPStatusError(
                 "Not found", request=Mock(), response=mock_response
             )
         )
@@ -291,6 +457,177 @@ class TestWebFetchService:
                 assert "404" in result.error
                 assert result.content is None
 
+    @pytest.mark.asyncio
+    async def test_fetch_url_reuses_shared_client(self):
+        """Test that one pooled AsyncClient serves every fetch until aclose()"""
+        service = WebFetchService(enabled=True)
+
+        import httpx as httpx_module
+
+        mock_client = _mock_stream_client(
+            exc=httpx_module.TimeoutException("Timeout")
+        )
+
+        with patch.object(
+            httpx_module, "AsyncClient", return_value=mock_client
+        ) as client_cls:
+            service.enabled = True
+            await service.fetch_url("https://example.com/1")
+            await service.fetch_url("https://example.org/2")
+
+            assert client_cls.call_count == 1
+            assert mock_client.stream.call_count == 2
+
+            await service.aclose()
+            mock_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_client_from_previous_loop_is_closed(self):
+        """Test that a loop change closes the old client before building a new one"""
+        service = WebFetchService(enabled=True)
+        stale = AsyncMock()
+        service._client, service._client_loop = stale, object()
+
+        import httpx as httpx_module
+
+        with patch.object(httpx_module, "AsyncClient") as client_cls:
+            client = await service._get_client(httpx_module)
+
+        stale.aclose.assert_awaited_once()
+        assert client is client_cls.return_value
+        assert service._client_loop is asyncio.get_running_loop()
+
+    @pytest.mark.asyncio
+    async def test_fetch_url_stops_streaming_past_max_bytes(self):
+        """Test that a body larger than max_bytes is rejected without a Content-Length"""
+        service = WebFetchService(enabled=True, max_bytes=100_000)
+        mock_response = _mock_stream_response(
+            b"<html>" + b"x" * 500_000, {"content-type": "text/html"}, "https://example.com/big"
+        )
+
+        import httpx as httpx_module
+
+        with patch.object(
+            httpx_module, "AsyncClient", return_value=_mock_stream_client(mock_response)
+        ):
+            service.enabled = True
+            result = await service.fetch_url("https://example.com/big")
+
+        assert "too large" in result.error.lower()
+        assert result.content is None
+        assert service.get_stats()["failures_by_reason"] == {"too_large": 1}
+
+    @pytest.mark.asyncio
+    async def test_fetch_url_head_preflight_skips_oversized_body(self):
+        """Test that HEAD preflight rejects an announced oversized body before GET"""
+        service = WebFetchService(enabled=True, max_bytes=100_000, head_preflight=True)
+        head_response = Mock()
+        head_response.headers = {"content-length": "500000", "content-type": "application/pdf"}
+        head_response.url = "https://example.com/big.pdf"
+        mock_client = _mock_stream_client()
+        mock_client.head = AsyncMock(return_value=head_response)
+
+        import httpx as httpx_module
+
+        with patch.object(httpx_module, "AsyncClient", return_value=mock_client):
+            result = await service.fetch_url("https://example.com/big.pdf")
+
+        assert "too large" in result.error.lower()
+        mock_client.stream.assert_not_called()
+
+    def test_sniff_content_kind_prefers_magic_bytes(self):
+        """Test that leading bytes override a missing or wrong Content-Type"""
+        assert _sniff_content_kind(b"%PDF-1.7\n...", "text/html") == "pdf"
+        assert _sniff_content_kind(b"\xef\xbb\xbf\n<!DOCTYPE html><p>x", "application/octet-stream") == "html"
+        assert _sniff_content_kind(b"<?xml version='1.0'?>", "application/xhtml+xml") == "html"
+        assert _sniff_content_kind(b"{}", "application/json") is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_url_pdf_success(self):
+        """Test that a streamed PDF body is extracted"""
+        pymupdf = pytest.importorskip("pymupdf")
+        doc = pymupdf.open()
+        doc.new_page().insert_text((50, 50), "Hello from a PDF")
+        pdf_bytes = doc.tobytes()
+        doc.close()
+
+        service = WebFetchService(enabled=True)
+        mock_response = _mock_stream_response(
+            pdf_bytes, {"content-type": "application/pdf"}, "https://example.com/a.pdf"
+        )
+
+        import httpx as httpx_module
+
+        with patch.object(
+            httpx_module, "AsyncClient", return_value=_mock_stream_client(mock_response)
+        ):
+            service.enabled = True
+            result = await service.fetch_url("https://example.com/a.pdf")
+
+        assert result.error is None
+        assert "Hello from a PDF" in result.content
+
+    @pytest.mark.asyncio
+    async def test_readability_extracts_published_date_from_meta(self):
+        """Test that the readability branch reads the published date from meta tags"""
+        pytest.importorskip("bs4")
+        pytest.importorskip("readability")
+        service = WebFetchService(enabled=False)
+        html = (
+            "<html><head><title>Post</title>"
+            '<meta name="datePublished" content="2024-01-02T03:04:05Z"></head>'
+            "<body><article><p>" + "Article text. " * 50 + "</p></article></body></html>"
+        )
+
+        with patch.object(
+            service, "_extraction_libs", {"readability": True, "beautifulsoup": True}
+        ):
+            content, title, published_at = await service._extract_html_content(
+                html, "https://example.com"
+            )
+
+        assert "Article text." in content
+        assert title == "Post"
+        assert published_at.isoformat() == "2024-01-02T03:04:05+00:00"
+
+    @pytest.mark.asyncio
+    async def test_trafilatura_returns_text_and_metadata(self):
+        """Test that the trafilatura branch yields text, title and date in one pass"""
+        pytest.importorskip("trafilatura")
+        service = WebFetchService(enabled=False)
+        html = (
+            "<html><head><title>Post</title>"
+            '<meta property="article:published_time" content="2024-03-01"></head>'
+            "<body><article><h1>Post</h1><p>" + "Article text goes here. " * 30 + "</p></article></body></html>"
+        )
+
+        with patch.object(service, "_extraction_libs", {"trafilatura": True}):
+            content, title, published_at = await service._extract_html_content(
+                html, "https://example.com"
+            )
+
+        assert "Article text goes here." in content
+        assert title == "Post"
+        assert published_at.date().isoformat() == "2024-03-01"
+
+    @pytest.mark.asyncio
+    async def test_large_html_is_extracted_in_process_pool(self):
+        """Test that large pages are extracted off the event loop in the pool"""
+        pytest.importorskip("bs4")
+        service = WebFetchService(enabled=True)
+        html = "<html><head><title>Big</title></head><body>" + "<p>word</p>" * 10_000 + "</body></html>"
+
+        with patch.object(service, "_extraction_libs", {"beautifulsoup": True}):
+            content, title, _ = await service._extract_html_content(html, "https://example.com")
+
+        try:
+            assert service._extract_pool is not None
+            assert title == "Big"
+            assert content.count("word") == 10_000
+        finally:
+            await service.aclose()
+        assert service._extract_pool is None
+
     @pytest.mark.asyncio
     async def test_fetch_multiple_disabled(self):
         """Test fetch_multiple when service is disabled"""
@@ -330,6 +667,37 @@ class TestWebFetchService:
             # Should only fetch first 2
             assert mock_fetch.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_fetch_multiple_iter_yields_in_completion_order(self):
+        """Test that fetch_multiple_iter streams results and isolates failures"""
+        import asyncio
+
+        service = WebFetchService(enabled=True, max_fetch=3)
+
+        async def fake_fetch(url):
+            if url.endswith("/boom"):
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.05 if url.endswith("/slow") else 0)
+            return FetchResult(
+                url=url,
+                canonical_url=url,
+                content="ok",
+                content_type="text/html",
+                title=None,
+                published_at=None,
+                extracted_at=datetime.now(),
+                tokens_estimate=1,
+            )
+
+        urls = ["https://example.com/slow", "https://example.com/boom", "https://example.com/fast"]
+        with patch.object(service, "fetch_url", side_effect=fake_fetch):
+            results = [r async for r in service.fetch_multiple_iter(urls)]
+            ordered = await service.fetch_multiple(urls)
+
+        assert results[-1].url == "https://example.com/slow"
+        assert {r.url: r.error for r in results}["https://example.com/boom"] == "boom"
+        assert [r.url for r in ordered] == urls
+
     def test_get_stats(self):
         """Test get_stats method"""
         service = WebFetchService(enabled=True)
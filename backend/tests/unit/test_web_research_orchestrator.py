@@ -0,0 +1,357 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from backend.src.services import web_research_orchestrator as wro
+from backend.src.services.web_research_orchestrator import WebResearchOrchestrator
+
+
+class DummyRes:
+    def __init__(self, title, url, snippet=""):
+        self.title = title
+        self.url = url
+        self.snippet = snippet
+        self.relevance_score = 1.0
+
+
+class DummyFetch:
+    def __init__(self, url, content, canonical_url=None):
+        self.url = url
+        self.canonical_url = canonical_url or url
+        self.content = content
+        self.tokens_estimate = len(content.split())
+        self.published_at = None
+        self.title = None
+        self.trust_score = 0.8
+        self.is_suspicious = False
+        self.domain = "example.com"
+
+
+class DummySearchSvc:
+    provider_name = "dummy"
+    impl = "custom"
+    primary_provider = None
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = 0
+
+    async def search(self, q, max_results=5, use_cache=True, force_fresh=False):
+        self.calls += 1
+        return list(self.results)
+
+
+class DummyFetchSvc:
+    enabled = True
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    async def fetch_multiple(self, urls):
+        self.calls.append(list(urls))
+        return [self.pages[u] for u in urls if u in self.pages]
+
+
+class DummyAI:
+    def __init__(self):
+        self.prompts = []
+
+    async def generate_response(self, prompt, context=None, max_tokens=1024):
+        self.prompts.append(prompt)
+        return {"response": "ok"}
+
+
+@pytest.fixture
+def ai(monkeypatch):
+    dummy = DummyAI()
+
+    async def fake_get_ai_service(model):
+        return dummy
+
+    monkeypatch.setattr(wro, "_get_ai_service", fake_get_ai_service)
+    monkeypatch.setenv("WEB_SYNTH_CACHE_TTL", "0")
+    return dummy
+
+
+def _orchestrator(results, pages):
+    orch = WebResearchOrchestrator()
+    orch.web_search = DummySearchSvc(results)  # type: ignore
+    orch.web_fetch = DummyFetchSvc(pages)  # type: ignore
+    return orch
+
+
+@pytest.mark.asyncio
+async def test_run_joins_fetches_by_url_or_canonical_url(ai):
+    results = [
+        DummyRes("A", "http://a", "snippet a"),
+        DummyRes("A again", "http://a"),
+        DummyRes("B", "http://b", "snippet b"),
+    ]
+    pages = {
+        "http://a": DummyFetch("http://a", "alpha body"),
+        "http://b": DummyFetch("http://b-redirect", "beta body", canonical_url="http://b"),
+    }
+    orch = _orchestrator(results, pages)
+
+    out = await orch.run("alpha beta", max_fetch=2)
+
+    assert out["web_results_count"] == 2
+    assert [c["url"] for c in out["citations"]] == ["http://a", "http://b"]
+    assert [c["title"] for c in out["citations"]] == ["A", "B"]
+    assert [c["snippet"] for c in out["citations"]] == ["alpha body", "beta body"]
+    assert out["citations"][1]["trust"] == 0.8
+
+
+@pytest.mark.asyncio
+async def test_ai_service_resolves_while_search_runs(monkeypatch):
+    monkeypatch.setenv("WEB_SYNTH_CACHE_TTL", "0")
+    resolving = asyncio.Event()
+
+    async def fake_get_ai_service(model):
+        resolving.set()
+        return DummyAI()
+
+    class WaitingSearchSvc(DummySearchSvc):
+        async def search(self, q, **kwargs):
+            # Would deadlock if the AI service were only resolved after search
+            await resolving.wait()
+            return await super().search(q, **kwargs)
+
+    monkeypatch.setattr(wro, "_get_ai_service", fake_get_ai_service)
+    orch = _orchestrator([], {})
+    orch.web_search = WaitingSearchSvc([DummyRes("A", "http://a", "snippet")])  # type: ignore
+
+    out = await asyncio.wait_for(orch.run("q", max_fetch=1), timeout=2)
+
+    assert out["response"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_ai_service_task_is_cancelled_when_fetch_fails(monkeypatch):
+    monkeypatch.setenv("WEB_SYNTH_CACHE_TTL", "0")
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fake_get_ai_service(model):
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    class FailingFetchSvc(DummyFetchSvc):
+        async def fetch_multiple(self, urls):
+            await started.wait()
+            raise RuntimeError("fetch down")
+
+    monkeypatch.setattr(wro, "_get_ai_service", fake_get_ai_service)
+    orch = _orchestrator([DummyRes("A", "http://a", "snippet")], {})
+    orch.web_fetch = FailingFetchSvc({})  # type: ignore
+
+    with pytest.raises(RuntimeError, match="fetch down"):
+        await orch.run("q", max_fetch=1)
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_deepen_uses_pages_prefetched_with_first_batch(ai, monkeypatch):
+    monkeypatch.setenv("WEB_AGENT_DEEPEN", "true")
+    monkeypatch.setenv("WEB_AGENT_DEEPEN_MIN_TOKENS", "1000")
+    urls = [f"http://{c}" for c in "abcd"]
+    orch = _orchestrator(
+        [DummyRes(u[-1].upper(), u) for u in urls],
+        {u: DummyFetch(u, f"body of {u}") for u in urls},
+    )
+
+    out = await orch.run("q", max_fetch=2)
+
+    assert orch.web_fetch.calls == [urls[:2], urls[2:]]
+    assert [c["url"] for c in out["citations"]] == urls
+    assert ai.prompts[0].count("\nURL: ") == 4
+    assert "[3] C\nURL: http://c\nContent:\nbody of http://c\n" in ai.prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_confident_pack_cancels_spare_prefetch(ai, monkeypatch):
+    monkeypatch.setenv("WEB_AGENT_DEEPEN", "true")
+    monkeypatch.setenv("WEB_AGENT_DEEPEN_MIN_DOCS", "1")
+    monkeypatch.setenv("WEB_AGENT_DEEPEN_MIN_TOKENS", "0")
+    spare_started = asyncio.Event()
+    cancelled = asyncio.Event()
+    urls = [f"http://{c}" for c in "abcd"]
+
+    class SlowSpareFetchSvc(DummyFetchSvc):
+        async def fetch_multiple(self, urls):
+            if urls[0] == "http://a":
+                await spare_started.wait()
+            else:
+                spare_started.set()
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return await super().fetch_multiple(urls)
+
+    orch = _orchestrator([DummyRes(u[-1].upper(), u) for u in urls], {})
+    orch.web_fetch = SlowSpareFetchSvc({u: DummyFetch(u, f"body of {u}") for u in urls})  # type: ignore
+
+    out = await asyncio.wait_for(orch.run("q", max_fetch=2), timeout=2)
+
+    assert [c["url"] for c in out["citations"]] == urls[:2]
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+def test_synth_cache_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(wro, "_SYNTH_CACHE", wro.OrderedDict())
+    monkeypatch.setattr(wro, "_SYNTH_CACHE_MAX", 2)
+
+    wro._synth_cache_put("a", {"response": "a"})
+    wro._synth_cache_put("b", {"response": "b"})
+    assert wro._synth_cache_get("a", 300) == ({"response": "a"}, False)
+    wro._synth_cache_put("c", {"response": "c"})
+
+    assert list(wro._SYNTH_CACHE) == ["a", "c"]
+    assert wro._synth_cache_get("c", -1) == (None, False)
+    assert "c" not in wro._SYNTH_CACHE
+
+
+def test_is_time_sensitive_matches_keywords_case_insensitively():
+    assert wro._is_time_sensitive("Latest Python release")
+    assert wro._is_time_sensitive("what happened THIS WEEK")
+    assert not wro._is_time_sensitive("python list comprehension")
+    assert not wro._is_time_sensitive("")
+
+
+@pytest.mark.asyncio
+async def test_prompt_header_is_read_once(ai):
+    orch = _orchestrator([DummyRes("A", "http://a", "snippet")], {})
+    misses = wro._load_prompt_cached.cache_info().misses
+
+    await orch.run("q one", max_fetch=1)
+    await orch.run("q two", max_fetch=1)
+
+    assert wro._load_prompt_cached.cache_info().misses == misses
+    assert all(p.startswith(orch._prompt_header) for p in ai.prompts)
+
+
+@pytest.mark.asyncio
+async def test_redis_synth_cache_round_trip(ai, monkeypatch):
+    store = {}
+
+    class FakeRedis:
+        async def get(self, key):
+            return store.get(key)
+
+        async def setex(self, key, ttl, value):
+            store[key] = value
+
+    async def fake_aget_redis():
+        return FakeRedis()
+
+    monkeypatch.setenv("WEB_SYNTH_CACHE_TTL", "300")
+    monkeypatch.setattr(wro, "aget_redis", fake_aget_redis)
+    monkeypatch.setattr(wro, "_SYNTH_CACHE", wro.OrderedDict())
+    orch = _orchestrator([DummyRes("A", "http://a", "snippet")], {})
+
+    first = await orch.run("redis query", max_fetch=1)
+    wro._SYNTH_CACHE.clear()
+    second = await orch.run("redis query", max_fetch=1)
+
+    assert second == first
+    assert orch.web_search.calls == 1
+
+
+def test_extract_quotes_ranks_sentences_by_query_overlap():
+    q_tokens = wro._query_tokens("Python asyncio TaskGroup")
+    text = "Cats sleep a lot. Python 3.11 added TaskGroup to asyncio! Python is popular"
+
+    assert wro._extract_quotes(text, q_tokens) == [
+        "Python 3.11 added TaskGroup to asyncio!",
+        "Python is popular",
+    ]
+    assert wro._simple_overlap_score("", q_tokens) == 0.0
+
+
+def test_evidence_caps_content_and_derives_snippet():
+    ev = wro.Evidence(title="t", url="u", content="x" * 9000, tokens=1)
+
+    assert len(ev.content) == wro._MAX_EVIDENCE_CHARS
+    assert ev.snippet == "x" * wro._SNIPPET_CHARS
+
+
+@pytest.mark.asyncio
+async def test_stale_synthesis_is_served_while_refreshing(ai, monkeypatch):
+    monkeypatch.setenv("WEB_SYNTH_CACHE_TTL", "300")
+    monkeypatch.setattr(wro, "_SYNTH_CACHE", wro.OrderedDict())
+    key = "default:::swr query"
+    stale = {"response": "stale"}
+    wro._SYNTH_CACHE[key] = (time.monotonic() - 400, stale)
+    orch = _orchestrator([DummyRes("A", "http://a", "snippet")], {})
+
+    assert await orch.run("swr query", max_fetch=1) is stale
+    assert await orch.run("swr query", max_fetch=1) is stale
+    await wro._REFRESH_INFLIGHT[key]
+
+    assert orch.web_search.calls == 1
+    assert key not in wro._REFRESH_INFLIGHT
+    assert wro._synth_cache_get(key, 300)[0]["response"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_synthesis_cache_key_ignores_case_and_spacing(ai, monkeypatch):
+    monkeypatch.setenv("WEB_SYNTH_CACHE_TTL", "300")
+    monkeypatch.setattr(wro, "_SYNTH_CACHE", wro.OrderedDict())
+    orch = _orchestrator([DummyRes("A", "http://a", "snippet")], {})
+
+    first = await orch.run("Rust  borrow checker", max_fetch=1)
+    second = await orch.run(" rust borrow Checker ", max_fetch=1)
+
+    assert second is first
+    assert orch.web_search.calls == 1
+
+
+def test_overlap_score_without_query_tokens_is_zero():
+    assert wro._query_tokens("a is of") == set()
+    assert wro._simple_overlap_score("some page text", set()) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_pipeline(ai):
+    gate = asyncio.Event()
+
+    class SlowSearchSvc(DummySearchSvc):
+        async def search(self, q, **kwargs):
+            await gate.wait()
+            return await super().search(q, **kwargs)
+
+    orch = _orchestrator([], {})
+    orch.web_search = SlowSearchSvc([DummyRes("A", "http://a", "snippet")])  # type: ignore
+
+    runs = [asyncio.create_task(orch.run("same query", max_fetch=1)) for _ in range(5)]
+    await asyncio.sleep(0)
+    gate.set()
+    outs = await asyncio.gather(*runs)
+
+    assert orch.web_search.calls == 1
+    assert all(out is outs[0] for out in outs)
+    assert not wro._INFLIGHT
+
+
+def test_render_evidence_numbers_blocks_from_start():
+    evidence = [
+        wro.Evidence(title="A", url="http://a", content="alpha", tokens=1),
+        wro.Evidence(
+            title="B", url="http://b", content="beta", tokens=1,
+            published_at=datetime(2024, 5, 1),
+        ),
+    ]
+
+    assert wro._render_evidence(evidence, 3) == [
+        "[3] A\nURL: http://a\nContent:\nalpha\n",
+        "[4] B (published 2024-05-01)\nURL: http://b\nContent:\nbeta\n",
+    ]
@@ -0,0 +1,310 @@
+import asyncio
+import threading
+import traceback
+
+import pytest
+
+from backend.src.services import web_search_lc_providers as lcp
+from backend.src.services.web_search_service import SearchResult
+
+
+class CountingProvider(lcp._BaseLCProvider):
+    name = "counting"
+
+    def __init__(self, results=None):
+        self.results = results
+        self.calls = []
+
+    async def _search(self, query, max_results):
+        self.calls.append((query, max_results))
+        if self.results is not None:
+            return list(self.results)
+        return [
+            SearchResult(title=f"t{i}", url=f"http://r{i}", snippet="", source="web_search")
+            for i in range(max_results)
+        ]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(lcp, "_RESULT_CACHE", lcp.OrderedDict())
+    lcp._env.cache_clear()
+    yield
+    lcp._env.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_served_from_cache():
+    provider = CountingProvider()
+
+    first = await provider.search("Python  asyncio", 3)
+    second = await provider.search("python asyncio ", 3)
+    second.pop()
+
+    assert provider.calls == [("Python  asyncio", 3)]
+    assert [r.url for r in first] == [r.url for r in await provider.search("python asyncio", 3)]
+    await provider.search("python asyncio", 2)
+    assert len(provider.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_and_evicts(monkeypatch):
+    provider = CountingProvider()
+    monkeypatch.setattr(lcp, "_CACHE_MAX", 2)
+
+    for q in ("a", "b", "c"):
+        await provider.search(q, 1)
+    assert [k[1] for k in lcp._RESULT_CACHE] == ["b", "c"]
+
+    monkeypatch.setattr(lcp, "_CACHE_TTL", 0)
+    await provider.search("c", 1)
+    assert len(provider.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_empty_results_are_cached_for_the_shorter_ttl(monkeypatch):
+    provider = CountingProvider(results=[])
+
+    assert await provider.search("nothing", 5) == []
+    assert await provider.search("nothing", 5) == []
+    assert len(provider.calls) == 1
+
+    monkeypatch.setattr(lcp, "_NEG_TTL", 0)
+    assert await provider.search("nothing", 5) == []
+    assert len(provider.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_errors_are_cached_per_provider():
+    class Failing(CountingProvider):
+        name = "failing"
+
+        async def _search(self, query, max_results):
+            self.calls.append((query, max_results))
+            raise RuntimeError("rate limited")
+
+    failing = Failing()
+    with pytest.raises(RuntimeError, match="rate limited") as first:
+        await failing.search("storm", 3)
+    with pytest.raises(RuntimeError, match="failing recently failed") as cached:
+        await failing.search("storm", 3)
+    assert cached.value.__cause__ is first.value
+    assert len(failing.calls) == 1
+
+    healthy = CountingProvider()
+    assert len(await healthy.search("storm", 3)) == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_call():
+    gate = asyncio.Event()
+
+    class SlowProvider(CountingProvider):
+        async def _search(self, query, max_results):
+            await gate.wait()
+            return await super()._search(query, max_results)
+
+    provider = SlowProvider()
+    tasks = [asyncio.create_task(provider.search("same", 2)) for _ in range(4)]
+    await asyncio.sleep(0)
+    gate.set()
+    outs = await asyncio.gather(*tasks)
+
+    assert len(provider.calls) == 1
+    assert all(len(out) == 2 for out in outs)
+    assert not lcp._INFLIGHT
+
+
+@pytest.mark.asyncio
+async def test_duckduckgo_wrapper_runs_off_the_event_loop(monkeypatch):
+    utilities = pytest.importorskip("langchain_community.utilities")
+    loop_thread = threading.get_ident()
+    seen = {}
+
+    class FakeDDG:
+        def results(self, query, max_results=5):
+            seen["thread"] = threading.get_ident()
+            return [{"title": "T", "link": "http://t", "snippet": "s"}]
+
+    monkeypatch.setattr(utilities, "DuckDuckGoSearchAPIWrapper", FakeDDG, raising=False)
+    lcp._get_ddg.cache_clear()
+    try:
+        out = await lcp.LangChainDuckDuckGoProvider().search("ddg query", 3)
+        await lcp.LangChainDuckDuckGoProvider().search("other query", 3)
+        assert lcp._get_ddg.cache_info().misses == 1
+    finally:
+        lcp._get_ddg.cache_clear()
+
+    assert [r.url for r in out] == ["http://t"]
+    assert seen["thread"] != loop_thread
+
+
+def test_build_results_normalizes_fallback_keys():
+    items = [
+        {"title": "A", "url": "http://a", "content": "x" * 600},
+        {"link": "http://b", "snippet": "b"},
+        {"title": "C"},
+    ]
+
+    out = lcp._BaseLCProvider._build_results(
+        items, ("title",), ("link", "url"), ("snippet", "content"), 2
+    )
+
+    assert [(r.title, r.url) for r in out] == [("A", "http://a"), ("No title", "http://b")]
+    assert len(out[0].snippet) == 500
+    assert out[0].relevance_score > out[1].relevance_score
+    assert out[0].timestamp is out[1].timestamp
+
+
+@pytest.mark.asyncio
+async def test_upstream_calls_are_bounded_per_provider(monkeypatch):
+    monkeypatch.setattr(lcp, "_SEMAPHORES", {})
+    monkeypatch.setenv("WEB_SEARCH_MAX_CONCURRENCY_COUNTING", "2")
+    gate = asyncio.Event()
+    active = peak = 0
+
+    class SlowProvider(CountingProvider):
+        async def _search(self, query, max_results):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await gate.wait()
+            active -= 1
+            return await super()._search(query, max_results)
+
+    provider = SlowProvider()
+    tasks = [asyncio.create_task(provider.search(f"q{i}", 1)) for i in range(5)]
+    for _ in range(10):
+        await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    assert peak == 2
+    assert len(provider.calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_serpapi_calls_rest_endpoint_directly(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    seen = {}
+
+    def handler(request):
+        seen["params"] = dict(request.url.params)
+        return httpx.Response(
+            200,
+            json={"organic_results": [{"title": "S", "link": "http://s", "snippet": "x"}]},
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def get_http():
+        return client
+
+    monkeypatch.setattr(lcp, "_get_http", get_http)
+    monkeypatch.setenv("SERPAPI_API_KEY", "k")
+
+    out = await lcp.LangChainSerpAPIProvider().search("serp query", 3)
+    await client.aclose()
+
+    assert [r.url for r in out] == ["http://s"]
+    assert seen["params"]["q"] == "serp query"
+    assert seen["params"]["num"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_serpapi_errors_do_not_carry_the_api_key(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(500)))
+
+    async def get_http():
+        return client
+
+    monkeypatch.setattr(lcp, "_get_http", get_http)
+    monkeypatch.setenv("SERPAPI_API_KEY", "SECRET_KEY_123")
+    lcp._env.cache_clear()
+    provider = lcp.LangChainSerpAPIProvider()
+
+    for _ in range(2):  # fresh failure, then the negative-cache hit
+        with pytest.raises(RuntimeError) as exc:
+            await provider.search("leak check", 3)
+        rendered = "".join(traceback.format_exception(exc.value))
+        assert "HTTP 500" in rendered
+        assert "SECRET_KEY_123" not in rendered
+    await client.aclose()
+    lcp._env.cache_clear()
+
+
+def test_relevance_scores_decay_then_floor():
+    items = [{"title": str(i)} for i in range(12)]
+
+    out = lcp._BaseLCProvider._build_results(items, ("title",), (), (), 12)
+
+    assert [r.relevance_score for r in out] == [
+        max(0.1, 1.0 - i * 0.1) for i in range(12)
+    ]
+
+
+def test_is_available_reflects_key_and_dependency(monkeypatch):
+    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+    assert not lcp.LangChainTavilyProvider().is_available()
+
+    monkeypatch.setenv("TAVILY_API_KEY", "k")
+    assert not lcp.LangChainTavilyProvider().is_available()  # snapshot until cleared
+    lcp._env.cache_clear()
+    monkeypatch.setattr(lcp, "httpx", None)
+    assert not lcp.LangChainTavilyProvider().is_available()
+
+    monkeypatch.setattr(lcp, "_LC_AVAILABLE", False)
+    assert not lcp.LangChainDuckDuckGoProvider().is_available()
+
+
+@pytest.mark.asyncio
+async def test_search_best_of_returns_first_non_empty_result():
+    class Empty(CountingProvider):
+        name = "empty"
+
+    class Fast(CountingProvider):
+        name = "fast"
+
+    class Hanging(CountingProvider):
+        name = "hanging"
+
+        async def _search(self, query, max_results):
+            await asyncio.Event().wait()
+
+    out = await asyncio.wait_for(
+        lcp.search_best_of("best of", [Empty(results=[]), Hanging(), Fast()], 2), 1
+    )
+
+    assert [r.url for r in out] == ["http://r0", "http://r1"]
+    # The shielded upstream call outlives its cancelled caller (single-flight)
+    for task in list(lcp._INFLIGHT.values()):
+        task.cancel()
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared_and_closed(monkeypatch):
+    pytest.importorskip("httpx")
+    monkeypatch.setenv("WEB_SEARCH_KEEPALIVE", "7")
+    await lcp.close_http()
+
+    client = await lcp._get_http()
+    assert await lcp._get_http() is client
+
+    await lcp.close_http()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_http_client_from_previous_loop_is_closed(monkeypatch):
+    pytest.importorskip("httpx")
+    await lcp.close_http()
+    stale = await lcp._get_http()
+    monkeypatch.setattr(lcp, "_HTTP_LOOP", object())
+
+    client = await lcp._get_http()
+
+    assert client is not stale
+    assert stale.is_closed
+    await lcp.close_http()
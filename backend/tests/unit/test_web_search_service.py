@@ -3,9 +3,11 @@ Unit tests for web search service
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 
 from backend.src.services.web_search_service import (
@@ -123,12 +125,10 @@ class TestTavilyProvider:
         # Should not be available without API key
         assert not provider.is_available()
 
-    @patch("backend.src.services.web_search_service.TavilyClient")
-    def test_search_success(self, mock_tavily_client):
+    def test_search_success(self):
         """Test successful search"""
         # Mock Tavily response
-        mock_client_instance = Mock()
-        mock_client_instance.search.return_value = {
+        response = {
             "results": [
                 {
                     "title": "Test Result 1",
@@ -144,7 +144,9 @@ class TestTavilyProvider:
                 },
             ]
         }
-        mock_tavily_client.return_value = mock_client_instance
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=response))
+        )
 
         provider = TavilyProvider(api_key="test_key")
 
@@ -152,7 +154,7 @@ class TestTavilyProvider:
         with patch.object(provider, "is_available", return_value=True):
 
             async def run_test():
-                results = await provider.search("test query", max_results=2)
+                results = await provider.search("test query", max_results=2, client=client)
                 assert len(results) == 2
                 assert results[0].title == "Test Result 1"
                 assert results[0].url == "https://example.com/1"
@@ -250,7 +252,7 @@ class TestWebSearchService:
         assert len(cached) == 1
 
         # Wait for expiration (simulate)
-        service._cache["test query"] = (cached, datetime.now() - timedelta(seconds=2))
+        service._cache[service._cache_key("test query")] = (cached, time.monotonic() - 2)
 
         # Should not be in cache anymore
         cached = service._get_cached_result("test query")
@@ -366,3 +368,167 @@ class TestGetWebSearchService:
             assert service1.provider_name == "duckduckgo"
             assert service1.cache_ttl == 1800
             assert service1.rate_limit == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_provider_call():
+    gate = asyncio.Event()
+    calls = []
+
+    async def slow_search(query, max_results):
+        calls.append(query)
+        await gate.wait()
+        return [SearchResult(title="T", url="https://example.com", snippet="s")]
+
+    provider = Mock()
+    provider.is_available.return_value = True
+    provider.search = slow_search
+
+    service = WebSearchService(provider="duckduckgo", enable_cache=False)
+    service.primary_provider = provider
+
+    tasks = [asyncio.create_task(service.search("latest news")) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    outs = await asyncio.gather(*tasks)
+
+    assert len(calls) == 1
+    assert all(len(out) == 1 for out in outs)
+    assert outs[0] is not outs[1]
+    assert not service._inflight
+
+
+def test_cache_evicts_least_recently_used():
+    service = WebSearchService(enable_cache=True)
+    result = SearchResult(title="Test", url="https://example.com", snippet="Test")
+
+    for i in range(100):
+        service._cache_result(f"q{i}", [result])
+    assert service._get_cached_result("q0") is not None  # refresh q0
+    service._cache_result("q100", [result])
+
+    assert service._cache_key("q0") in service._cache
+    assert service._cache_key("q1") not in service._cache
+    assert len(service._cache) == 100
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("Latest AI NEWS", True),
+        ("Python updates", True),
+        ("What's new in 3.13", True),
+        ("best pizza recipe", False),
+        ("", False),
+    ],
+)
+def test_is_time_sensitive_query(query, expected):
+    assert WebSearchService()._is_time_sensitive_query(query) is expected
+
+
+def test_rate_limit_is_shared_across_queries_and_refills():
+    service = WebSearchService(rate_limit=2)
+
+    assert service._check_rate_limit("a")
+    assert service._check_rate_limit("b")
+    assert not service._check_rate_limit("c")
+
+    service._tokens_refilled -= 30  # half a minute refills one token
+    assert service._check_rate_limit("c")
+    assert not service._check_rate_limit("d")
+
+
+@pytest.mark.asyncio
+async def test_hedged_search_returns_fastest_provider_for_time_sensitive_query():
+    slow_started = asyncio.Event()
+
+    async def slow_search(query, max_results):
+        slow_started.set()
+        await asyncio.sleep(10)
+        return []
+
+    slow = Mock(name="slow")
+    slow.search = slow_search
+    fast = Mock()
+    fast.name = "fast"
+    fast.search = AsyncMock(
+        return_value=[SearchResult(title="Fast", url="https://f", snippet="")]
+    )
+
+    service = WebSearchService(provider="duckduckgo", hedged_search=True)
+    service.primary_provider = slow
+    service.fallback_provider = fast
+
+    results = await asyncio.wait_for(service.search("latest news"), 1)
+
+    assert [r.title for r in results] == ["Fast"]
+    assert slow_started.is_set()
+
+
+def test_search_result_to_dict_includes_only_present_enrichment():
+    plain = SearchResult(title="T", url="https://e", snippet="s").to_dict()
+    assert "content" not in plain and plain["timestamp"] is None
+
+    enriched = SearchResult(
+        title="T",
+        url="https://e",
+        snippet="s",
+        content="body",
+        published_at=datetime(2024, 1, 1),
+        tokens_estimate=0,
+    ).to_dict()
+    assert enriched["content"] == "body"
+    assert enriched["published_at"] == "2024-01-01T00:00:00"
+    assert enriched["tokens_estimate"] == 0
+    assert "canonical_url" not in enriched
+
+
+@pytest.mark.asyncio
+async def test_enrich_results_fetches_each_url_once():
+    from backend.src.services.web_fetch_service import FetchResult
+
+    fetch_service = Mock(enabled=True)
+    fetched = []
+
+    async def fetch_multiple(urls):
+        fetched.extend(urls)
+        return [
+            FetchResult(
+                url=u,
+                canonical_url=u,
+                content="body",
+                content_type="text/html",
+                title=None,
+                published_at=None,
+                extracted_at=datetime.now(),
+                tokens_estimate=1,
+            )
+            for u in urls
+        ]
+
+    fetch_service.fetch_multiple = fetch_multiple
+    results = [
+        SearchResult(title="A", url="https://a", snippet=""),
+        SearchResult(title="B", url="https://b", snippet=""),
+        SearchResult(title="A again", url="https://a", snippet=""),
+    ]
+
+    with patch(
+        "backend.src.services.web_fetch_service.get_web_fetch_service",
+        return_value=fetch_service,
+    ):
+        enriched = await WebSearchService().enrich_results(results)
+
+    assert fetched == ["https://a", "https://b"]
+    assert [r.content for r in enriched] == ["body", "body", "body"]
+    assert all(r.content is None for r in results)  # cached originals untouched
+
+
+def test_duckduckgo_availability_tracks_ddgs_import():
+    with patch("backend.src.services.web_search_service.DDGS", None):
+        assert not DuckDuckGoProvider().is_available()
+    with patch("backend.src.services.web_search_service.DDGS", Mock()):
+        provider = DuckDuckGoProvider()
+        assert provider.is_available()
+    assert provider.is_available()  # cached after the first check
+